@@ -0,0 +1,70 @@
+"""
+Compares the available XML parser backends on a large synthetic search
+response: parsing alone, parsing plus Course construction, and streaming.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_backends [--courses N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from explorecourses import CourseConnection
+from explorecourses.parsers import available_parsers
+
+from benchmarks.synthetic import search_response
+
+
+def best_of(repeat: int, func) -> float:
+    """
+    Times a function, keeping the fastest of several runs.
+
+    Args:
+        repeat (int): The number of runs.
+        func (Callable): The function to time.
+
+    Returns:
+        float: The fastest run time in seconds.
+
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = search_response(courses=args.courses)
+    chunks = [content[i:i + CourseConnection._CHUNK_SIZE]
+              for i in range(0, len(content), CourseConnection._CHUNK_SIZE)]
+
+    print(f"{args.courses} courses, {len(content) / 1e6:.1f} MB")
+    for lazy in (False, True):
+        for name in available_parsers():
+            connection = CourseConnection(parser=name, lazy=lazy)
+
+            parse = best_of(args.repeat,
+                            lambda: connection._parser.fromstring(content))
+            full = best_of(args.repeat,
+                           lambda: connection._parse_courses(content))
+            stream = best_of(args.repeat,
+                             lambda: list(connection._iter_courses(chunks)))
+
+            print(f"{name:>6} {'lazy ' if lazy else 'eager'}: "
+                  f"parse {parse * 1000:7.1f} ms   "
+                  f"parse+build {full * 1000:7.1f} ms   "
+                  f"stream {stream * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Measures the memory held by Course objects (including their sections,
+schedules, instructors, attributes, tags and learning objectives) built from
+a large synthetic search response, with and without an Interner sharing
+repeated values between them. For comparison, it also measures the same
+objects copied into dict-backed mirror classes, which is how they were laid
+out before the catalog classes declared __slots__.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory [--courses N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict, List, Tuple
+import xml.etree.ElementTree as ET
+
+from explorecourses import Course, Interner
+
+from benchmarks.synthetic import search_response
+
+
+def _slots(cls: type) -> List[str]:
+    """
+    Gets the names of the slots declared by a class and its bases.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        List[str]: The slot names.
+
+    """
+
+    return [name for klass in cls.__mro__ 
+            for name in getattr(klass, "__slots__", ()) 
+            if name not in ("__dict__", "__weakref__")]
+
+
+def unslotted(obj, mirrors: Dict[type, type] = None, 
+              copies: Dict[int, Tuple[object, object]] = None):
+    """
+    Copies a catalog object and everything it references into instances of
+    dict-backed mirror classes with the same attributes. Objects shared in
+    the original are shared in the copy, and field values such as strings
+    and ints are reused rather than copied.
+
+    Args:
+        obj: The object to copy.
+        mirrors (Dict[type, type]): The mirror class of each catalog class.
+        copies (Dict[int, Tuple[object, object]]): Each object already 
+            copied, with its copy, by id. The originals are kept so that 
+            their ids are not reused.
+
+    Returns:
+        The copy.
+
+    """
+
+    mirrors = {} if mirrors is None else mirrors
+    copies = {} if copies is None else copies
+
+    if isinstance(obj, tuple):
+        return tuple(unslotted(item, mirrors, copies) for item in obj)
+    if not hasattr(type(obj), "__slots__") or isinstance(obj, (str, int)):
+        return obj
+    if id(obj) in copies:
+        return copies[id(obj)][1]
+
+    cls = type(obj)
+    if cls not in mirrors:
+        mirrors[cls] = type(cls.__name__, (object,), {})
+
+    copy = mirrors[cls]()
+    copies[id(obj)] = obj, copy
+    for name in _slots(cls):
+        if hasattr(obj, name):
+            setattr(copy, name, unslotted(getattr(obj, name), mirrors, copies))
+
+    return copy
+
+
+def measure(build, count: int) -> float:
+    """
+    Measures the memory retained by the result of a function.
+
+    Args:
+        build (Callable): Builds and returns the objects to measure.
+        count (int): The number of units the result is divided into.
+
+    Returns:
+        float: The retained bytes per unit.
+
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    del result
+
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--sections", type=int, default=4)
+    args = parser.parse_args()
+
+    content = search_response(courses=args.courses, sections=args.sections)
+    elems = ET.fromstring(content).findall(".//course")
+
+    per_course = measure(lambda: [Course(elem) for elem in elems], len(elems))
+
+    def build_unslotted():
+        mirrors, copies = {}, {}
+        courses = [unslotted(Course(elem), mirrors, copies) for elem in elems]
+        copies.clear()
+        return courses
+
+    per_unslotted = measure(build_unslotted, len(elems))
+
+    def build_interned():
+        # The table is part of the result, so its own memory is counted.
+        interner = Interner()
+        return interner, [Course(elem, interner=interner) for elem in elems]
+
+    interned = measure(build_interned, len(elems))
+
+    print(f"{len(elems)} courses, without __slots__: "
+          f"{per_unslotted:,.0f} bytes/course")
+    print(f"{len(elems)} courses: {per_course:,.0f} bytes/course "
+          f"({1 - per_course / per_unslotted:.0%} saved)")
+    print(f"{len(elems)} courses, interned: {interned:,.0f} bytes/course "
+          f"({1 - interned / per_course:.0%} saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Measures how parsing a large synthetic search response scales with the
+number of processes in a CourseConnection's parse executor.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel [--courses N] [--processes N]
+        [--repeat N]
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from explorecourses import CourseConnection
+
+from benchmarks.bench_backends import best_of
+from benchmarks.synthetic import search_response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--courses", type=int, default=10000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    content = search_response(courses=args.courses)
+    print(f"{args.courses} courses, {len(content) / 1e6:.1f} MB")
+
+    serial = best_of(args.repeat,
+                     lambda: CourseConnection()._parse_courses(content))
+    print(f"in-process:  {serial * 1000:8.1f} ms")
+
+    processes = 1
+    while processes <= args.processes:
+        with ProcessPoolExecutor(processes) as executor:
+            connection = CourseConnection(parse_executor=executor)
+            # Start the workers before timing.
+            connection._parse_courses(content)
+
+            parallel = best_of(args.repeat,
+                               lambda: connection._parse_courses(content))
+
+        print(f"{processes:>2} processes: {parallel * 1000:8.1f} ms "
+              f"({serial / parallel:.1f}x)")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
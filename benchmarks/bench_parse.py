@@ -0,0 +1,113 @@
+"""
+Measures how quickly Course objects are constructed from a large, already
+parsed search response, both eagerly and lazily.
+
+The administrative fields of a course used to be read with descendant paths
+such as .//courseId, which search every section, schedule and instructor of
+the course. To make the before/after comparison reproducible, the benchmark
+also times reading those fields both ways on their own and reports the
+eager construction time with the old lookups swapped back in.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parse [--courses N] [--repeat N]
+"""
+
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from explorecourses import Course
+
+from benchmarks.synthetic import search_response
+
+# The administrative fields, each read as many times as it used to be.
+_ADMIN_FIELDS = ("finalExamFlag", "finalExamFlag", "courseId",
+                 "effectiveStatus", "effectiveStatus", "offerNumber",
+                 "academicGroup", "academicOrganization", "academicCareer",
+                 "maxUnitsRepeat", "maxTimesRepeat")
+
+
+def read_descendants(elem: ET.Element):
+    """
+    Reads the administrative fields of a course with descendant paths, the
+    way Course did before.
+
+    Args:
+        elem (Element): The course's XML element.
+
+    """
+
+    for field in _ADMIN_FIELDS:
+        elem.findtext(".//" + field)
+
+
+def read_children(elem: ET.Element):
+    """
+    Reads the administrative fields of a course as children of their parent
+    element, the way Course does now.
+
+    Args:
+        elem (Element): The course's XML element.
+
+    """
+
+    admin = elem.find("administrativeInformation")
+    for field in set(_ADMIN_FIELDS):
+        admin.findtext(field)
+
+
+def best_of(fn, elems, repeat: int) -> float:
+    """
+    Times a function over every course element.
+
+    Args:
+        fn (Callable[[Element], Any]): The function to time.
+        elems (List[Element]): The course elements.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The fastest run, in seconds.
+
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for elem in elems:
+            fn(elem)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def report(label: str, seconds: float, count: int):
+    print(f"{label}: {count} courses in {seconds * 1000:.1f} ms "
+          f"({count / seconds:,.0f} courses/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--sections", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = search_response(courses=args.courses, sections=args.sections)
+    elems = ET.fromstring(content).findall(".//course")
+
+    eager = best_of(Course, elems, args.repeat)
+    lazy = best_of(lambda elem: Course(elem, lazy=True), elems, args.repeat)
+    descendants = best_of(read_descendants, elems, args.repeat)
+    children = best_of(read_children, elems, args.repeat)
+    before = eager - children + descendants
+
+    report("eager", eager, len(elems))
+    report("lazy", lazy, len(elems))
+    print(f"administrative fields: {descendants * 1000:.1f} ms with "
+          f"descendant paths, {children * 1000:.1f} ms as children")
+    report("eager with descendant paths (before)", before, len(elems))
+    print(f"speedup: {before / eager:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Runs the benchmark suite on synthetic responses and records the results, so
+that performance regressions are caught before a release.
+
+Measures XML parsing, Course and School construction, the connection
+methods (served from memory, so no network is involved), and peak memory.
+Results can be saved as JSON and compared against a saved baseline, in
+which case the run fails if any benchmark got slower than the tolerance
+allows.
+
+Run from the repository root:
+
+    python -m benchmarks.run [--courses N] [--sections N] [--schedules N]
+        [--instructors N] [--repeat N] [--output FILE] [--baseline FILE]
+        [--tolerance FRACTION]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict
+
+import explorecourses
+from explorecourses import Course, CourseConnection, Interner, School
+from explorecourses.transport import MemoryTransport
+
+from benchmarks.synthetic import schools_response, search_response
+
+
+def timed(repeat: int, func: Callable) -> float:
+    """
+    Times a function, keeping the fastest of several runs.
+
+    Args:
+        repeat (int): The number of runs.
+        func (Callable): The function to time.
+
+    Returns:
+        float: The fastest run time in seconds.
+
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def peak_memory(func: Callable) -> int:
+    """
+    Measures the peak memory allocated while a function runs.
+
+    Args:
+        func (Callable): The function to measure.
+
+    Returns:
+        int: The peak number of bytes allocated.
+
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(args) -> Dict[str, float]:
+    """
+    Runs every benchmark.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        Dict[str, float]: The results, in seconds for times and bytes for
+            memory, keyed by benchmark name.
+
+    """
+
+    courses = search_response(courses=args.courses, sections=args.sections,
+                              schedules=args.schedules,
+                              instructors=args.instructors)
+    schools = schools_response()
+
+    course_elems = ET.fromstring(courses).findall(".//course")
+    school_elems = ET.fromstring(schools).findall(".//school")
+
+    transport = MemoryTransport()
+    transport.add(CourseConnection._URL, CourseConnection._school_payload(),
+                  schools)
+    transport.add(CourseConnection._URL + "search",
+                  CourseConnection._course_payload("all courses", ()),
+                  courses)
+    connection = CourseConnection(retries=0, transport=transport)
+
+    def build_interned(elems):
+        interner = Interner()
+        return [Course(e, interner=interner) for e in elems]
+
+    def get_courses():
+        return connection.get_courses_by_query("all courses")
+
+    times = {
+        "parse": lambda: ET.fromstring(courses),
+        "build_courses": lambda: [Course(e) for e in course_elems],
+        "build_courses_lazy": lambda: [Course(e, lazy=True)
+                                       for e in course_elems],
+        "build_courses_interned": lambda: build_interned(course_elems),
+        "build_schools": lambda: [School(e) for e in school_elems],
+        "get_schools": connection.get_schools,
+        "get_courses_by_query": get_courses,
+        "iter_courses_by_query": lambda: list(
+            connection.iter_courses_by_query("all courses")
+        ),
+    }
+
+    results = {name: timed(args.repeat, func) for name, func in times.items()}
+    results["peak_memory_get_courses_by_query"] = peak_memory(get_courses)
+    results["peak_memory_iter_courses_by_query"] = peak_memory(
+        lambda: sum(1 for _ in
+                    connection.iter_courses_by_query("all courses"))
+    )
+
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            tolerance: float) -> Dict[str, float]:
+    """
+    Finds the benchmarks that regressed against a baseline.
+
+    Args:
+        results (Dict[str, float]): The current results.
+        baseline (Dict[str, float]): The baseline results.
+        tolerance (float): The largest acceptable slowdown, as a fraction
+            of the baseline (e.g., 0.2 for 20%).
+
+    Returns:
+        Dict[str, float]: The relative change of each regressed benchmark.
+
+    """
+
+    return {name: value / baseline[name] - 1
+            for name, value in results.items()
+            if baseline.get(name) and value > baseline[name] * (1 + tolerance)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--sections", type=int, default=4)
+    parser.add_argument("--schedules", type=int, default=1)
+    parser.add_argument("--instructors", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--baseline", help="compare against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    parameters = {name: getattr(args, name) for name in
+                  ("courses", "sections", "schedules", "instructors",
+                   "repeat")}
+    results = run(args)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["parameters"] != parameters:
+            print("warning: the baseline was recorded with different "
+                  "parameters", file=sys.stderr)
+
+    for name, value in results.items():
+        unit = (f"{value / 1e6:10.2f} MB" if name.startswith("peak_memory")
+                else f"{value * 1000:10.2f} ms")
+        change = ""
+        if baseline and baseline["results"].get(name):
+            change = f"  {value / baseline['results'][name] - 1:+.1%}"
+        print(f"{name:<36}{unit}{change}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "version": explorecourses.__version__,
+                "python": platform.python_version(),
+                "parameters": parameters,
+                "results": results,
+            }, f, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for name, change in regressions.items():
+            print(f"regression: {name} is {change:.1%} worse than the "
+                  f"baseline", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Generates synthetic Explore Courses responses shaped like the
+"xml-20200810" view, for benchmarking without a network connection.
+"""
+
+import random
+
+_DAYS = ("Monday Wednesday Friday", "Tuesday Thursday", "Monday Wednesday",
+         "Friday")
+_TIMES = (("9:30:00 AM", "10:20:00 AM"), ("11:30:00 AM", "12:50:00 PM"),
+          ("1:30:00 PM", "2:50:00 PM"), ("4:30:00 PM", "5:50:00 PM"),
+          ("7:00:00 PM", "9:50:00 PM"))
+_TERMS = ("Autumn", "Winter", "Spring")
+_COMPONENTS = ("LEC", "SEM", "DIS", "LAB", "INS")
+_GERS = ("WAY-FR", "WAY-SMA", "WAY-AII", "WAY-SI", "Language", "Writing 2")
+
+
+def instructor_xml(rng, sunet):
+    return (
+        '<instructor>'
+        f'<name>{sunet.title()}, A.</name>'
+        '<firstName>Alex</firstName>'
+        '<middleName/>'
+        f'<lastName>{sunet.title()}</lastName>'
+        f'<sunet>{sunet}</sunet>'
+        f'<role>{rng.choice(("PI", "TA", "GP"))}</role>'
+        '</instructor>'
+    )
+
+
+def attribute_xml(value, description):
+    return (
+        '<attribute>'
+        '<name>NQTR</name>'
+        f'<value>{value}</value>'
+        f'<description>{description}</description>'
+        '<catalogPrint>true</catalogPrint>'
+        '<schedulePrint>false</schedulePrint>'
+        '</attribute>'
+    )
+
+
+def schedule_xml(rng, instructors):
+    start, end = rng.choice(_TIMES)
+    sunets = rng.sample(instructors, min(len(instructors), 2))
+
+    return (
+        '<schedule>'
+        '<startDate>Sep 25, 2017</startDate>'
+        '<endDate>Dec 8, 2017</endDate>'
+        f'<startTime>{start}</startTime>'
+        f'<endTime>{end}</endTime>'
+        f'<location>{rng.randint(100, 599)}-{rng.randint(100, 399)}</location>'
+        f'<days>{rng.choice(_DAYS)}</days>'
+        '<instructors>'
+        + "".join(instructor_xml(rng, sunet) for sunet in sunets) +
+        '</instructors>'
+        '</schedule>'
+    )
+
+
+def section_xml(rng, class_id, course_id, subject, code, schedules,
+                instructors):
+
+    max_size = rng.choice((20, 40, 60, 150, 300))
+    curr_size = rng.randint(0, max_size)
+    term = rng.choice(_TERMS)
+
+    return (
+        '<section>'
+        f'<classId>{class_id}</classId>'
+        f'<term>2017-2018 {term}</term>'
+        '<termId>1182</termId>'
+        f'<subject>{subject}</subject>'
+        f'<code>{code}</code>'
+        '<units>3-5</units>'
+        f'<sectionNumber>{rng.randint(1, 9):02d}</sectionNumber>'
+        f'<component>{rng.choice(_COMPONENTS)}</component>'
+        f'<numEnrolled>{curr_size}</numEnrolled>'
+        f'<maxEnrolled>{max_size}</maxEnrolled>'
+        '<numWaitlist>0</numWaitlist>'
+        '<maxWaitlist>0</maxWaitlist>'
+        '<enrollStatus>Open</enrollStatus>'
+        '<addConsent>N</addConsent>'
+        '<dropConsent>N</dropConsent>'
+        f'<courseId>{course_id}</courseId>'
+        '<schedules>'
+        + "".join(schedule_xml(rng, instructors) for _ in range(schedules)) +
+        '</schedules>'
+        f'<currentClassSize>{curr_size}</currentClassSize>'
+        f'<maxClassSize>{max_size}</maxClassSize>'
+        '<currentWaitlistSize>0</currentWaitlistSize>'
+        '<maxWaitlistSize>0</maxWaitlistSize>'
+        '<notes/>'
+        '<attributes>'
+        + attribute_xml(term[:3].upper(), term) +
+        '</attributes>'
+        '</section>'
+    )
+
+
+def course_xml(rng, course_id, subject, code, sections=4, schedules=1,
+               instructors=3):
+
+    sunets = [f"{subject.lower()}{rng.randint(0, 40)}"
+              for _ in range(instructors)]
+    units_min = rng.randint(1, 4)
+    gers = ", ".join(rng.sample(_GERS, 2))
+
+    return (
+        '<course>'
+        '<year>2017-2018</year>'
+        f'<subject>{subject}</subject>'
+        f'<code>{code}</code>'
+        f'<title>Topics in {subject} {code}</title>'
+        '<description>'
+        + " ".join(rng.choice(("theory", "practice", "methods", "analysis",
+                               "systems", "design", "data", "models"))
+                   for _ in range(60)) +
+        '</description>'
+        f'<gers>{gers}</gers>'
+        '<repeatable>false</repeatable>'
+        '<grading>Letter or Credit/No Credit</grading>'
+        f'<unitsMin>{units_min}</unitsMin>'
+        f'<unitsMax>{units_min + rng.randint(0, 2)}</unitsMax>'
+        '<learningObjectives>'
+        '<learningObjective>'
+        '<requirementCode>WAY-FR</requirementCode>'
+        '<description>Solve problems through formal reasoning.</description>'
+        '</learningObjective>'
+        '</learningObjectives>'
+        '<sections>'
+        + "".join(section_xml(rng, course_id * 100 + i, course_id, subject,
+                              code, schedules, sunets)
+                  for i in range(sections)) +
+        '</sections>'
+        '<administrativeInformation>'
+        f'<courseId>{course_id}</courseId>'
+        '<effectiveStatus>A</effectiveStatus>'
+        '<offerNumber>1</offerNumber>'
+        '<academicGroup>HS</academicGroup>'
+        f'<academicOrganization>{subject}</academicOrganization>'
+        '<academicCareer>UG</academicCareer>'
+        '<finalExamFlag>Y</finalExamFlag>'
+        '<catalogPrint>Y</catalogPrint>'
+        '<schedulePrint>Y</schedulePrint>'
+        '<maxUnitsRepeat>3</maxUnitsRepeat>'
+        '<maxTimesRepeat>1</maxTimesRepeat>'
+        '</administrativeInformation>'
+        '<attributes>'
+        + attribute_xml("AUT", "Autumn") + attribute_xml("WIN", "Winter") +
+        '</attributes>'
+        '<tags>'
+        f'<tag><organization>{subject}</organization><name>core</name></tag>'
+        '</tags>'
+        '</course>'
+    )
+
+
+def search_response(courses=500, sections=4, schedules=1, instructors=3,
+                    subjects=("CS", "MATH", "PHYSICS", "HISTORY"),
+                    seed=0) -> bytes:
+
+    """
+    Builds a course search response.
+
+    Args:
+        courses (int): The number of courses in the response.
+        sections (int): The number of sections per course.
+        schedules (int): The number of schedules per section.
+        instructors (int): The number of distinct instructors per course.
+        subjects (Tuple[str]): The subjects that courses are spread across.
+        seed (int): The random seed, so responses are reproducible.
+
+    Returns:
+        bytes: The encoded XML response.
+
+    """
+
+    rng = random.Random(seed)
+
+    body = "".join(
+        course_xml(rng, 100000 + i, subjects[i % len(subjects)],
+                   str(i // len(subjects) + 1), sections, schedules,
+                   instructors)
+        for i in range(courses)
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xml><deptList/><courses>' + body + '</courses></xml>'
+    ).encode()
+
+
+def schools_response(schools=7, departments=30, seed=0) -> bytes:
+    """
+    Builds a schools listing response.
+
+    Args:
+        schools (int): The number of schools in the response.
+        departments (int): The number of departments per school.
+        seed (int): The random seed, so responses are reproducible.
+
+    Returns:
+        bytes: The encoded XML response.
+
+    """
+
+    rng = random.Random(seed)
+
+    def department_xml(i, j):
+        code = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                       for _ in range(rng.randint(2, 6)))
+        return (f'<department longname="Department {i}-{j}" '
+                f'name="{code}{i}{j}"/>')
+
+    body = "".join(
+        f'<school name="School {i}">'
+        + "".join(department_xml(i, j) for j in range(departments)) +
+        '</school>'
+        for i in range(schools)
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xml><academic_year>20172018</academic_year>'
+        '<schools>' + body + '</schools></xml>'
+    ).encode()
@@ -1,11 +1,16 @@
-from explorecourses.course_connection import CourseConnection
-from explorecourses.classes import School, Department, Course, Instructor, \
-                                   Attribute, Tag, Schedule, LearningObjective, \
-                                   Section
+from explorecourses.course_connection import CourseConnection, CrawlResult, \
+                                             CallStats
+from explorecourses.async_course_connection import AsyncCourseConnection
+from explorecourses.classes import School, Directory, Department, Course, \
+                                   Instructor, Attribute, Tag, Schedule, \
+                                   LearningObjective, Section
+from explorecourses.interning import Interner
 
 __version__ = '1.0.4'
 
 __author__ = 'Jeremy Ephron <jeremye@stanford.edu>'
 
-__all__ = ["CourseConnection", "School", "Department", "Course", "Instructor",
-           "Attribute", "Tag", "Schedule", "LearningObjective", "Section"]
+__all__ = ["CourseConnection", "CrawlResult", "CallStats", 
+           "AsyncCourseConnection", "School", "Directory", "Department", 
+           "Course", "Instructor", "Attribute", "Tag", "Schedule", 
+           "LearningObjective", "Section", "Interner"]
@@ -0,0 +1,362 @@
+"""
+This module implements the AsyncCourseConnection class, an asyncio
+counterpart to CourseConnection for issuing many requests concurrently.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+import time
+from typing import Callable, List, Optional
+
+import requests
+
+from explorecourses.cache import DiskCache, request_key
+from explorecourses.classes import School, Directory, Course
+from explorecourses.course_connection import CallStats, CourseConnection
+from explorecourses.singleflight import AsyncSingleFlight
+
+class AsyncCourseConnection():
+    """
+    This class mirrors the CourseConnection API with coroutines, so that
+    requests for many departments can be in flight at once.
+
+    Network I/O and XML parsing both run in an executor, so neither blocks
+    the event loop. At most `max_concurrency` requests are in flight at any
+    given time.
+
+    Example:
+        async with AsyncCourseConnection(max_concurrency=16) as connect:
+            schools = await connect.get_schools("2017-2018")
+            results = await asyncio.gather(*(
+                connect.get_courses_by_department(dept.code, year="2017-2018")
+                for school in schools for dept in school.departments
+            ))
+
+    """
+
+    def __init__(self, max_concurrency: int = 10, executor: Executor = None,
+                 cache: DiskCache = None, lazy: bool = False,
+                 parser: str = None, single_flight: bool = False,
+                 **options):
+        """
+        Constructs a new AsyncCourseConnection.
+
+        Args:
+            max_concurrency (int): The maximum number of requests in flight
+                at once. Defaults to 10.
+            executor (Optional[Executor]): The executor used for blocking
+                network I/O and parsing. Defaults to a thread pool sized to
+                `max_concurrency`, which is shut down by `close`.
+            cache (Optional[DiskCache]): A response cache, as for
+                CourseConnection. Defaults to None.
+            lazy (bool): Whether courses defer constructing their nested
+                objects, as for CourseConnection. Defaults to False.
+            parser (Optional[str]): The XML parser backend, as for
+                CourseConnection. Defaults to None.
+            single_flight (bool): If True, identical requests awaited at
+                once share a single download and parse, as for
+                CourseConnection. Defaults to False.
+            **options: Retry and timeout options passed on to
+                CourseConnection (e.g., `retries` or `read_timeout`). The
+                connection pool is sized to `max_concurrency`.
+
+        """
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        options.setdefault("pool_maxsize", max_concurrency)
+        self._connection = CourseConnection(cache=cache, lazy=lazy,
+                                            parser=parser, **options)
+
+        self._flights = AsyncSingleFlight() if single_flight else None
+        self._directory_flights = AsyncSingleFlight()
+        self._max_concurrency = max_concurrency
+        # Created in the loop that first uses it, since on Python < 3.10 a
+        # semaphore belongs to the loop running when it is constructed.
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_concurrency)
+
+
+    async def get_schools(self, academic_year=None,
+                          timeout: float = None) -> List[School]:
+        """
+        Gets all schools within the university.
+
+        Args:
+            academic_year (Optional[str]): The academic year within which to
+                retrive schools from (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds,
+                including time spent waiting for a free request slot and
+                retries. Defaults to None.
+
+        Returns:
+            List[School]: The schools contained within the university.
+
+        """
+
+        payload = CourseConnection._school_payload(academic_year)
+
+        return await self._get(self._connection._url, payload,
+                               self._connection._parse_schools, timeout)
+
+
+    async def get_school(self, name: str, year=None,
+                         timeout: float = None) -> School:
+        """
+        Gets a school within the university by name.
+
+        Args:
+            name (str): The name of the school.
+            year (Optional[str]): The academic year within which to retrieve
+                the school (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds,
+                including time spent waiting for a free request slot and
+                retries. Defaults to None.
+
+        Returns:
+            School: The school if it exists, None otherwise.
+
+        """
+
+        return (await self.get_directory(year, timeout)).get_school(name)
+
+
+    async def get_directory(self, year=None,
+                            timeout: float = None) -> Directory:
+        """
+        Gets the schools and departments of an academic year, indexed for
+        lookup by name or code. The directory is downloaded at most once per
+        year, even when several calls for it are awaited at once.
+
+        Args:
+            year (Optional[str]): The academic year of the directory (e.g.,
+                "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds,
+                including time spent waiting for a free request slot and
+                retries. Defaults to None.
+
+        Returns:
+            Directory: The directory for the academic year.
+
+        """
+
+        directories = self._connection._directories
+        if year in directories:
+            return directories[year]
+
+        async def fetch():
+            schools = await self.get_schools(year, timeout)
+            return directories.setdefault(year, Directory(schools, year=year))
+
+        return await self._directory_flights.do(year, fetch)
+
+
+    async def get_courses_by_department(self, code: str, *filters: str,
+                                        year=None,
+                                        timeout: float = None) -> List[Course]:
+
+        """
+        Gets all courses listed under a given department.
+
+        Args:
+            code (str): The department code.
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve
+                courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds,
+                including time spent waiting for a free request slot and
+                retries. Defaults to None.
+
+        Returns:
+            List[Course]: The courses listed under the given department.
+
+        """
+
+        filters = list(filters)
+        filters.append(f"filter-departmentcode-{code}")
+
+        return await self.get_courses_by_query(code, *filters, year=year,
+                                               timeout=timeout)
+
+
+    async def get_courses_by_query(self, query: str, *filters: str,
+                                   year=None,
+                                   timeout: float = None) -> List[Course]:
+
+        """
+        Gets all courses matched by a search query.
+
+        Args:
+            query (str): The search query.
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve
+                courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds,
+                including time spent waiting for a free request slot and
+                retries. Defaults to None.
+
+        Returns:
+            List[Course]: The courses matching the search query.
+
+        """
+
+        url = self._connection._url + "search"
+        payload = CourseConnection._course_payload(query, filters, year)
+
+        return await self._get(url, payload, self._connection._parse_courses,
+                               timeout)
+
+
+    def add_hook(self, hook: Callable[[CallStats], None]):
+        """
+        Registers a function called with the CallStats of every request
+        once it completes, as for CourseConnection. Hooks run in executor
+        threads, so a slow hook does not block the event loop, but it does
+        hold up the request it reports on.
+
+        Args:
+            hook (Callable[[CallStats], None]): The function to call.
+
+        """
+
+        self._connection.add_hook(hook)
+
+
+    def remove_hook(self, hook: Callable[[CallStats], None]):
+        """
+        Unregisters a function registered with `add_hook`.
+
+        Args:
+            hook (Callable[[CallStats], None]): The function to unregister.
+
+        Raises:
+            ValueError: If the function is not registered.
+
+        """
+
+        self._connection.remove_hook(hook)
+
+
+    async def close(self):
+        """
+        Shuts down the connection's executor, if it owns one, and its
+        underlying HTTP session.
+
+        """
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        self._connection._session.close()
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+    async def _get(self, url: str, payload: dict, parse: Callable,
+                   timeout: Optional[float] = None):
+        """
+        Fetches a URL within the concurrency limit and parses the response,
+        both in the executor, sharing the work with identical calls in
+        progress if single flight is enabled.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+            parse (Callable): Converts the raw response body and its
+                measurements into a result.
+            timeout (Optional[float]): The deadline for the request in
+                seconds. Defaults to None.
+
+        Returns:
+            The parsed result.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        connection = self._connection
+        deadline = CourseConnection._deadline(timeout)
+
+        async def get():
+            stats = (connection._begin(url, payload) if connection._hooks
+                     else None)
+
+            try:
+                semaphore = await self._acquire(deadline)
+                try:
+                    content = await loop.run_in_executor(
+                        self._executor, connection._fetch, url, payload,
+                        deadline, stats
+                    )
+                finally:
+                    semaphore.release()
+
+                return await loop.run_in_executor(self._executor, parse,
+                                                  content, stats)
+            except Exception as e:
+                if stats is not None:
+                    stats.error = e
+                raise
+            finally:
+                # Hooks may block (e.g., to export metrics), so they run in 
+                # the executor rather than on the event loop.
+                if stats is not None:
+                    await loop.run_in_executor(self._executor, 
+                                               connection._finish, stats)
+
+        if self._flights is None:
+            return await get()
+
+        timeout = (None if deadline is None
+                   else max(deadline - time.monotonic(), 0))
+        try:
+            results = await self._flights.do(request_key(url, payload), get,
+                                             timeout)
+        except asyncio.TimeoutError:
+            raise requests.Timeout("deadline exceeded while waiting for an "
+                                   "identical request") from None
+
+        return list(results)
+
+
+    async def _acquire(self, deadline: Optional[float]) -> asyncio.Semaphore:
+        """
+        Waits for a free request slot.
+
+        Args:
+            deadline (Optional[float]): The time.monotonic() value by which
+                a slot must be free.
+
+        Returns:
+            asyncio.Semaphore: The semaphore to release the slot to.
+
+        Raises:
+            requests.Timeout: If the deadline passes first.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        semaphore = self._semaphore
+
+        if deadline is None:
+            await semaphore.acquire()
+            return semaphore
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(),
+                                   max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            raise requests.Timeout("deadline exceeded while waiting for a "
+                                   "free request slot") from None
+
+        return semaphore
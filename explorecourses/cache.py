@@ -0,0 +1,268 @@
+"""
+This module implements DiskCache, a persistent cache of Explore Courses
+responses that CourseConnection can consult before going over the network.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Optional, Union
+
+# How long responses for the current (or a future) academic year stay fresh.
+CURRENT_YEAR_TTL = 10 * 60
+
+
+def request_key(url: str, payload: dict) -> str:
+    """
+    Computes a key identifying a request, independent of parameter order.
+
+    Args:
+        url (str): The request URL.
+        payload (dict): The query string parameters.
+
+    Returns:
+        str: A hex digest that is equal for equivalent requests.
+
+    """
+
+    normalized = json.dumps([url, sorted(payload.items())])
+
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Writes a file so that readers see either its previous contents or all
+    of `data`, never part of it.
+
+    Args:
+        path (str): The path of the file.
+        data (bytes): The file's new contents.
+
+    """
+
+    # Write to a temporary file in the same directory, then rename it over 
+    # the destination, which replaces it in one step.
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", 
+                               suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def default_ttl(year: Optional[str]) -> Optional[float]:
+    """
+    The default time-to-live policy: responses for academic years that have
+    ended never expire, while all others expire after CURRENT_YEAR_TTL.
+
+    Args:
+        year (Optional[str]): The academic year of the request in either
+            "2017-2018" or "20172018" form, or None for the current year.
+
+    Returns:
+        Optional[float]: The time-to-live in seconds, or None if the response
+            never expires.
+
+    """
+
+    if not year:
+        return CURRENT_YEAR_TTL
+
+    # Academic years run from September through August.
+    today = datetime.date.today()
+    current_end = today.year + 1 if today.month >= 9 else today.year
+
+    return None if int(year[-4:]) < current_end else CURRENT_YEAR_TTL
+
+
+class CacheEntry(object):
+    """
+    This class represents a cached response.
+
+    Attributes:
+        content (bytes): The response body.
+        etag (str): The response's ETag header, if any.
+        last_modified (str): The response's Last-Modified header, if any.
+        fresh (bool): True if the entry can be used without revalidation,
+            False otherwise.
+
+    """
+
+    def __init__(self, content: bytes, etag: Optional[str],
+                 last_modified: Optional[str], fresh: bool):
+        """
+        Constructs a new CacheEntry.
+
+        Args:
+            content (bytes): The response body.
+            etag (Optional[str]): The response's ETag header.
+            last_modified (Optional[str]): The response's Last-Modified
+                header.
+            fresh (bool): Whether the entry is still within its TTL.
+
+        """
+
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+
+    @property
+    def validators(self) -> dict:
+        """
+        dict: The conditional request headers for revalidating the entry.
+
+        """
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class DiskCache(object):
+    """
+    This class stores responses on disk, keyed on the normalized request, so
+    they survive process restarts.
+
+    Each entry is kept as a body file alongside a small JSON metadata file
+    recording when it was stored and its validators. Stale entries are not
+    discarded; they are revalidated with the server using their ETag or
+    Last-Modified header.
+
+    Attributes:
+        directory (str): The directory holding the cached responses.
+
+    """
+
+    def __init__(self, directory: str,
+                 ttl: Union[float, Callable, None] = default_ttl):
+        """
+        Constructs a new DiskCache, creating its directory if needed.
+
+        Args:
+            directory (str): The directory in which to store responses.
+            ttl (Union[float, Callable, None]): The time-to-live in seconds
+                for every entry, None for entries that never expire, or a
+                function of the request's academic year returning either.
+                Defaults to `default_ttl`.
+
+        """
+
+        self.directory = directory
+        self._ttl = ttl if callable(ttl) else lambda year: ttl
+
+        os.makedirs(directory, exist_ok=True)
+
+
+    def get(self, url: str, payload: dict) -> Optional[CacheEntry]:
+        """
+        Looks up the cached response for a request.
+
+        Args:
+            url (str): The request URL.
+            payload (dict): The query string parameters.
+
+        Returns:
+            CacheEntry: The cached response if one exists, None otherwise. 
+                Entries whose files are missing or unreadable, or whose 
+                metadata is malformed, are treated as not cached.
+
+        """
+
+        path = self._path(request_key(url, payload))
+
+        try:
+            with open(path + ".json") as f:
+                meta = json.load(f)
+            stored_at = float(meta["stored_at"])
+            etag, last_modified = meta.get("etag"), meta.get("last_modified")
+            with open(path + ".xml", "rb") as f:
+                content = f.read()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+        ttl = self._ttl(self._year(payload))
+        fresh = ttl is None or time.time() - stored_at < ttl
+
+        return CacheEntry(content, etag, last_modified, fresh)
+
+
+    def put(self, url: str, payload: dict, content: bytes,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Stores the response to a request.
+
+        Args:
+            url (str): The request URL.
+            payload (dict): The query string parameters.
+            content (bytes): The response body.
+            etag (Optional[str]): The response's ETag header.
+            last_modified (Optional[str]): The response's Last-Modified
+                header.
+
+        """
+
+        path = self._path(request_key(url, payload))
+
+        write_atomic(path + ".xml", content)
+        self._write_meta(path, etag, last_modified)
+
+
+    def refresh(self, url: str, payload: dict):
+        """
+        Marks the cached response to a request as fresh again, after the
+        server has confirmed it is unchanged.
+
+        Args:
+            url (str): The request URL.
+            payload (dict): The query string parameters.
+
+        """
+
+        entry = self.get(url, payload)
+        if entry is not None:
+            path = self._path(request_key(url, payload))
+            self._write_meta(path, entry.etag, entry.last_modified)
+
+
+    def clear(self):
+        """
+        Removes every cached response.
+
+        """
+
+        for name in os.listdir(self.directory):
+            if name.endswith((".xml", ".json")):
+                os.remove(os.path.join(self.directory, name))
+
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+
+    def _write_meta(self, path: str, etag: Optional[str],
+                    last_modified: Optional[str]):
+
+        meta = {
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        write_atomic(path + ".json", json.dumps(meta).encode())
+
+
+    @staticmethod
+    def _year(payload: dict) -> Optional[str]:
+        return payload.get("academicYear") or payload.get("year")
@@ -4,6 +4,7 @@ for use in storing and manipulating information from Explore Courses.
 
 Includes:
     - School
+    - Directory
     - Department
     - Course
     - Section
@@ -15,9 +16,201 @@ Includes:
 
 """
 
-from typing import Tuple
+import datetime
+import functools
+from typing import Callable, Iterable, Optional, Tuple
 from xml.etree.ElementTree import Element
 
+from explorecourses.interning import Interner
+
+# The days of the week, in the order of their bits in a day mask.
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", 
+            "Saturday", "Sunday")
+
+_DAY_BITS = {day: 1 << i for i, day in enumerate(WEEKDAYS)}
+
+_MONTHS = {month: i for i, month in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", 
+     "Nov", "Dec"), 1
+)}
+
+
+@functools.lru_cache(maxsize=1024)
+def time_to_minutes(time: Optional[str]) -> Optional[int]:
+    """
+    Converts a schedule time such as "1:30:00 PM" into minutes after 
+    midnight.
+
+    Args:
+        time (Optional[str]): The time of day.
+
+    Returns:
+        Optional[int]: The minutes after midnight, or None if the time is 
+            missing or malformed.
+
+    """
+
+    try:
+        clock, meridiem = time.split()
+        hours, minutes = clock.split(":")[:2]
+        hours = int(hours) % 12 + (12 if meridiem.upper() == "PM" else 0)
+        return hours * 60 + int(minutes)
+    except (AttributeError, ValueError):
+        return None
+
+
+def days_to_mask(days: Iterable[str]) -> int:
+    """
+    Converts day names into a day mask, in which bit i is set if the day 
+    WEEKDAYS[i] is included.
+
+    Args:
+        days (Iterable[str]): The names of the days (e.g., "Monday"). 
+            Unknown names are ignored.
+
+    Returns:
+        int: The day mask.
+
+    """
+
+    mask = 0
+    for day in days:
+        mask |= _DAY_BITS.get(day, 0)
+
+    return mask
+
+
+@functools.lru_cache(maxsize=1024)
+def date_to_ordinal(date: Optional[str]) -> Optional[int]:
+    """
+    Converts a schedule date such as "Sep 25, 2017" into its proleptic 
+    Gregorian ordinal, as returned by datetime.date.toordinal.
+
+    Args:
+        date (Optional[str]): The date.
+
+    Returns:
+        Optional[int]: The date's ordinal, or None if the date is missing or 
+            malformed.
+
+    """
+
+    try:
+        month, day, year = date.replace(",", " ").split()
+        return datetime.date(int(year), _MONTHS[month[:3]], 
+                             int(day)).toordinal()
+    except (AttributeError, KeyError, ValueError):
+        return None
+
+
+def _same(value):
+    """
+    Returns a value unchanged, standing in for an Interner when none is 
+    given.
+
+    """
+
+    return value
+
+
+def _shared(cls: type, elem: Element, interner: Interner = None):
+    """
+    Constructs a flyweight from an XML element, or gets the equal object 
+    already shared through the interner, if there is one.
+
+    """
+
+    if interner is None:
+        return cls(elem)
+
+    values = cls._values(elem, interner.intern)
+    return interner.share((cls, values), lambda: _restore(cls, values))
+
+
+class _Flyweight(object):
+    """
+    This class is the base of immutable value objects that are shared 
+    between the courses, sections and schedules of a catalog, so that 
+    equal ones parsed through the same Interner are the same object.
+
+    Attributes cannot be assigned after construction, and objects are 
+    equal when all of their attributes are.
+
+    """
+
+    __slots__ = ()
+
+    def _init(self, values: tuple):
+        """
+        Assigns the object's attributes, in the order of its slots.
+
+        Args:
+            values (tuple): The value of each attribute.
+
+        """
+
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable")
+
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable")
+
+
+    def __reduce__(self):
+        """
+        Returns the information needed to pickle or copy the object, which 
+        is restored without assigning its attributes one by one.
+
+        """
+
+        return _restore, (type(self), self._key())
+
+
+    def _key(self) -> tuple:
+        """
+        Returns the values of the object's attributes, which determine its 
+        equality and hash.
+
+        """
+
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+    def __eq__(self, other):
+        """
+        Overloads the equality (==) operator. Objects are only equal to 
+        objects of the same type with equal attributes.
+
+        """
+
+        if type(other) != type(self): return NotImplemented
+        return self._key() == other._key()
+
+
+    def __hash__(self):
+        """
+        Returns a hash of the object's attributes, consistent with equality.
+
+        """
+
+        return hash(self._key())
+
+
+def _restore(cls: type, values: tuple) -> _Flyweight:
+    """
+    Recreates a flyweight from the values of its attributes.
+
+    """
+
+    obj = cls.__new__(cls)
+    obj._init(values)
+    return obj
+
 
 class Department(object):
     """
@@ -30,6 +223,8 @@ class Department(object):
 
     """
 
+    __slots__ = ("name", "code")
+
     def __init__(self, elem: Element):
         """
         Constructs a new Department from an XML element.
@@ -64,6 +259,8 @@ class School(object):
 
     """
 
+    __slots__ = ("name", "departments", "_index")
+
     def __init__(self, elem: Element):
         """
         Constructs a new School from an XML element.
@@ -78,6 +275,14 @@ class School(object):
         depts = elem.findall("department")
         self.departments = tuple(Department(dept) for dept in depts)
 
+        # Index departments by lowercased name and code; names take priority 
+        # over codes, and earlier departments over later ones.
+        self._index = {}
+        for dept in reversed(self.departments):
+            self._index[dept.code.lower()] = dept
+        for dept in reversed(self.departments):
+            self._index[dept.name.lower()] = dept
+
 
     def get_department(self, idf: str) -> Department:
         """
@@ -92,31 +297,134 @@ class School(object):
 
         """
 
-        idf = idf.lower()
+        return self._index.get(idf.lower())
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the School that is the School's name.
+
+        """
+
+        return self.name
+
+
+class Directory(object):
+    """
+    This class represents the schools and departments of an academic year, 
+    indexed for constant-time lookup.
+
+    Attributes:
+        year (str): The academic year of the directory (e.g., "2017-2018"), 
+            or None for the current year.
+        schools (Tuple[School]): The schools within the university.
+        departments (Tuple[Department]): The departments of every school.
+
+    """
+
+    __slots__ = ("year", "schools", "departments", "_schools", "_departments", 
+                 "_parents")
+
+    def __init__(self, schools: Iterable[School], year=None):
+        """
+        Constructs a new Directory from a collection of schools.
+
+        Args:
+            schools (Iterable[School]): The schools within the university.
+            year (Optional[str]): The academic year of the schools. Defaults 
+                to None.
+
+        """
+
+        self.year = year
+        self.schools = tuple(schools)
+
+        self._schools = {}
+        self._departments = {}
+        self._parents = {}
+
+        for school in reversed(self.schools):
+            self._schools[school.name] = school
+            for dept in school.departments:
+                self._parents[dept.code] = school
+
+            self._departments.update(school._index)
+
+        self.departments = tuple(dept for school in self.schools 
+                                 for dept in school.departments)
+
+
+    def get_school(self, name: str) -> School:
+        """
+        Gets a school by name.
+
+        Args:
+            name (str): The name of the school.
+
+        Returns:
+            School: The school if it exists, None otherwise.
+
+        """
+
+        return self._schools.get(name)
+
+
+    def get_department(self, idf: str) -> Department:
+        """
+        Gets a department of any school identified by name or code.
+
+        Args:
+            idf (str): An identifier of the department; either the name or code.
+
+        Returns:
+            Department: The department matched by the given identifier if a 
+                match was found, None otherwise.
+
+        """
+
+        return self._departments.get(idf.lower())
+
+
+    def get_school_of(self, idf: str) -> School:
+        """
+        Gets the school that a department belongs to.
+
+        Args:
+            idf (str): An identifier of the department; either the name or code.
 
-        find_code = lambda dept, code: dept.code.lower() == code
-        find_name = lambda dept, name: dept.name.lower() == name
-        find_dept = lambda dept, idf: find_name(dept, idf) or find_code(dept, 
-                                                                        idf)
+        Returns:
+            School: The department's school if the department exists, None 
+                otherwise.
+
+        """
 
-        idx = [idx for idx, dept in enumerate(self.departments)
-               if find_dept(dept, idf)]
+        dept = self.get_department(idf)
 
-        return self.departments[idx[0]] if idx else None
+        return self._parents.get(dept.code) if dept is not None else None
 
 
     def __str__(self):
         """
-        Returns a string representation of the School that is the School's name.
+        Returns a string representation of the Directory that includes its 
+        academic year and size.
 
         """
 
-        return self.name
+        return (f"Directory ({self.year or 'current year'}: "
+                f"{len(self.schools)} schools, "
+                f"{len(self.departments)} departments)")
 
 
-class Instructor(object):
+class Instructor(_Flyweight):
     """
-    This class represents an instructor for a section.
+    This class represents an instructor for a section. Instructors are 
+    immutable, and equal instructors parsed through the same Interner are 
+    one shared object.
+
+    The instructor's role is one of its attributes, so a person who is the 
+    primary instructor of one section and a secondary instructor of another 
+    is two unequal Instructors, one shared object per role. To find every 
+    section a person teaches in any role, compare `sunet_id`.
 
     Attributes:
         name (str): The instructor's name in "LastName, FirstInitial." form.
@@ -129,21 +437,39 @@ class Instructor(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("name", "first_name", "middle_name", "last_name", "sunet_id", 
+                 "is_primary_instructor")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new Instructor from an XML element.
 
         Args:
             elem (Element): The instructor's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
 
         """
 
-        self.name = elem.findtext("name")
-        self.first_name = elem.findtext("firstName")
-        self.middle_name = elem.findtext("middleName")
-        self.last_name = elem.findtext("lastName")
-        self.sunet_id = elem.findtext("sunet")
-        self.is_primary_instructor = elem.findtext("role") == "PI"
+        self._init(self._values(elem, _same if interner is None 
+                                else interner.intern))
+
+
+    @staticmethod
+    def _values(elem: Element, intern: Callable) -> tuple:
+        """
+        Reads the values of an instructor's attributes from its element.
+
+        """
+
+        return (
+            intern(elem.findtext("name")),
+            intern(elem.findtext("firstName")),
+            intern(elem.findtext("middleName")),
+            intern(elem.findtext("lastName")),
+            intern(elem.findtext("sunet")),
+            elem.findtext("role") == "PI",
+        )
 
 
     def __str__(self):
@@ -156,9 +482,11 @@ class Instructor(object):
         return f"{self.first_name} {self.last_name} ({self.sunet_id})"
 
 
-class Attribute(object):
+class Attribute(_Flyweight):
     """
-    This class represents an attribute of a course.
+    This class represents an attribute of a course or section. Attributes 
+    are immutable, and equal attributes parsed through the same Interner are 
+    one shared object.
 
     Attributes:
         name (str): The name of the attribute.
@@ -171,20 +499,38 @@ class Attribute(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("name", "value", "description", "catalog_print", 
+                 "schedule_print")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new Attribute from an XML element.
 
         Args:
             elem (Element): The attribute's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
 
         """
 
-        self.name = elem.findtext("name")
-        self.value = elem.findtext("value")
-        self.description = elem.findtext("description")
-        self.catalog_print = elem.findtext("catalogPrint") == "true"
-        self.schedule_print = elem.findtext("schedulePrint") == "true"
+        self._init(self._values(elem, _same if interner is None 
+                                else interner.intern))
+
+
+    @staticmethod
+    def _values(elem: Element, intern: Callable) -> tuple:
+        """
+        Reads the values of an attribute's attributes from its element.
+
+        """
+
+        return (
+            intern(elem.findtext("name")),
+            intern(elem.findtext("value")),
+            intern(elem.findtext("description")),
+            elem.findtext("catalogPrint") == "true",
+            elem.findtext("schedulePrint") == "true",
+        )
 
 
     def __str__(self):
@@ -201,6 +547,10 @@ class Schedule(object):
     """
     This class represents the schedule of a section, including instructors.
 
+    Times, days and dates are also parsed into numbers once, when the 
+    schedule is constructed, so that comparing schedules is integer 
+    arithmetic.
+
     Attributes:
         start_date (str): The start date of the section's schedule.
         end_date (str): The end date of the section's schedule.
@@ -209,26 +559,93 @@ class Schedule(object):
         location (str): The location of each section.
         days (Tuple[str]): The days of the week that the section meets.
         instructors (Tuple[Instructor]): The section's instructors.
+        start_minutes (Optional[int]): The start time in minutes after 
+            midnight, or None if it is missing.
+        end_minutes (Optional[int]): The end time in minutes after midnight, 
+            or None if it is missing.
+        day_mask (int): The days of the week that the section meets, with 
+            bit i set for WEEKDAYS[i].
+        start_ordinal (Optional[int]): The start date as a proleptic 
+            Gregorian ordinal, or None if it is missing.
+        end_ordinal (Optional[int]): The end date as a proleptic Gregorian 
+            ordinal, or None if it is missing.
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("start_date", "end_date", "start_time", "end_time", "location", 
+                 "days", "instructors", "start_minutes", "end_minutes", 
+                 "day_mask", "start_ordinal", "end_ordinal")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new Schedule from an XML element.
 
         Args:
             elem (Element): The schedule's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
 
         """
 
-        self.start_date = elem.findtext("startDate")
-        self.end_date = elem.findtext("endDate")
-        self.start_time = elem.findtext("startTime")
-        self.end_time = elem.findtext("endTime")
-        self.location = elem.findtext("location")
-        self.days = tuple(elem.findtext("days").split())
-        self.instructors = tuple(Instructor(instr) for instr 
-                                 in elem.find("instructors"))
+        intern = _same if interner is None else interner.intern
+
+        self.start_date = intern(elem.findtext("startDate"))
+        self.end_date = intern(elem.findtext("endDate"))
+        self.start_time = intern(elem.findtext("startTime"))
+        self.end_time = intern(elem.findtext("endTime"))
+        self.location = intern(elem.findtext("location"))
+        self.days = intern(tuple(intern(day) for day 
+                                 in elem.findtext("days").split()))
+        self.instructors = tuple(_shared(Instructor, instr, interner) 
+                                 for instr in elem.find("instructors"))
+
+        self._parse_numbers()
+
+
+    def overlaps(self, other: "Schedule") -> bool:
+        """
+        Tests whether two schedules meet at the same time on a common day 
+        of the week during a common range of dates.
+
+        Schedules missing a time never overlap; schedules missing a date 
+        are assumed to span every date.
+
+        Args:
+            other (Schedule): The other schedule.
+
+        Returns:
+            bool: True if the schedules overlap, False otherwise.
+
+        """
+
+        if not self.day_mask & other.day_mask:
+            return False
+
+        if (self.start_minutes is None or self.end_minutes is None or 
+                other.start_minutes is None or other.end_minutes is None):
+            return False
+        if not (self.start_minutes < other.end_minutes and 
+                other.start_minutes < self.end_minutes):
+            return False
+
+        return ((self.start_ordinal is None or other.end_ordinal is None or 
+                 self.start_ordinal <= other.end_ordinal) and 
+                (other.start_ordinal is None or self.end_ordinal is None or 
+                 other.start_ordinal <= self.end_ordinal))
+
+
+    def _parse_numbers(self):
+        """
+        Computes the schedule's numeric fields from its times, days and 
+        dates.
+
+        """
+
+        self.start_minutes = time_to_minutes(self.start_time)
+        self.end_minutes = time_to_minutes(self.end_time)
+        self.day_mask = days_to_mask(self.days)
+        self.start_ordinal = date_to_ordinal(self.start_date)
+        self.end_ordinal = date_to_ordinal(self.end_date)
 
 
     def __str__(self):
@@ -267,31 +684,39 @@ class Section(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("class_id", "term", "units", "section_num", "component", 
+                 "curr_class_size", "max_class_size", "curr_waitlist_size", 
+                 "max_waitlist_size", "notes", "schedules", "attributes")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new Section from an XML element.
 
         Args:
             elem (Element): The section's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
 
         """
 
+        intern = _same if interner is None else interner.intern
+
         self.class_id = int(elem.findtext("classId"))
-        self.term = elem.findtext("term")
-        self.units = elem.findtext("units")
-        self.section_num = elem.findtext("sectionNumber")
-        self.component = elem.findtext("component")
+        self.term = intern(elem.findtext("term"))
+        self.units = intern(elem.findtext("units"))
+        self.section_num = intern(elem.findtext("sectionNumber"))
+        self.component = intern(elem.findtext("component"))
         self.max_class_size = int(elem.findtext("maxClassSize"))
         self.curr_class_size = int(elem.findtext("currentClassSize"))
         self.curr_waitlist_size = int(elem.findtext("currentWaitlistSize"))
         self.max_waitlist_size = int(elem.findtext("maxWaitlistSize"))
         self.notes = elem.findtext("notes")
 
-        self.schedules = tuple(Schedule(sched) for sched 
+        self.schedules = tuple(Schedule(sched, interner) for sched 
                                in elem.find("schedules"))
 
-        self.attributes = tuple(Attribute(attr) for attr 
-                                in elem.find("attributes"))
+        self.attributes = tuple(_shared(Attribute, attr, interner) 
+                                for attr in elem.find("attributes"))
 
 
     def __str__(self):
@@ -304,9 +729,10 @@ class Section(object):
         return f"{self.component} {self.section_num} (id: {self.class_id})"
 
 
-class Tag(object):
+class Tag(_Flyweight):
     """
-    This class represents a tag for a course.
+    This class represents a tag for a course. Tags are immutable, and equal 
+    tags parsed through the same Interner are one shared object.
 
     Attributes:
         organization (str): The organization within the school responsible for 
@@ -315,17 +741,34 @@ class Tag(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("organization", "name")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new Tag from an XML element.
 
         Args:
             elem (Element): The tag's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
+
+        """
+
+        self._init(self._values(elem, _same if interner is None 
+                                else interner.intern))
 
+
+    @staticmethod
+    def _values(elem: Element, intern: Callable) -> tuple:
         """
+        Reads the values of a tag's attributes from its element.
 
-        self.organization = elem.findtext("organization")
-        self.name = elem.findtext("name")
+        """
+
+        return (
+            intern(elem.findtext("organization")),
+            intern(elem.findtext("name")),
+        )
 
 
     def __str__(self):
@@ -348,17 +791,23 @@ class LearningObjective(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("code", "description")
+
+    def __init__(self, elem: Element, interner: Interner = None):
         """
         Constructs a new LearningObjective from an XML element.
 
         Args:
             elem (Element): The learning objective's XML element.
+            interner (Optional[Interner]): The table repeated values are 
+                shared through. Defaults to None.
 
         """
 
-        self.code = elem.findtext(".//requirementCode")
-        self.description = elem.findtext(".//description")
+        intern = _same if interner is None else interner.intern
+
+        self.code = intern(elem.findtext("requirementCode"))
+        self.description = elem.findtext("description")
 
 
     def __str__(self):
@@ -375,6 +824,13 @@ class Course(object):
     """
     This class represents a course listed at the university.
 
+    A lazy course keeps its own <course> element, with all of its sections, 
+    schedules, instructors and other nested elements, until every nested 
+    collection has been constructed, and then releases it. It does not keep 
+    the rest of the response alive: ElementTree elements do not reference 
+    their parent, and connections parsing with lxml, whose elements do keep 
+    their document alive, give each lazy course a copy of its element.
+
     Attributes:
         year (str): The Academic year that the course is offered.
         subject (str): The academic subject of the course (e.g., 'MATH').
@@ -412,55 +868,238 @@ class Course(object):
 
     """
 
-    def __init__(self, elem: Element):
+    __slots__ = ("year", "subject", "code", "title", "description", "gers", 
+                 "repeatable", "grading_basis", "units_min", "units_max", 
+                 "_objectives", "final_exam", "_sections", "_tags", 
+                 "_attributes", "course_id", "active", "offer_num", 
+                 "academic_group", "academic_org", "academic_career", 
+                 "max_units_repeat", "max_times_repeat", "_elem", "_interner")
+
+    def __init__(self, elem: Element, lazy: bool = False, 
+                 interner: Interner = None):
         """
         Constructs a new Course from an XML element.
 
         Args:
             elem (Element): The course's XML element.
+            lazy (bool): If True, the course's objectives, sections, tags, and 
+                attributes are only constructed the first time each is 
+                accessed, and the course keeps a reference to `elem`, and 
+                everything `elem` keeps alive, until then. Defaults to False.
+            interner (Optional[Interner]): The table repeated values, such 
+                as terms, locations and attribute descriptions, are shared 
+                through, including by nested objects constructed later. 
+                Defaults to None.
+
+        Raises:
+            ValueError: If `elem` has no administrativeInformation element.
 
         """
 
-        self.year = elem.findtext("year")
-        self.subject = elem.findtext("subject")
+        intern = _same if interner is None else interner.intern
+
+        self.year = intern(elem.findtext("year"))
+        self.subject = intern(elem.findtext("subject"))
         self.code = elem.findtext("code")
         self.title = elem.findtext("title")
         self.description = elem.findtext("description")
-        self.gers = tuple(elem.findtext("gers").split(", "))
+        self.gers = intern(tuple(intern(ger) for ger 
+                                 in elem.findtext("gers").split(", ")))
         self.repeatable = (True if elem.findtext("repeatable") == "true" 
                            else False)
 
-        self.grading_basis = elem.findtext("grading")
+        self.grading_basis = intern(elem.findtext("grading"))
         self.units_min = int(elem.findtext("unitsMin"))
         self.units_max = int(elem.findtext("unitsMax"))
-        self.objectives = tuple(LearningObjective(obj) for obj 
-                                in elem.find("learningObjectives"))
-
+        # Administrative fields are nested one level down. Reading them as 
+        # children of their parent avoids searching every section, schedule 
+        # and instructor of the course, which a descendant path would do.
+        admin = elem.find("administrativeInformation")
+        if admin is None:
+            raise ValueError(f"course {elem.findtext('subject')} "
+                             f"{elem.findtext('code')} has no "
+                             f"administrativeInformation element")
+
+        final_exam = admin.findtext("finalExamFlag")
         self.final_exam = (
-            True if elem.findtext(".//finalExamFlag") == "Y" 
-            else False if elem.findtext(".//finalExamFlag") == "N" 
+            True if final_exam == "Y" 
+            else False if final_exam == "N" 
             else None
         )
 
-        self.sections = tuple(Section(section) for section 
-                              in elem.find("sections"))
+        self.course_id = int(admin.findtext("courseId"))
 
-        self.tags = tuple(Tag(tag) for tag in elem.find("tags"))
-        self.attributes = tuple(Attribute(attr) for attr 
-                                in elem.find("attributes"))
+        status = admin.findtext("effectiveStatus")
+        self.active = (True if status == "A" 
+                       else False if status == "I" 
+                       else None)
 
-        self.course_id = int(elem.findtext(".//courseId"))
+        self.offer_num = intern(admin.findtext("offerNumber"))
+        self.academic_group = intern(admin.findtext("academicGroup"))
+        self.academic_org = intern(admin.findtext("academicOrganization"))
+        self.academic_career = intern(admin.findtext("academicCareer"))
+        self.max_units_repeat = int(admin.findtext("maxUnitsRepeat"))
+        self.max_times_repeat = int(admin.findtext("maxTimesRepeat"))
 
-        self.active = (True if elem.findtext(".//effectiveStatus") == "A" 
-                       else False if elem.findtext(".//effectiveStatus") == "I" 
-                       else None)
+        self._elem = elem
+        self._interner = interner
+        self._objectives = None
+        self._sections = None
+        self._tags = None
+        self._attributes = None
+
+        if not lazy:
+            self._materialize()
+
+
+    @property
+    def objectives(self) -> Tuple[LearningObjective]:
+        """
+        Tuple[LearningObjective]: The learning objectives of the course.
+
+        """
+
+        objectives = self._objectives
+        if objectives is None:
+            objectives = self._build("_objectives", "learningObjectives", 
+                                     LearningObjective)
+        return objectives
+
+
+    @objectives.setter
+    def objectives(self, value: Tuple[LearningObjective]):
+        self._objectives = value
+
+
+    @property
+    def sections(self) -> Tuple[Section]:
+        """
+        Tuple[Section]: The sections associated with the course.
+
+        """
+
+        sections = self._sections
+        if sections is None:
+            sections = self._build("_sections", "sections", Section)
+        return sections
+
+
+    @sections.setter
+    def sections(self, value: Tuple[Section]):
+        self._sections = value
+
+
+    @property
+    def tags(self) -> Tuple[Tag]:
+        """
+        Tuple[Tag]: The tags associated with the course.
+
+        """
+
+        tags = self._tags
+        if tags is None:
+            tags = self._build("_tags", "tags", Tag)
+        return tags
+
+
+    @tags.setter
+    def tags(self, value: Tuple[Tag]):
+        self._tags = value
+
+
+    @property
+    def attributes(self) -> Tuple[Attribute]:
+        """
+        Tuple[Attribute]: The attributes associated with the course.
+
+        """
+
+        attributes = self._attributes
+        if attributes is None:
+            attributes = self._build("_attributes", "attributes", Attribute)
+        return attributes
+
+
+    @attributes.setter
+    def attributes(self, value: Tuple[Attribute]):
+        self._attributes = value
+
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        bool: True if all of the course's nested objects have been 
+            constructed, False otherwise.
+
+        """
+
+        return self._elem is None
+
+
+    def _build(self, name: str, tag: str, cls: type) -> tuple:
+        """
+        Constructs and stores the objects for one of the course's nested 
+        collections, releasing the course's element and interner once 
+        every collection has been constructed.
+
+        Several threads may materialize the same course at once: each 
+        reads the element once, and the element is only released after 
+        every collection is stored, so a thread that finds it released 
+        returns the collection another thread stored. At worst, two 
+        threads each construct an equal copy of a collection.
+
+        Args:
+            name (str): The name of the slot the collection is stored in.
+            tag (str): The tag of the collection's XML element.
+            cls (type): The class of the collection's items.
+
+        Returns:
+            tuple: The constructed collection.
+
+        """
+
+        elem, interner = self._elem, self._interner
+        if elem is None:
+            return getattr(self, name)
+
+        if issubclass(cls, _Flyweight):
+            items = tuple(_shared(cls, child, interner) 
+                          for child in elem.find(tag))
+        else:
+            items = tuple(cls(child, interner) for child in elem.find(tag))
+
+        setattr(self, name, items)
+
+        if all(value is not None for value in (self._objectives, 
+                                               self._sections, self._tags, 
+                                               self._attributes)):
+            self._elem = None
+            self._interner = None
+
+        return items
+
+
+    def _materialize(self):
+        """
+        Constructs any of the course's nested collections that have not been 
+        constructed yet.
+
+        """
+
+        for name in ("objectives", "sections", "tags", "attributes"):
+            getattr(self, name)
+
+
+    def __getstate__(self):
+        """
+        Returns the state of the Course for pickling. Lazy courses are 
+        materialized first, so their XML element is never pickled.
+
+        """
+
+        self._materialize()
 
-        self.offer_num = elem.findtext(".//offerNumber")
-        self.academic_group = elem.findtext(".//academicGroup")
-        self.academic_org = elem.findtext(".//academicOrganization")
-        self.academic_career = elem.findtext(".//academicCareer")
-        self.max_units_repeat = int(elem.findtext(".//maxUnitsRepeat"))
-        self.max_times_repeat = int(elem.findtext(".//maxTimesRepeat"))
+        return None, {name: getattr(self, name) for name in self.__slots__}
 
 
     def __str__(self):
@@ -3,11 +3,207 @@ This module implements the CourseConnection class, which is the main entrypoint
 for the Explore Courses API.
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor, TimeoutError, \
+                               as_completed
+import functools
+import random
+import re
 import requests
-from typing import List, Tuple
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from explorecourses.cache import DiskCache, request_key
+from explorecourses.classes import School, Department, Directory, Course
+from explorecourses.interning import Interner
+from explorecourses.parsers import ElementTreeParser, get_parser
+from explorecourses.rate_limit import RateLimiter, parse_retry_after
+from explorecourses.singleflight import SingleFlight
+
+# Matches the XML declaration, and the start, end, or empty tag of a course.
+_DECLARATION = re.compile(rb"\s*<\?xml[^>]*\?>")
+_COURSE_TAG = re.compile(rb"<(/?)course\b[^>]*?(/?)>")
+
+
+def _split_courses(content: bytes, size: int) -> List[bytes]:
+    """
+    Splits a course search response into standalone XML documents, each 
+    holding consecutive top-level course elements totalling at least `size` 
+    bytes, except perhaps the last.
+
+    Args:
+        content (bytes): The raw response body.
+        size (int): The least size of each document, in bytes.
+
+    Returns:
+        List[bytes]: The documents, in order.
+
+    """
+
+    match = _DECLARATION.match(content)
+    head = (match.group() if match else b"") + b"<courses>"
+
+    chunks = []
+    depth = 0
+    course_start = chunk_start = end = None
+
+    for match in _COURSE_TAG.finditer(content):
+        closing, empty = match.groups()
+        if not closing and depth == 0:
+            course_start = match.start()
+        if not empty:
+            depth += -1 if closing else 1
+        if depth:
+            continue
+
+        end = match.end()
+        if chunk_start is None:
+            chunk_start = course_start
+        if end - chunk_start >= size:
+            chunks.append(head + content[chunk_start:end] + b"</courses>")
+            chunk_start = None
+
+    if chunk_start is not None:
+        chunks.append(head + content[chunk_start:end] + b"</courses>")
+
+    return chunks
+
+
+def _build_courses(chunk: bytes, parser: str) -> List[Course]:
+    """
+    Parses the courses out of a document produced by _split_courses. Runs in 
+    a worker process, so the courses are returned fully built: pickling them 
+    is far more compact than pickling their elements, and values repeated 
+    within the chunk are pickled once.
+
+    Args:
+        chunk (bytes): The document.
+        parser (str): The name of the XML parser backend.
+
+    Returns:
+        List[Course]: The courses in the document.
+
+    """
+
+    interner = Interner()
+    root = get_parser(parser).fromstring(chunk)
+
+    return [Course(elem, interner=interner) 
+            for elem in root.findall(".//course")]
+
+class CrawlResult(object):
+    """
+    This class represents the merged result of crawling every department.
+
+    Attributes:
+        courses (List[Course]): The unique courses found, sorted by subject, 
+            code, and year.
+        failures (Dict[str, Exception]): The error raised for each department 
+            code whose courses could not be retrieved.
+
+    """
+
+    def __init__(self, courses: List[Course], 
+                 failures: Dict[str, Exception]):
+        """
+        Constructs a new CrawlResult.
+
+        Args:
+            courses (List[Course]): The unique courses found.
+            failures (Dict[str, Exception]): The errors keyed by department 
+                code.
+
+        """
+
+        self.courses = sorted(courses)
+        self.failures = failures
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the CrawlResult that includes the 
+        number of courses and failed departments.
+
+        """
+
+        return (f"{len(self.courses)} courses "
+                f"({len(self.failures)} departments failed)")
+
+
+class CallStats(object):
+    """
+    This class records where the time of one request to Explore Courses was 
+    spent. Times are in seconds.
+
+    Attributes:
+        url (str): The URL requested.
+        payload (dict): The query string parameters.
+        cached (bool): True if the response was served from the cache, 
+            either because it was fresh or because the server confirmed it 
+            was unchanged, False otherwise.
+        status (Optional[int]): The HTTP status of the last response, or None 
+            if no response was received.
+        attempts (int): The number of requests sent, including retries.
+        wait (float): Time spent waiting for the rate limiter and between 
+            retries.
+        ttfb (float): Time from sending the last request until its response 
+            headers arrived, including DNS resolution and connecting when no 
+            pooled connection was available.
+        download (float): Time spent waiting for the response body.
+        bytes (int): The size of the response body.
+        parse (float): Time spent parsing XML, or waiting for a parse 
+            executor to parse and build courses.
+        build (float): Time spent constructing schools or courses.
+        count (int): The number of schools or courses returned.
+        total (float): The duration of the whole call.
+        error (Optional[Exception]): The error the call raised, if any.
+
+    """
+
+    __slots__ = ("url", "payload", "cached", "status", "attempts", "wait", 
+                 "ttfb", "download", "bytes", "parse", "build", "count", 
+                 "total", "error")
+
+    def __init__(self, url: str, payload: dict):
+        """
+        Constructs a new CallStats with every measurement at zero.
+
+        Args:
+            url (str): The URL requested.
+            payload (dict): The query string parameters.
+
+        """
+
+        self.url = url
+        self.payload = payload
+        self.cached = False
+        self.status = None
+        self.attempts = 0
+        self.wait = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.bytes = 0
+        self.parse = 0.0
+        self.build = 0.0
+        self.count = 0
+        self.total = 0.0
+        self.error = None
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the CallStats that includes the 
+        time spent in each phase.
+
+        """
+
+        return (f"{self.count} results, {self.bytes} bytes in "
+                f"{self.total * 1000:.1f} ms (wait {self.wait * 1000:.1f}, "
+                f"ttfb {self.ttfb * 1000:.1f}, "
+                f"download {self.download * 1000:.1f}, "
+                f"parse {self.parse * 1000:.1f}, "
+                f"build {self.build * 1000:.1f})")
 
-from explorecourses.classes import School, Course
 
 class CourseConnection():
     """
@@ -17,63 +213,223 @@ class CourseConnection():
     """
 
     _URL = "https://explorecourses.stanford.edu/"
+    _CHUNK_SIZE = 64 * 1024
+
+    # Course responses are split into documents of about this size for 
+    # parsing in a process pool. Smaller responses are parsed in-process, as 
+    # sending the courses back would cost more than building them.
+    _PARSE_CHUNK_SIZE = 512 * 1024
+
+    # Responses to these statuses are retried, as they are usually transient.
+    _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Responses to these statuses mean the server is throttling requests.
+    _THROTTLE_STATUSES = frozenset({429, 503})
 
-    def __init__(self):
+    def __init__(self, cache: DiskCache = None, lazy: bool = False, 
+                 parser: str = None, pool_connections: int = 10, 
+                 pool_maxsize: int = 10, retries: int = 3, 
+                 backoff: float = 0.5, max_backoff: float = 30, 
+                 connect_timeout: float = 5, read_timeout: float = 30, 
+                 rate_limiter: RateLimiter = None, 
+                 single_flight: bool = False, transport=None, 
+                 base_url: str = None, interner: Interner = None, 
+                 parse_executor: Executor = None):
         """
         Constructs a new CourseConnection by beginning a requests session.
 
+        Connections are kept alive and reused from a pool. Requests that fail 
+        to connect, time out before a response arrives, or receive a 429 or 
+        5xx status are retried after an exponentially growing, randomly 
+        jittered delay, or after the delay requested by the server's 
+        Retry-After header if that is longer.
+
+        Args:
+            cache (Optional[DiskCache]): A cache consulted before every 
+                request and updated with every response. Defaults to None, 
+                in which case every call goes over the network.
+            lazy (bool): If True, courses returned by the connection defer 
+                constructing their objectives, sections, tags, and attributes 
+                until first accessed. This makes queries that only read 
+                top-level course fields much cheaper. Defaults to False.
+            parser (Optional[str]): The XML parser backend, either "lxml" or 
+                "etree". lxml parses faster, but building courses from its 
+                elements is slower than from the standard library's, and 
+                lazy courses parsed with it must copy their element out of 
+                the response, since an lxml element keeps its whole 
+                document alive. Defaults to None, which uses "etree".
+            pool_connections (int): The number of hosts whose connections are 
+                pooled. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open 
+                to each host, which should be at least the number of threads 
+                sharing the connection. Defaults to 10.
+            retries (int): The number of times a failed request is retried. 
+                Defaults to 3.
+            backoff (float): The maximum delay before the first retry, in 
+                seconds, which doubles with each further retry. Defaults to 
+                0.5.
+            max_backoff (float): The longest delay between retries, in 
+                seconds. Defaults to 30.
+            connect_timeout (float): How long to wait for a connection to be 
+                established, in seconds. Defaults to 5.
+            read_timeout (float): How long to wait for the server to send 
+                data, in seconds. Defaults to 30.
+            rate_limiter (Optional[RateLimiter]): A rate limiter every 
+                request waits on, which may be shared with other connections 
+                and, for a FileRateLimiter, other processes. It is told 
+                about throttled and successful responses so that it adapts 
+                to the rate the server accepts. Defaults to None.
+            single_flight (bool): If True, identical requests made from 
+                several threads at once share a single download and parse. 
+                Each caller gets its own list, but the schools or courses in 
+                it are shared (lazy courses may be materialized from 
+                several threads at once). Streaming methods are never 
+                shared. Defaults to False.
+            transport (Optional): The object requests are sent through in 
+                place of a requests session, such as a transport from 
+                explorecourses.transport. It must provide the `get`, `mount` 
+                and `close` methods of requests.Session. Defaults to None, 
+                which uses a new session.
+            base_url (Optional[str]): The URL of the Explore Courses server, 
+                ending with a slash (e.g., the URL of a StandInServer). 
+                Defaults to None, which uses explorecourses.stanford.edu.
+            interner (Optional[Interner]): The table through which courses 
+                parsed by the connection share repeated values, such as 
+                terms, components, locations and attribute descriptions. 
+                The table keeps those values for as long as the connection 
+                is used; pass your own Interner to clear it between 
+                catalogs, or the same Interner to several connections to 
+                share one table between them. Defaults to None, which gives 
+                the connection its own.
+            parse_executor (Optional[Executor]): A process pool, such as a 
+                concurrent.futures.ProcessPoolExecutor, that large course 
+                responses are parsed in. They are split at course 
+                boundaries, and the chunks are parsed and their courses 
+                built in parallel, so parsing a full catalog scales with 
+                the number of cores. The courses of each chunk only share 
+                repeated values among themselves, not through `interner`. 
+                Ignored by lazy connections, whose courses need their XML 
+                elements. The caller owns the pool and must shut it down. 
+                Defaults to None, which parses in the calling thread.
+
         """
 
-        self._session = requests.Session()
+        self._url = base_url or self._URL
+        self._session = transport or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, 
+                              pool_maxsize=pool_maxsize)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._rate_limiter = rate_limiter
+        self._flights = SingleFlight() if single_flight else None
+        self._hooks = []
 
+        self._cache = cache
+        self._lazy = lazy
+        self._interner = Interner() if interner is None else interner
+        self._parse_executor = None if lazy else parse_executor
+        self._parser = get_parser(parser or ElementTreeParser.name)
 
-    def get_schools(self, academic_year=None) -> List[School]:
+        self._directories = {}
+        self._directory_flights = SingleFlight()
+
+
+    def get_schools(self, academic_year=None, 
+                    timeout: float = None) -> List[School]:
         """
         Gets all schools within the university.
 
         Args:
             academic_year (Optional[str]): The academic year within which to 
                 retrive schools from (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
 
         Returns:
             List[School]: The schools contained within the university.
 
-        """
+        Raises:
+            requests.Timeout: If the deadline passes.
 
-        payload = {
-            "view": "xml-20200810",
-            "year": academic_year.replace('-', '')
-        }
-        res = self._session.get(self._URL, params=payload)
+        """
 
-        root = ET.fromstring(res.content)
-        schools = root.findall(".//school")
+        payload = self._school_payload(academic_year)
 
-        return [School(school) for school in schools]
+        return self._get(self._url, payload, self._parse_schools, 
+                         self._deadline(timeout))
 
 
-    def get_school(self, name: str) -> School:
+    def get_school(self, name: str, year=None, 
+                   timeout: float = None) -> School:
         """
         Gets a school within the university by name.
 
         Args:
             name (str): The name of the school.
+            year (Optional[str]): The academic year within which to retrieve 
+                the school (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
 
         Returns:
             School: The school if it exists, None otherwise.
 
         """
 
-        schools = self.get_schools()
-        f = lambda school, name: school.name == name
+        return self.get_directory(year, timeout=timeout).get_school(name)
 
-        idx = [idx for idx, school in enumerate(schools) if f(school, name)]
 
-        return schools[idx[0]] if idx else None
+    def get_directory(self, year=None, timeout: float = None) -> Directory:
+        """
+        Gets the schools and departments of an academic year, indexed for 
+        lookup by name or code.
+
+        The directory is only downloaded the first time it is requested for 
+        a given year; later calls return the same object, and calls made 
+        while it is being downloaded wait for that download, up to their 
+        own timeout. Directories of different years are downloaded 
+        independently.
+
+        Args:
+            year (Optional[str]): The academic year of the directory (e.g., 
+                "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
+
+        Returns:
+            Directory: The directory for the academic year.
+
+        Raises:
+            requests.Timeout: If the deadline passes, including while 
+                waiting for another thread's download.
+
+        """
+
+        directory = self._directories.get(year)
+        if directory is not None:
+            return directory
+
+        def fetch():
+            schools = self.get_schools(year, timeout=timeout)
+            return self._directories.setdefault(year, 
+                                                Directory(schools, year=year))
+
+        try:
+            return self._directory_flights.do(year, fetch, timeout)
+        except TimeoutError:
+            raise requests.Timeout("deadline exceeded while waiting for the "
+                                   "directory") from None
 
 
     def get_courses_by_department(self, code: str, *filters: str, 
-                                  year=None) -> List[Course]:
+                                  year=None, 
+                                  timeout: float = None) -> List[Course]:
 
         """
         Gets all courses listed under a given department.
@@ -83,20 +439,27 @@ class CourseConnection():
             *filters (str): Search query filters.
             year (Optional[str]): The academic year within which to retrieve 
                 courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
 
         Returns:
             List[Course]: The courses listed under the given department.
 
+        Raises:
+            requests.Timeout: If the deadline passes.
+
         """
 
         filters = list(filters)
         filters.append(f"filter-departmentcode-{code}")
 
-        return self.get_courses_by_query(code, *filters, year=year)
+        return self.get_courses_by_query(code, *filters, year=year, 
+                                         timeout=timeout)
 
 
     def get_courses_by_query(self, query: str, *filters: str, 
-                             year=None) -> List[Course]:
+                             year=None, 
+                             timeout: float = None) -> List[Course]:
 
         """
         Gets all courses matched by a search query.
@@ -106,13 +469,620 @@ class CourseConnection():
             *filters (str): Search query filters.
             year (Optional[str]): The academic year within which to retrieve 
                 courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
 
         Returns:
             List[Course]: The courses matching the search query.
 
+        Raises:
+            requests.Timeout: If the deadline passes.
+
         """
 
-        url = self._URL + "search"
+        url = self._url + "search"
+        payload = self._course_payload(query, filters, year)
+
+        return self._get(url, payload, self._parse_courses, 
+                         self._deadline(timeout))
+
+
+    def get_all_courses(self, *filters: str, year=None, max_workers=8, 
+                        progress: Callable = None, 
+                        timeout: float = None) -> CrawlResult:
+
+        """
+        Gets every course in the university, fetching departments in 
+        parallel.
+
+        Courses cross-listed under several departments are only included 
+        once. A department that cannot be retrieved does not abort the crawl; 
+        its error is recorded in the result instead.
+
+        Args:
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve 
+                courses (e.g., "2017-2018"). Defaults to None.
+            max_workers (int): The maximum number of departments fetched at 
+                once. Defaults to 8.
+            progress (Optional[Callable]): Called as `progress(done, total, 
+                department)` after each department completes.
+            timeout (Optional[float]): The deadline for each department's 
+                request in seconds, including retries. Defaults to None.
+
+        Returns:
+            CrawlResult: The unique courses and any per-department failures.
+
+        """
+
+        courses = []
+        failures = {}
+
+        crawl = self.crawl(*filters, year=year, max_workers=max_workers, 
+                           timeout=timeout)
+        for done, (dept, dept_courses, error) in enumerate(crawl, 1):
+            if error is not None:
+                failures[dept.code] = error
+            else:
+                courses.extend(dept_courses)
+
+            if progress is not None:
+                progress(done, crawl.total, dept)
+
+        return CrawlResult(courses, failures)
+
+
+    def crawl(self, *filters: str, year=None, max_workers=8, 
+              timeout: float = None) -> "_Crawl":
+
+        """
+        Fetches the courses of every department in parallel, yielding each 
+        department's results as soon as they arrive.
+
+        Courses already yielded for an earlier department are omitted, so the 
+        concatenation of all yielded courses contains no duplicates. The 
+        returned iterator has a `total` attribute holding the number of 
+        departments being fetched.
+
+        Args:
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve 
+                courses (e.g., "2017-2018"). Defaults to None.
+            max_workers (int): The maximum number of departments fetched at 
+                once. Defaults to 8.
+            timeout (Optional[float]): The deadline for each department's 
+                request in seconds, including retries. Defaults to None.
+
+        Returns:
+            Iterator[Tuple[Department, List[Course], Optional[Exception]]]: 
+                For each department, its new courses and the error raised 
+                while fetching it, if any.
+
+        """
+
+        departments = {}
+        for dept in self.get_directory(year, timeout=timeout).departments:
+            departments.setdefault(dept.code, dept)
+
+        return _Crawl(self, list(departments.values()), filters, year, 
+                      max_workers, timeout)
+
+
+    def iter_courses_by_department(self, code: str, *filters: str, 
+                                   year=None, 
+                                   timeout: float = None) -> Iterator[Course]:
+
+        """
+        Lazily iterates over all courses listed under a given department.
+
+        Courses are parsed from the response as it is downloaded, so the first 
+        course is available before the full response has arrived.
+
+        Args:
+            code (str): The department code.
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve 
+                courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
+
+        Yields:
+            Course: The next course listed under the given department.
+
+        """
+
+        filters = list(filters)
+        filters.append(f"filter-departmentcode-{code}")
+
+        return self.iter_courses_by_query(code, *filters, year=year, 
+                                          timeout=timeout)
+
+
+    def iter_courses_by_query(self, query: str, *filters: str, 
+                              year=None, 
+                              timeout: float = None) -> Iterator[Course]:
+
+        """
+        Lazily iterates over all courses matched by a search query.
+
+        The response is read as a stream and parsed incrementally. Each course 
+        is yielded as soon as its element is complete, after which the 
+        element is discarded, so memory use does not grow with the number of 
+        courses returned.
+
+        Args:
+            query (str): The search query.
+            *filters (str): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve 
+                courses (e.g., "2017-2018"). Defaults to None.
+            timeout (Optional[float]): The deadline for the call in seconds, 
+                including retries. Defaults to None.
+
+        Yields:
+            Course: The next course matching the search query.
+
+        """
+
+        url = self._url + "search"
+        payload = self._course_payload(query, filters, year)
+        deadline = self._deadline(timeout)
+
+        stats = self._begin(url, payload) if self._hooks else None
+        if stats is None:
+            yield from self._iter_courses(self._stream(url, payload, deadline))
+            return
+
+        try:
+            yield from self._iter_courses(
+                self._stream(url, payload, deadline, stats), stats
+            )
+        except Exception as e:
+            stats.error = e
+            raise
+        finally:
+            self._finish(stats)
+
+
+    def add_hook(self, hook: Callable[[CallStats], None]):
+        """
+        Registers a function called with the CallStats of every request 
+        once it completes, successfully or not. Calls sharing a request 
+        through single flight report it once. Measurements are only taken 
+        while at least one hook is registered.
+
+        Args:
+            hook (Callable[[CallStats], None]): The function to call.
+
+        """
+
+        self._hooks.append(hook)
+
+
+    def remove_hook(self, hook: Callable[[CallStats], None]):
+        """
+        Unregisters a function registered with `add_hook`.
+
+        Args:
+            hook (Callable[[CallStats], None]): The function to unregister.
+
+        Raises:
+            ValueError: If the function is not registered.
+
+        """
+
+        self._hooks.remove(hook)
+
+
+    def _get(self, url: str, payload: dict, 
+             parse: Callable[[bytes, Optional[CallStats]], list], 
+             deadline: Optional[float]) -> list:
+        """
+        Performs a GET request and parses the response, sharing the work 
+        with identical calls in progress if single flight is enabled.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+            parse (Callable[[bytes, Optional[CallStats]], list]): Converts 
+                the raw response body into a list of results.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete.
+
+        Returns:
+            list: The parsed results.
+
+        Raises:
+            requests.Timeout: If the deadline passes.
+
+        """
+
+        def get():
+            stats = self._begin(url, payload) if self._hooks else None
+            if stats is None:
+                return parse(self._fetch(url, payload, deadline), None)
+
+            try:
+                return parse(self._fetch(url, payload, deadline, stats), 
+                             stats)
+            except Exception as e:
+                stats.error = e
+                raise
+            finally:
+                self._finish(stats)
+
+        if self._flights is None:
+            return get()
+
+        timeout = (None if deadline is None
+                   else max(deadline - time.monotonic(), 0))
+        try:
+            results = self._flights.do(request_key(url, payload), get, 
+                                       timeout)
+        except TimeoutError:
+            raise requests.Timeout("deadline exceeded while waiting for an "
+                                   "identical request") from None
+
+        return list(results)
+
+
+    def _begin(self, url: str, payload: dict) -> CallStats:
+        """
+        Starts measuring a request.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+
+        Returns:
+            CallStats: The request's measurements.
+
+        """
+
+        stats = CallStats(url, payload)
+        stats.total = time.perf_counter()
+
+        return stats
+
+
+    def _finish(self, stats: CallStats):
+        """
+        Finishes measuring a request and reports it to every hook.
+
+        Args:
+            stats (CallStats): The request's measurements.
+
+        """
+
+        stats.total = time.perf_counter() - stats.total
+
+        for hook in list(self._hooks):
+            hook(stats)
+
+
+    def _fetch(self, url: str, payload: dict, 
+               deadline: Optional[float] = None, 
+               stats: Optional[CallStats] = None) -> bytes:
+        """
+        Performs a GET request and returns the raw response body.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete. Defaults to None.
+            stats (Optional[CallStats]): Measurements to record the request 
+                in. Defaults to None.
+
+        Returns:
+            bytes: The response body.
+
+        """
+
+        return b"".join(self._stream(url, payload, deadline, stats))
+
+
+    def _stream(self, url: str, payload: dict, 
+                deadline: Optional[float] = None, 
+                stats: Optional[CallStats] = None) -> Iterator[bytes]:
+        """
+        Performs a GET request and yields the response body as it arrives.
+
+        When a cache is configured, fresh cached responses are served without 
+        a request, stale ones are revalidated using their ETag or 
+        Last-Modified header, and successful responses are stored.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete. Defaults to None.
+            stats (Optional[CallStats]): Measurements to record the request 
+                in. Defaults to None.
+
+        Yields:
+            bytes: The next chunk of the response body.
+
+        Raises:
+            requests.HTTPError: If the server responds with an error status 
+                once retries are exhausted.
+            requests.Timeout: If the deadline passes.
+
+        """
+
+        entry = self._cache.get(url, payload) if self._cache else None
+        if entry is not None and entry.fresh:
+            if stats is not None:
+                stats.cached = True
+                stats.bytes = len(entry.content)
+            yield entry.content
+            return
+
+        headers = entry.validators if entry is not None else None
+
+        with self._request(url, payload, headers, deadline, stats) as res:
+
+            if entry is not None and res.status_code == 304:
+                self._cache.refresh(url, payload)
+                if stats is not None:
+                    stats.cached = True
+                    stats.bytes = len(entry.content)
+                yield entry.content
+                return
+
+            res.raise_for_status()
+
+            chunks = self._read(res, deadline, stats)
+            if self._cache is None or res.status_code != 200:
+                yield from chunks
+                return
+
+            body = []
+            for chunk in chunks:
+                body.append(chunk)
+                yield chunk
+
+            self._cache.put(url, payload, b"".join(body), 
+                            res.headers.get("ETag"), 
+                            res.headers.get("Last-Modified"))
+
+
+    def _request(self, url: str, payload: dict, headers: Optional[dict], 
+                 deadline: Optional[float], 
+                 stats: Optional[CallStats] = None) -> requests.Response:
+        """
+        Sends a streaming GET request, retrying failed attempts.
+
+        Args:
+            url (str): The URL to request.
+            payload (dict): The query string parameters.
+            headers (Optional[dict]): Extra request headers.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete.
+            stats (Optional[CallStats]): Measurements to record the attempts 
+                in. Defaults to None.
+
+        Returns:
+            requests.Response: The first response that should not be 
+                retried, or the last response once retries are exhausted.
+
+        Raises:
+            requests.ConnectionError: If the last attempt fails to connect.
+            requests.Timeout: If the last attempt or the deadline times out, 
+                or the rate limiter cannot admit a request before the 
+                deadline.
+
+        """
+
+        limiter = self._rate_limiter
+
+        for attempt in range(self._retries + 1):
+            last = attempt == self._retries
+            retry_after = None
+
+            if limiter is not None:
+                start = time.perf_counter()
+                timeout = (None if deadline is None
+                           else max(deadline - time.monotonic(), 0))
+                acquired = limiter.acquire(timeout)
+                if stats is not None:
+                    stats.wait += time.perf_counter() - start
+                if not acquired:
+                    raise requests.Timeout("deadline exceeded while waiting "
+                                           "for the rate limiter")
+
+            # Computed outside the try, so that an expired deadline is raised 
+            # rather than retried.
+            timeout = self._timeout(deadline)
+
+            if stats is not None:
+                stats.attempts += 1
+                start = time.perf_counter()
+
+            try:
+                res = self._session.get(url, params=payload, headers=headers, 
+                                        stream=True, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if last:
+                    raise
+            else:
+                if stats is not None:
+                    stats.ttfb = time.perf_counter() - start
+                    stats.status = res.status_code
+
+                if res.status_code in self._THROTTLE_STATUSES:
+                    retry_after = parse_retry_after(
+                        res.headers.get("Retry-After")
+                    )
+                    if limiter is not None:
+                        limiter.throttle(retry_after)
+                elif limiter is not None and res.status_code < 400:
+                    limiter.success()
+
+                if last or res.status_code not in self._RETRY_STATUSES:
+                    return res
+                res.close()
+
+            if stats is not None:
+                start = time.perf_counter()
+                self._wait(attempt, deadline, retry_after)
+                stats.wait += time.perf_counter() - start
+            else:
+                self._wait(attempt, deadline, retry_after)
+
+
+    def _read(self, res: requests.Response, deadline: Optional[float], 
+              stats: Optional[CallStats] = None) -> Iterator[bytes]:
+        """
+        Yields the body of a streaming response, enforcing a deadline 
+        between chunks.
+
+        Args:
+            res (requests.Response): The response.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete.
+            stats (Optional[CallStats]): Measurements to record the download 
+                in. Defaults to None.
+
+        Yields:
+            bytes: The next chunk of the response body.
+
+        Raises:
+            requests.Timeout: If the deadline passes.
+
+        """
+
+        chunks = res.iter_content(chunk_size=self._CHUNK_SIZE)
+
+        while True:
+            # Only the time spent waiting for each chunk counts as download 
+            # time, not the time the consumer spends between chunks.
+            if stats is not None:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                stats.download += time.perf_counter() - start
+            else:
+                chunk = next(chunks, None)
+
+            if chunk is None:
+                return
+            if stats is not None:
+                stats.bytes += len(chunk)
+
+            if deadline is not None and time.monotonic() > deadline:
+                raise requests.Timeout("deadline exceeded while reading "
+                                       "the response")
+            yield chunk
+
+
+    def _timeout(self, deadline: Optional[float]) -> Tuple[float, float]:
+        """
+        Computes the connect and read timeouts of the next attempt, 
+        shortened to fit within a deadline.
+
+        Args:
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete.
+
+        Returns:
+            Tuple[float, float]: The connect and read timeouts, in seconds.
+
+        Raises:
+            requests.Timeout: If the deadline has passed.
+
+        """
+
+        if deadline is None:
+            return self._connect_timeout, self._read_timeout
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout("deadline exceeded before the request "
+                                   "was sent")
+
+        return (min(self._connect_timeout, remaining), 
+                min(self._read_timeout, remaining))
+
+
+    def _wait(self, attempt: int, deadline: Optional[float], 
+              retry_after: Optional[float] = None):
+        """
+        Sleeps before a retry, for a random delay of up to `backoff` seconds 
+        doubled once per previous retry ("full jitter"), so that clients 
+        retrying together spread out, or for the delay the server requested 
+        if that is longer. The delay never extends past the deadline.
+
+        Args:
+            attempt (int): The number of the attempt that failed, from 0.
+            deadline (Optional[float]): The time.monotonic() value by which 
+                the response must be complete.
+            retry_after (Optional[float]): The delay requested by the 
+                server, in seconds. Defaults to None.
+
+        """
+
+        delay = random.uniform(0, min(self._max_backoff, 
+                                      self._backoff * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if deadline is not None:
+            delay = min(delay, max(deadline - time.monotonic(), 0))
+
+        time.sleep(delay)
+
+
+    @staticmethod
+    def _deadline(timeout: Optional[float]) -> Optional[float]:
+        """
+        Converts a per-call timeout into a deadline.
+
+        Args:
+            timeout (Optional[float]): The timeout, in seconds.
+
+        Returns:
+            Optional[float]: The time.monotonic() value at which the timeout 
+                expires, or None if there is no timeout.
+
+        """
+
+        return None if timeout is None else time.monotonic() + timeout
+
+
+    @staticmethod
+    def _school_payload(academic_year=None) -> dict:
+        """
+        Builds the query string parameters for a schools listing.
+
+        Args:
+            academic_year (Optional[str]): The academic year within which to 
+                retrieve schools (e.g., "2017-2018"). Defaults to None.
+
+        Returns:
+            dict: The query string parameters.
+
+        """
+
+        payload = {"view": "xml-20200810"}
+        if academic_year:
+            payload.update({"year": academic_year.replace('-', '')})
+
+        return payload
+
+
+    @staticmethod
+    def _course_payload(query: str, filters: Tuple[str], year=None) -> dict:
+        """
+        Builds the query string parameters for a course search.
+
+        Args:
+            query (str): The search query.
+            filters (Tuple[str]): Search query filters.
+            year (Optional[str]): The academic year within which to retrieve 
+                courses (e.g., "2017-2018"). Defaults to None.
+
+        Returns:
+            dict: The query string parameters.
+
+        """
 
         payload = {
             "view": "xml-20200810",
@@ -123,9 +1093,237 @@ class CourseConnection():
         if year:
             payload.update({"academicYear": year.replace('-', '')})
 
-        res = self._session.get(url, params=payload)
+        return payload
+
+
+    def _parse_schools(self, content: bytes, 
+                       stats: Optional[CallStats] = None) -> List[School]:
+        """
+        Parses the schools out of a schools listing response.
+
+        Args:
+            content (bytes): The raw response body.
+            stats (Optional[CallStats]): Measurements to record the parse 
+                in. Defaults to None.
+
+        Returns:
+            List[School]: The schools contained in the response.
+
+        """
+
+        return self._parse(content, ".//school", School, stats)
+
+
+    def _parse_courses(self, content: bytes, 
+                       stats: Optional[CallStats] = None) -> List[Course]:
+        """
+        Parses the courses out of a course search response.
+
+        Args:
+            content (bytes): The raw response body.
+            stats (Optional[CallStats]): Measurements to record the parse 
+                in. Defaults to None.
+
+        Returns:
+            List[Course]: The courses contained in the response.
+
+        """
+
+        if (self._parse_executor is not None and 
+                len(content) > self._PARSE_CHUNK_SIZE):
+            return self._parse_parallel(content, stats)
+
+        if self._lazy:
+            detach = self._parser.detach
+            build = lambda elem: Course(detach(elem), lazy=True, 
+                                        interner=self._interner)
+        else:
+            build = functools.partial(Course, interner=self._interner)
+
+        return self._parse(content, ".//course", build, stats)
+
+
+    def _parse_parallel(self, content: bytes, 
+                        stats: Optional[CallStats]) -> List[Course]:
+        """
+        Parses the courses out of a course search response in the parse 
+        executor, one chunk of courses per task.
+
+        Args:
+            content (bytes): The raw response body.
+            stats (Optional[CallStats]): Measurements to record the parse 
+                in, which counts all of the time spent in the executor as 
+                parsing.
+
+        Returns:
+            List[Course]: The courses contained in the response, in order.
+
+        """
+
+        start = time.perf_counter()
+
+        chunks = _split_courses(content, self._PARSE_CHUNK_SIZE)
+        parts = self._parse_executor.map(_build_courses, chunks, 
+                                         [self._parser.name] * len(chunks))
+        courses = [course for part in parts for course in part]
+
+        if stats is not None:
+            stats.parse += time.perf_counter() - start
+            stats.count = len(courses)
+
+        return courses
+
+
+    def _parse(self, content: bytes, path: str, build: Callable, 
+               stats: Optional[CallStats]) -> list:
+        """
+        Parses a response and constructs an object from each element 
+        matching a path.
+
+        Args:
+            content (bytes): The raw response body.
+            path (str): The path of the elements to construct objects from.
+            build (Callable): Constructs an object from an element.
+            stats (Optional[CallStats]): Measurements to record the parse 
+                in.
+
+        Returns:
+            list: The constructed objects.
+
+        """
+
+        if stats is None:
+            return [build(elem)
+                    for elem in self._parser.fromstring(content).findall(path)]
+
+        start = time.perf_counter()
+        elems = self._parser.fromstring(content).findall(path)
+        built = time.perf_counter()
+        results = [build(elem) for elem in elems]
+
+        stats.parse += built - start
+        stats.build += time.perf_counter() - built
+        stats.count = len(results)
+
+        return results
+
+
+    def _iter_courses(self, chunks: Iterable[bytes], 
+                      stats: Optional[CallStats] = None) -> Iterator[Course]:
+        """
+        Incrementally parses courses from chunks of an XML response.
+
+        Args:
+            chunks (Iterable[bytes]): The raw response, in order.
+            stats (Optional[CallStats]): Measurements to record the parse 
+                in. Defaults to None.
+
+        Yields:
+            Course: Each top-level course as soon as its element closes.
+
+        """
+
+        parser = self._parser.pull_parser()
+        stack = []
+
+        def events():
+            for chunk in chunks:
+                if stats is not None:
+                    start = time.perf_counter()
+                    parser.feed(chunk)
+                    stats.parse += time.perf_counter() - start
+                else:
+                    parser.feed(chunk)
+                yield from parser.read_events()
+
+            parser.close()
+            yield from parser.read_events()
+
+        for event, elem in events():
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag != "course" or any(e.tag == "course" for e in stack):
+                continue
+
+            if stats is not None:
+                start = time.perf_counter()
+                course = Course(elem, lazy=self._lazy, 
+                                interner=self._interner)
+                stats.build += time.perf_counter() - start
+                stats.count += 1
+            else:
+                course = Course(elem, lazy=self._lazy, 
+                                interner=self._interner)
+
+            yield course
+
+            # Drop the finished subtree so the tree never holds more than one 
+            # course at a time. Lazy courses still need their subtree, so it is 
+            # only detached.
+            if not self._lazy:
+                elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
+class _Crawl(object):
+    """
+    An iterator over the results of a parallel department crawl.
+
+    Attributes:
+        total (int): The number of departments being fetched.
+
+    """
+
+    def __init__(self, connection: CourseConnection, 
+                 departments: List[Department], filters: Tuple[str], year, 
+                 max_workers: int, timeout: Optional[float]):
+
+        self.total = len(departments)
+        self._results = self._run(connection, departments, filters, year, 
+                                  max_workers, timeout)
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self) -> Tuple[Department, List[Course], 
+                                Optional[Exception]]:
+        return next(self._results)
+
+
+    @staticmethod
+    def _run(connection, departments, filters, year, max_workers, timeout):
+        seen = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(connection.get_courses_by_department, 
+                                dept.code, *filters, year=year, 
+                                timeout=timeout): dept
+                for dept in departments
+            }
+
+            try:
+                for future in as_completed(futures):
+                    dept = futures[future]
+                    try:
+                        courses = future.result()
+                    except Exception as e:
+                        yield dept, [], e
+                        continue
 
-        root = ET.fromstring(res.content)
-        courses = root.findall(".//course")
+                    new = []
+                    for course in courses:
+                        if course.course_id not in seen:
+                            seen.add(course.course_id)
+                            new.append(course)
 
-        return [Course(course) for course in courses]
+                    yield dept, new, None
+            finally:
+                for future in futures:
+                    future.cancel()
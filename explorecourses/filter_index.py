@@ -0,0 +1,262 @@
+"""
+This module implements FilterIndex, which evaluates the search filters in
+explorecourses.filters against courses that are already in memory, without
+contacting Explore Courses.
+"""
+
+from typing import Iterable, Iterator, List, Set
+
+from explorecourses import filters
+from explorecourses.classes import Course, days_to_mask
+
+# The GER strings that satisfy each GER filter, as they appear in Course.gers.
+_GERS = {
+    filters.LANGUAGE: ("Language",),
+    filters.WRITING1: ("Writing 1",),
+    filters.WRITING2: ("Writing 2",),
+    filters.WRITINGSLE: ("Writing SLE",),
+    filters.WAY_AII: ("WAY-A-II", "WAY-AII"),
+    filters.WAY_AQR: ("WAY-AQR",),
+    filters.WAY_CE: ("WAY-CE",),
+    filters.WAY_ED: ("WAY-ED",),
+    filters.WAY_ER: ("WAY-ER",),
+    filters.WAY_FR: ("WAY-FR",),
+    filters.WAY_SI: ("WAY-SI",),
+    filters.WAY_SMA: ("WAY-SMA",),
+}
+_GER_FILTERS = {ger: f for f, gers in _GERS.items() for ger in gers}
+
+# The time filters, with the minute after midnight at which each window ends.
+_TIMES = (
+    (filters.TIME_EARLY_MORNING, 10 * 60),
+    (filters.TIME_MORNING, 12 * 60),
+    (filters.TIME_LUNCHTIME, 14 * 60),
+    (filters.TIME_AFTERNOON, 17 * 60),
+    (filters.TIME_EVENING, 24 * 60),
+)
+
+_DAYS = {
+    "Sunday": filters.DAY_SUNDAY,
+    "Monday": filters.DAY_MONDAY,
+    "Tuesday": filters.DAY_TUESDAY,
+    "Wednesday": filters.DAY_WEDNESDAY,
+    "Thursday": filters.DAY_THURSDAY,
+    "Friday": filters.DAY_FRIDAY,
+    "Saturday": filters.DAY_SATURDAY,
+}
+
+# The day filters, with their bit in Schedule.day_mask.
+_DAY_BITS = tuple((days_to_mask((day,)), f) for day, f in _DAYS.items())
+
+_UNITS = (filters.UNITS_1, filters.UNITS_2, filters.UNITS_3, filters.UNITS_4,
+          filters.UNITS_5)
+
+_ACTIVE = "filter-coursestatus-Active"
+
+
+def course_filters(course: Course) -> Set[str]:
+    """
+    Computes the filters in explorecourses.filters that a course satisfies.
+
+    A course satisfies a term, time, or day filter if any of its sections
+    does, a GER filter if it fulfills the requirement, a units filter if it
+    can be taken for that many units, and a career filter if it belongs to
+    that academic career. It also satisfies its own department code filter,
+    and the active course status filter if it is active.
+
+    Args:
+        course (Course): The course.
+
+    Returns:
+        Set[str]: The filters the course satisfies.
+
+    """
+
+    matched = {f"filter-departmentcode-{course.subject}",
+               f"filter-academiclevel-{course.academic_career}"}
+
+    if course.active:
+        matched.add(_ACTIVE)
+
+    matched.update(_GER_FILTERS[ger] for ger in course.gers
+                   if ger in _GER_FILTERS)
+
+    matched.update(f for units, f in enumerate(_UNITS, 1)
+                   if course.units_min <= units <= course.units_max)
+    if course.units_max > 5:
+        matched.add(filters.UNITS_GT5)
+
+    for section in course.sections:
+        if section.term:
+            matched.add(f"filter-term-{section.term.split()[-1]}")
+
+        for schedule in section.schedules:
+            mask = schedule.day_mask
+            if mask:
+                matched.update(f for bit, f in _DAY_BITS if mask & bit)
+
+            start = schedule.start_minutes
+            if start is not None:
+                matched.add(next(f for f, end in _TIMES if start < end))
+
+    return matched
+
+
+def satisfies(matched: Set[str], filters: Iterable[str]) -> bool:
+    """
+    Tests whether a course satisfying a set of filters is matched by a search
+    using other filters, following the semantics described in FilterIndex.
+
+    Args:
+        matched (Set[str]): The filters the course satisfies, as computed by
+            `course_filters`.
+        filters (Iterable[str]): Search query filters.
+
+    Returns:
+        bool: True if the course is matched, False otherwise.
+
+    """
+
+    kinds = {}
+    for f in filters:
+        kinds[_kind(f)] = kinds.get(_kind(f), False) or f in matched
+
+    return all(kinds.values())
+
+
+def _kind(f: str) -> str:
+    """
+    Gets the kind of a filter (e.g., "filter-term" for "filter-term-Autumn").
+
+    """
+
+    return f.rsplit("-", 1)[0]
+
+
+class FilterIndex(object):
+    """
+    This class answers filtered queries over a fixed collection of courses
+    using one bitmap per filter.
+
+    Filters follow the semantics of the Explore Courses search: filters of
+    the same kind (e.g., two terms) match courses satisfying any of them,
+    while filters of different kinds must all be satisfied. Unlike the
+    server, term, day and time filters are evaluated per course, so a course
+    matches AUTUMN and DAY_TUESDAY if it has an autumn section and a Tuesday
+    section, even if they are different sections.
+
+    Attributes:
+        courses (List[Course]): The indexed courses, in insertion order.
+
+    """
+
+    def __init__(self, courses: Iterable[Course] = ()):
+        """
+        Constructs a new FilterIndex.
+
+        Args:
+            courses (Iterable[Course]): The courses to index. Defaults to
+                none.
+
+        """
+
+        self.courses = []
+        self._bitmaps = {}
+        self._all = 0
+
+        self.add(courses)
+
+
+    def add(self, courses: Iterable[Course]):
+        """
+        Adds courses to the index.
+
+        Args:
+            courses (Iterable[Course]): The courses to add.
+
+        """
+
+        bitmaps = self._bitmaps
+
+        for course in courses:
+            bit = 1 << len(self.courses)
+            self.courses.append(course)
+            self._all |= bit
+
+            for f in course_filters(course):
+                bitmaps[f] = bitmaps.get(f, 0) | bit
+
+
+    def get_courses(self, *filters: str) -> List[Course]:
+        """
+        Gets the indexed courses matched by a set of filters.
+
+        Args:
+            *filters (str): Search query filters.
+
+        Returns:
+            List[Course]: The matching courses, in insertion order.
+
+        """
+
+        return list(self._decode(self.bitmap(*filters)))
+
+
+    def count(self, *filters: str) -> int:
+        """
+        Counts the indexed courses matched by a set of filters.
+
+        Args:
+            *filters (str): Search query filters.
+
+        Returns:
+            int: The number of matching courses.
+
+        """
+
+        return bin(self.bitmap(*filters)).count("1")
+
+
+    def bitmap(self, *filters: str) -> int:
+        """
+        Computes the bitmap of indexed courses matched by a set of filters,
+        where bit i is set if `courses[i]` matches.
+
+        Args:
+            *filters (str): Search query filters.
+
+        Returns:
+            int: The bitmap of matching courses.
+
+        """
+
+        groups = {}
+        for f in filters:
+            kind = _kind(f)
+            groups[kind] = groups.get(kind, 0) | self._bitmaps.get(f, 0)
+
+        result = self._all
+        for bitmap in groups.values():
+            result &= bitmap
+
+        return result
+
+
+    def __len__(self):
+        return len(self.courses)
+
+
+    def _decode(self, bitmap: int) -> Iterator[Course]:
+        """
+        Yields the courses whose bits are set in a bitmap.
+
+        """
+
+        # Scanning the binary string keeps decoding linear in the number of
+        # courses, where clearing one bit at a time would be quadratic.
+        bits = bin(bitmap)[:1:-1]
+
+        i = bits.find("1")
+        while i >= 0:
+            yield self.courses[i]
+            i = bits.find("1", i + 1)
@@ -0,0 +1,129 @@
+"""
+This module implements Interner, a table of canonical values used while
+parsing so that values repeated across a catalog, such as terms,
+components, locations and attribute descriptions, are stored once, along
+with the instructors, attributes and tags shared between courses.
+
+"""
+
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class _Table(dict):
+    """
+    A dict in which a missing value becomes its own entry, so that lookups
+    of values already in the table never leave C.
+
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, value):
+        self[value] = value
+        return value
+
+
+class Interner(object):
+    """
+    This class maps values to a canonical copy of themselves, so that equal
+    values returned by it are the same object.
+
+    Unlike sys.intern, the table is owned by whoever creates it (e.g., a
+    connection or a catalog), also accepts tuples, and is released along
+    with its owner. It may be shared between threads; two threads adding
+    the same value at once may each keep their own copy, which only costs
+    memory.
+
+    The table keeps every distinct value it has been given, and every
+    shared object, until it is cleared or released, even once no course
+    uses them. Courses only intern fields with few distinct values across
+    a catalog (terms, components, units, locations, meeting days and
+    times, grading bases, academic groups and organizations, attributes,
+    tags and instructors), so the table grows with the catalog's
+    vocabulary rather than with the number of courses parsed. Free text,
+    such as descriptions and section notes, is never interned. A
+    long-lived owner that parses several catalogs can call `clear` between
+    them.
+
+    Example:
+        interner = Interner()
+        courses = [Course(elem, interner=interner) for elem in elems]
+
+    Attributes:
+        intern (Callable[[T], T]): The same as calling the Interner, but
+            faster, for use in tight loops.
+
+    """
+
+    __slots__ = ("intern", "_values", "_objects")
+
+    def __init__(self):
+        """
+        Constructs a new, empty Interner.
+
+        """
+
+        self._values = _Table()
+        self._objects = {}
+        self.intern = self._values.__getitem__
+
+
+    def __call__(self, value: T) -> T:
+        """
+        Gets the canonical copy of a value, which is the value itself the
+        first time it is seen.
+
+        Args:
+            value (T): The value, which must be hashable.
+
+        Returns:
+            T: The canonical value equal to `value`.
+
+        """
+
+        return self._values[value]
+
+
+    def share(self, key: Hashable, build: Callable[[], T]) -> T:
+        """
+        Gets the object shared under a key, building it the first time the
+        key is seen. This lets equal objects be shared without building
+        each copy only to discard it.
+
+        Args:
+            key (Hashable): The values that identify the object.
+            build (Callable[[], T]): Builds the object.
+
+        Returns:
+            T: The object shared under `key`.
+
+        """
+
+        obj = self._objects.get(key)
+        if obj is None:
+            obj = self._objects.setdefault(key, build())
+
+        return obj
+
+
+    def clear(self):
+        """
+        Forgets every canonical value and shared object. Objects already
+        built keep theirs.
+
+        """
+
+        self._values.clear()
+        self._objects.clear()
+
+
+    def __len__(self):
+        """
+        Returns the number of distinct values and shared objects in the
+        table.
+
+        """
+
+        return len(self._values) + len(self._objects)
@@ -0,0 +1,215 @@
+"""
+This module implements the XML parser backends used to read Explore Courses
+responses.
+
+Includes:
+    - ElementTreeParser, backed by the standard library
+    - LxmlParser, backed by lxml, which is considerably faster when installed
+
+Both produce elements exposing the ElementTree API (`find`, `findall`,
+`findtext`, `get`, and iteration over children), which is all that the
+classes in explorecourses.classes rely on. lxml parses documents several times
+faster, but accessing its elements from Python is slower, so it pays off when
+few elements are visited after parsing (e.g., with lazy courses).
+
+"""
+
+import copy
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - depends on the environment
+    lxml_etree = None
+
+
+class ElementTreeParser(object):
+    """
+    This class parses XML with the standard library's ElementTree.
+
+    Attributes:
+        name (str): The name of the backend, "etree".
+
+    """
+
+    name = "etree"
+
+    def fromstring(self, content: bytes):
+        """
+        Parses a complete XML document.
+
+        Args:
+            content (bytes): The raw XML document.
+
+        Returns:
+            Element: The document's root element.
+
+        """
+
+        return ET.fromstring(content)
+
+
+    def pull_parser(self):
+        """
+        Creates an incremental parser reporting start and end events.
+
+        Returns:
+            XMLPullParser: A parser supporting `feed`, `read_events`, and
+                `close`.
+
+        """
+
+        return ET.XMLPullParser(events=("start", "end"))
+
+
+    def detach(self, elem):
+        """
+        Gets an element that can be kept without keeping the rest of its 
+        document alive. ElementTree elements do not reference their parent, 
+        so this is the element itself.
+
+        Args:
+            elem (Element): The element.
+
+        Returns:
+            Element: `elem`.
+
+        """
+
+        return elem
+
+
+class LxmlParser(object):
+    """
+    This class parses XML with lxml. Comments and processing instructions are
+    dropped so that iterating over an element only yields child elements, as
+    with ElementTree, and external entities are never resolved.
+
+    Attributes:
+        name (str): The name of the backend, "lxml".
+
+    """
+
+    name = "lxml"
+
+    _OPTIONS = {
+        "remove_comments": True,
+        "remove_pis": True,
+        "resolve_entities": False,
+        "no_network": True,
+        "huge_tree": True,
+    }
+
+    def __init__(self):
+        """
+        Constructs a new LxmlParser.
+
+        Raises:
+            ImportError: If lxml is not installed.
+
+        """
+
+        if lxml_etree is None:
+            raise ImportError("the lxml parser backend requires lxml; "
+                              "install it with `pip install lxml`")
+
+
+    def fromstring(self, content: bytes):
+        """
+        Parses a complete XML document.
+
+        Args:
+            content (bytes): The raw XML document.
+
+        Returns:
+            Element: The document's root element.
+
+        """
+
+        # lxml parsers must not be shared between threads, so each document 
+        # gets its own.
+        parser = lxml_etree.XMLParser(**self._OPTIONS)
+
+        return lxml_etree.fromstring(content, parser=parser)
+
+
+    def pull_parser(self):
+        """
+        Creates an incremental parser reporting start and end events.
+
+        Returns:
+            XMLPullParser: A parser supporting `feed`, `read_events`, and
+                `close`.
+
+        """
+
+        return lxml_etree.XMLPullParser(events=("start", "end"),
+                                        **self._OPTIONS)
+
+
+    def detach(self, elem):
+        """
+        Gets an element that can be kept without keeping the rest of its 
+        document alive. Every lxml element keeps its whole document alive, 
+        even once removed from its parent, so this is a copy of the element 
+        in a document of its own.
+
+        Args:
+            elem (Element): The element.
+
+        Returns:
+            Element: A copy of `elem`.
+
+        """
+
+        return copy.deepcopy(elem)
+
+
+_PARSERS = {
+    ElementTreeParser.name: ElementTreeParser,
+    LxmlParser.name: LxmlParser,
+}
+
+
+def available_parsers():
+    """
+    Lists the names of the parser backends usable in this environment.
+
+    Returns:
+        List[str]: The available backend names, fastest first.
+
+    """
+
+    names = [ElementTreeParser.name]
+    if lxml_etree is not None:
+        names.insert(0, LxmlParser.name)
+
+    return names
+
+
+def get_parser(name=None):
+    """
+    Gets a parser backend by name.
+
+    Args:
+        name (Optional[str]): The name of the backend, either "lxml" or
+            "etree". Defaults to None, which selects lxml when it is
+            installed and ElementTree otherwise.
+
+    Returns:
+        The parser backend.
+
+    Raises:
+        ValueError: If no backend has the given name.
+        ImportError: If the named backend's library is not installed.
+
+    """
+
+    if name is None:
+        name = available_parsers()[0]
+
+    if name not in _PARSERS:
+        raise ValueError(f"unknown parser backend '{name}'; expected one of "
+                         f"{', '.join(sorted(_PARSERS))}")
+
+    return _PARSERS[name]()
@@ -0,0 +1,305 @@
+"""
+This module implements token bucket rate limiters that keep requests to
+Explore Courses within the rate the server allows, backing off when it
+throttles.
+
+Includes:
+    - RateLimiter, shared between the threads of one process
+    - FileRateLimiter, shared between processes through a lock file
+
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None
+
+
+def parse_retry_after(value: Optional[str],
+                      now: Callable[[], float] = time.time) -> Optional[float]:
+    """
+    Parses a Retry-After header.
+
+    Args:
+        value (Optional[str]): The header's value, either a number of seconds
+            or an HTTP date.
+        now (Callable[[], float]): Returns the current Unix time. Defaults to
+            time.time.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the header
+            is missing or malformed.
+
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter(object):
+    """
+    This class limits the rate of requests with a token bucket that can be
+    shared by any number of threads and connections.
+
+    The bucket holds up to `burst` tokens and refills at the current rate;
+    each request takes one token. When the server throttles a request, the
+    rate is halved (down to `min_rate`) and no tokens are handed out until
+    the server's Retry-After delay has passed. Every successful request then
+    raises the rate by `increase`, back up to `max_rate`, so the limiter
+    settles just below the highest rate the server accepts.
+
+    Attributes:
+        max_rate (float): The highest rate, in requests per second.
+        min_rate (float): The lowest rate throttling can reduce it to.
+        burst (int): The number of requests that can be sent at once after
+            an idle period.
+        increase (float): How much each successful request raises the rate.
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = None,
+                 increase: float = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Constructs a new RateLimiter.
+
+        Args:
+            rate (float): The highest rate, in requests per second.
+            burst (int): The bucket's capacity. Defaults to 1.
+            min_rate (Optional[float]): The lowest rate throttling can reduce
+                it to. Defaults to a tenth of `rate`.
+            increase (Optional[float]): How much each successful request
+                raises the rate. Defaults to a twentieth of `rate`.
+            clock (Callable[[], float]): Returns the current time in seconds.
+                Defaults to time.monotonic.
+            sleep (Callable[[float], None]): Sleeps for a number of seconds.
+                Defaults to time.sleep.
+
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.max_rate = rate
+        self.min_rate = rate / 10 if min_rate is None else min_rate
+        self.burst = burst
+        self.increase = rate / 20 if increase is None else increase
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+
+
+    @property
+    def rate(self) -> float:
+        """
+        float: The current rate, in requests per second.
+
+        """
+
+        with self._transaction() as state:
+            return state["rate"]
+
+
+    def acquire(self, timeout: float = None) -> bool:
+        """
+        Takes a token, waiting for one to become available.
+
+        Args:
+            timeout (Optional[float]): The longest time to wait, in seconds.
+                Defaults to None, which waits as long as necessary.
+
+        Returns:
+            bool: True if a token was taken, False if none would become
+                available within the timeout.
+
+        """
+
+        end = None if timeout is None else self._clock() + timeout
+
+        while True:
+            with self._transaction() as state:
+                now = self._refill(state)
+
+                wait = state["blocked_until"] - now
+                if wait <= 0:
+                    if state["tokens"] >= 1:
+                        state["tokens"] -= 1
+                        return True
+                    wait = (1 - state["tokens"]) / state["rate"]
+
+            if end is not None and now + wait > end:
+                return False
+
+            self._sleep(wait)
+
+
+    def throttle(self, retry_after: float = None):
+        """
+        Reports that the server throttled a request, halving the rate and
+        pausing until the server is ready again.
+
+        Args:
+            retry_after (Optional[float]): The delay requested by the server,
+                in seconds. Defaults to None, in which case requests resume
+                at the new rate.
+
+        """
+
+        with self._transaction() as state:
+            now = self._refill(state)
+
+            state["rate"] = max(state["rate"] / 2, self.min_rate)
+            state["tokens"] = 0.0
+            if retry_after is not None:
+                state["blocked_until"] = max(state["blocked_until"],
+                                             now + retry_after)
+
+
+    def success(self):
+        """
+        Reports that a request succeeded, raising the rate towards
+        `max_rate`.
+
+        """
+
+        with self._transaction() as state:
+            if state["rate"] < self.max_rate:
+                self._refill(state)
+                state["rate"] = min(state["rate"] + self.increase,
+                                    self.max_rate)
+
+
+    def _initial_state(self) -> dict:
+        """
+        Creates the state of a full bucket at the highest rate.
+
+        """
+
+        return {"tokens": float(self.burst), "updated": self._clock(),
+                "rate": self.max_rate, "blocked_until": 0.0}
+
+
+    def _refill(self, state: dict) -> float:
+        """
+        Adds the tokens accumulated since the state was last updated.
+
+        Returns:
+            float: The current time.
+
+        """
+
+        now = self._clock()
+        elapsed = max(now - state["updated"], 0)
+        state["tokens"] = min(state["tokens"] + elapsed * state["rate"],
+                              self.burst)
+        state["updated"] = now
+
+        return now
+
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Gives exclusive access to the limiter's state.
+
+        """
+
+        with self._lock:
+            yield self._state
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    This class is a RateLimiter whose state is kept in a file, so that every
+    process using the same path shares one bucket. Access is serialized with
+    an advisory lock on the file, which must therefore be on a local file
+    system. The default clock is the Unix time, which all processes agree on.
+
+    Requires a POSIX platform.
+
+    Attributes:
+        path (str): The path of the state file.
+
+    """
+
+    def __init__(self, path: str, rate: float, burst: int = 1,
+                 min_rate: float = None, increase: float = None,
+                 clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Constructs a new FileRateLimiter, creating its state file if needed.
+
+        Args:
+            path (str): The path of the state file.
+            rate (float): The highest rate, in requests per second.
+            burst (int): The bucket's capacity. Defaults to 1.
+            min_rate (Optional[float]): The lowest rate throttling can reduce
+                it to. Defaults to a tenth of `rate`.
+            increase (Optional[float]): How much each successful request
+                raises the rate. Defaults to a twentieth of `rate`.
+            clock (Callable[[], float]): Returns the current time in seconds.
+                Defaults to time.time.
+            sleep (Callable[[float], None]): Sleeps for a number of seconds.
+                Defaults to time.sleep.
+
+        Raises:
+            ImportError: If the platform does not support file locking.
+
+        """
+
+        if fcntl is None:
+            raise ImportError("FileRateLimiter requires fcntl, which is not "
+                              "available on this platform")
+
+        self.path = path
+        super().__init__(rate, burst=burst, min_rate=min_rate,
+                         increase=increase, clock=clock, sleep=sleep)
+
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Gives exclusive access to the state file, reading the state before
+        and writing it back after.
+
+        """
+
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+
+                with os.fdopen(os.dup(fd), "r+") as file:
+                    try:
+                        state = json.load(file)
+                    except ValueError:
+                        state = self._initial_state()
+
+                    yield state
+
+                    file.seek(0)
+                    file.truncate()
+                    json.dump(state, file)
+            finally:
+                os.close(fd)
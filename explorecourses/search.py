@@ -0,0 +1,356 @@
+"""
+This module implements SearchIndex, an in-memory inverted index that answers
+keyword searches over courses without contacting Explore Courses.
+"""
+
+import math
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Set, Tuple
+
+from explorecourses.classes import Course
+from explorecourses.filter_index import _ACTIVE, course_filters, satisfies
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# How much an occurrence of a token in each field counts towards its
+# frequency in a course.
+_TITLE_WEIGHT = 3
+_CODE_WEIGHT = 3
+_INSTRUCTOR_WEIGHT = 2
+_DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lowercase alphanumeric tokens.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        List[str]: The text's tokens, in order.
+
+    """
+
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def _terms(course: Course) -> Dict[str, int]:
+    """
+    Computes the weighted frequency of each token in a course's title,
+    description, subject and code, and instructor names.
+
+    """
+
+    terms = {}
+
+    def count(text, weight):
+        for token in tokenize(text):
+            terms[token] = terms.get(token, 0) + weight
+
+    count(course.title, _TITLE_WEIGHT)
+    count(course.description, _DESCRIPTION_WEIGHT)
+
+    # Listings are searched both as a whole (e.g., "cs106a") and in parts.
+    count(f"{course.subject} {course.code}", _CODE_WEIGHT)
+    count(f"{course.subject}{course.code}", _CODE_WEIGHT)
+
+    names = {instr.name for section in course.sections
+             for schedule in section.schedules
+             for instr in schedule.instructors}
+    names.update(instr.first_name for section in course.sections
+                 for schedule in section.schedules
+                 for instr in schedule.instructors)
+    for name in names:
+        count(name, _INSTRUCTOR_WEIGHT)
+
+    return terms
+
+
+class SearchIndex(object):
+    """
+    This class answers keyword searches over courses using an inverted index
+    of their titles, descriptions, subjects and codes, and instructor names,
+    ranking results with BM25.
+
+    A course matches a query if every query token occurs in it. The last
+    token also matches any token it is a prefix of, so partial queries typed
+    into a search box (e.g., "linear alg") find results. Courses are
+    identified by their course ID and academic year, so adding a course
+    again replaces its previous version.
+
+    Attributes:
+        k1 (float): The BM25 term frequency saturation parameter.
+        b (float): The BM25 length normalization parameter.
+
+    """
+
+    def __init__(self, courses: Iterable[Course] = (), k1: float = 1.2,
+                 b: float = 0.75):
+        """
+        Constructs a new SearchIndex.
+
+        Args:
+            courses (Iterable[Course]): The courses to index. Defaults to
+                none.
+            k1 (float): The BM25 term frequency saturation parameter.
+                Defaults to 1.2.
+            b (float): The BM25 length normalization parameter. Defaults to
+                0.75.
+
+        """
+
+        self.k1 = k1
+        self.b = b
+
+        self._courses = {}
+        self._order = {}
+        self._added = 0
+        self._terms = {}
+        self._filters = {}
+        self._lengths = {}
+        self._total_length = 0
+        self._postings = {}
+        self._vocabulary = []
+
+        self.add(courses)
+
+
+    def add(self, courses: Iterable[Course]):
+        """
+        Adds courses to the index, replacing any indexed versions of them.
+
+        Args:
+            courses (Iterable[Course]): The courses to add.
+
+        """
+
+        for course in courses:
+            key = self._key(course)
+            if key in self._courses:
+                self._discard(key)
+
+            terms = _terms(course)
+
+            self._courses[key] = course
+            self._order[key] = self._added
+            self._added += 1
+            self._terms[key] = terms
+            self._filters[key] = frozenset(course_filters(course))
+            self._lengths[key] = sum(terms.values())
+            self._total_length += self._lengths[key]
+
+            for token, frequency in terms.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    insort(self._vocabulary, token)
+                postings[key] = frequency
+
+
+    def update(self, courses: Iterable[Course]):
+        """
+        Replaces the indexed versions of courses with new ones. Equivalent to
+        `add`.
+
+        Args:
+            courses (Iterable[Course]): The new versions of the courses.
+
+        """
+
+        self.add(courses)
+
+
+    def remove(self, courses: Iterable[Course]):
+        """
+        Removes courses from the index. Courses that are not indexed are
+        ignored.
+
+        Args:
+            courses (Iterable[Course]): The courses to remove.
+
+        """
+
+        for course in courses:
+            key = self._key(course)
+            if key in self._courses:
+                self._discard(key)
+
+
+    def search(self, query: str, *filters: str,
+               year=None) -> List[Tuple[Course, float]]:
+        """
+        Searches the index.
+
+        Args:
+            query (str): The search query.
+            *filters (str): Search query filters, evaluated as in
+                FilterIndex.
+            year (Optional[str]): The academic year within which to search
+                (e.g., "2017-2018"). Defaults to None, which searches every
+                indexed year.
+
+        Returns:
+            List[Tuple[Course, float]]: The matching courses and their
+                scores, best first, with ties in insertion order. An empty 
+                query matches every course with a score of 0.
+
+        """
+
+        groups = self._expand(tokenize(query))
+
+        if groups:
+            candidates = self._candidates(groups)
+        else:
+            candidates = list(self._courses)
+
+        if year is not None:
+            candidates = [key for key in candidates if key[1] == year]
+        if filters:
+            candidates = [key for key in candidates
+                          if satisfies(self._filters[key], filters)]
+
+        scores = self._scores(groups, candidates)
+        order = self._order
+        ranked = sorted(candidates, key=lambda key: (-scores[key], order[key]))
+
+        return [(self._courses[key], scores[key]) for key in ranked]
+
+
+    def get_courses_by_query(self, query: str, *filters: str,
+                             year=None) -> List[Course]:
+        """
+        Gets all indexed courses matched by a search query, with the same
+        signature and results as CourseConnection.get_courses_by_query, which
+        only returns active courses.
+
+        Args:
+            query (str): The search query.
+            *filters (str): Search query filters, in addition to the active 
+                course status filter.
+            year (Optional[str]): The academic year within which to retrieve
+                courses (e.g., "2017-2018"). Defaults to None.
+
+        Returns:
+            List[Course]: The courses matching the search query, best first.
+
+        """
+
+        return [course for course, _ in self.search(query, _ACTIVE, *filters,
+                                                    year=year)]
+
+
+    def __len__(self):
+        return len(self._courses)
+
+
+    def __contains__(self, course: Course):
+        return self._key(course) in self._courses
+
+
+    @staticmethod
+    def _key(course: Course) -> Tuple[int, str]:
+        """
+        Gets the key identifying a course in the index.
+
+        """
+
+        return course.course_id, course.year
+
+
+    def _discard(self, key: Tuple[int, str]):
+        """
+        Removes an indexed course, dropping tokens that no longer occur in
+        any course from the vocabulary.
+
+        """
+
+        for token in self._terms.pop(key):
+            postings = self._postings[token]
+            del postings[key]
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+        del self._courses[key]
+        del self._order[key]
+        del self._filters[key]
+        self._total_length -= self._lengths.pop(key)
+
+
+    def _expand(self, tokens: List[str]) -> List[Set[str]]:
+        """
+        Expands each query token into the indexed tokens it matches: itself,
+        and for the last token, every token it is a prefix of.
+
+        """
+
+        groups = [{token} for token in tokens]
+
+        if tokens:
+            prefix = tokens[-1]
+            i = bisect_left(self._vocabulary, prefix)
+            while (i < len(self._vocabulary)
+                   and self._vocabulary[i].startswith(prefix)):
+                groups[-1].add(self._vocabulary[i])
+                i += 1
+
+        return groups
+
+
+    def _candidates(self, groups: List[Set[str]]) -> List[Tuple[int, str]]:
+        """
+        Finds the courses containing at least one token of every group, in
+        no particular order.
+
+        """
+
+        matches = []
+        for group in groups:
+            keys = set()
+            for token in group:
+                keys.update(self._postings.get(token, ()))
+            matches.append(keys)
+
+        matches.sort(key=len)
+
+        return list(matches[0].intersection(*matches[1:]))
+
+
+    def _scores(self, groups: List[Set[str]],
+                keys: List[Tuple[int, str]]) -> Dict[Tuple[int, str], float]:
+        """
+        Computes the BM25 score of each course for the tokens in the groups.
+
+        """
+
+        scores = dict.fromkeys(keys, 0.0)
+        if not scores:
+            return scores
+
+        n = len(self._courses)
+        average = self._total_length / n
+        k1, b = self.k1, self.b
+
+        for token in set().union(*groups):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (n - len(postings) + 0.5)
+                           / (len(postings) + 0.5))
+
+            if len(postings) < len(scores):
+                matches = [(key, frequency)
+                           for key, frequency in postings.items()
+                           if key in scores]
+            else:
+                matches = [(key, postings[key]) for key in scores
+                           if key in postings]
+
+            for key, frequency in matches:
+                norm = k1 * (1 - b + b * self._lengths[key] / average)
+                scores[key] += idf * frequency * (k1 + 1) / (frequency + norm)
+
+        return scores
@@ -0,0 +1,144 @@
+"""
+This module implements request coalescing ("single flight"): while a call
+for a key is in progress, further calls for the same key wait for it and
+share its result instead of repeating the work.
+
+Includes:
+    - SingleFlight, for threads
+    - AsyncSingleFlight, for asyncio
+
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(object):
+    """
+    This class coalesces concurrent calls made from different threads.
+
+    """
+
+    def __init__(self):
+        """
+        Constructs a new SingleFlight.
+
+        """
+
+        self._lock = threading.Lock()
+        self._calls = {}
+
+
+    def do(self, key: Hashable, fn: Callable[[], T],
+           timeout: float = None) -> T:
+        """
+        Calls a function unless a call for the same key is already in
+        progress, in which case that call's outcome is shared.
+
+        Args:
+            key (Hashable): Identifies calls that can be shared.
+            fn (Callable[[], T]): The function to call.
+            timeout (Optional[float]): The longest time to wait for a call
+                made by another thread, in seconds. Defaults to None.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            concurrent.futures.TimeoutError: If another thread's call does
+                not finish within the timeout.
+            Exception: Whatever the call raised.
+
+        """
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(timeout)
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return future.result()
+
+
+    def __len__(self):
+        """
+        Returns the number of calls in progress.
+
+        """
+
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight(object):
+    """
+    This class coalesces concurrent calls made from coroutines running on
+    one event loop.
+
+    """
+
+    def __init__(self):
+        """
+        Constructs a new AsyncSingleFlight.
+
+        """
+
+        self._calls = {}
+
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]],
+                 timeout: float = None) -> T:
+        """
+        Awaits a coroutine function unless a call for the same key is
+        already in progress, in which case that call's outcome is shared.
+
+        The call runs as its own task, so cancelling one of the callers
+        waiting on it, or one of them timing out, does not cancel it for the
+        others.
+
+        Args:
+            key (Hashable): Identifies calls that can be shared.
+            fn (Callable[[], Awaitable[T]]): The coroutine function to call.
+            timeout (Optional[float]): The longest time to wait for the call,
+                in seconds. Defaults to None.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            asyncio.TimeoutError: If the call does not finish within the
+                timeout.
+            Exception: Whatever the call raised.
+
+        """
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+    def __len__(self):
+        """
+        Returns the number of calls in progress.
+
+        """
+
+        return len(self._calls)
@@ -0,0 +1,630 @@
+"""
+This module implements CatalogStore, an offline copy of the course catalog
+kept in a normalized SQLite database.
+"""
+
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from explorecourses.classes import Course, Section, Schedule, Instructor, \
+                                   Attribute, Tag, LearningObjective
+from explorecourses.interning import Interner
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY,
+    course_id INTEGER NOT NULL,
+    year TEXT,
+    subject TEXT,
+    code TEXT,
+    title TEXT,
+    description TEXT,
+    gers TEXT,
+    repeatable INTEGER,
+    grading_basis TEXT,
+    units_min INTEGER,
+    units_max INTEGER,
+    final_exam INTEGER,
+    active INTEGER,
+    offer_num TEXT,
+    academic_group TEXT,
+    academic_org TEXT,
+    academic_career TEXT,
+    max_units_repeat INTEGER,
+    max_times_repeat INTEGER
+);
+CREATE TABLE IF NOT EXISTS objectives (
+    course INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    code TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS tags (
+    course INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    organization TEXT,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    course INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    class_id INTEGER NOT NULL,
+    term TEXT,
+    units TEXT,
+    section_num TEXT,
+    component TEXT,
+    curr_class_size INTEGER,
+    max_class_size INTEGER,
+    curr_waitlist_size INTEGER,
+    max_waitlist_size INTEGER,
+    notes TEXT
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    course INTEGER REFERENCES courses(id) ON DELETE CASCADE,
+    section INTEGER REFERENCES sections(id) ON DELETE CASCADE,
+    name TEXT,
+    value TEXT,
+    description TEXT,
+    catalog_print INTEGER,
+    schedule_print INTEGER
+);
+CREATE TABLE IF NOT EXISTS schedules (
+    id INTEGER PRIMARY KEY,
+    section INTEGER NOT NULL REFERENCES sections(id) ON DELETE CASCADE,
+    start_date TEXT,
+    end_date TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    location TEXT,
+    days TEXT
+);
+CREATE TABLE IF NOT EXISTS instructors (
+    schedule INTEGER NOT NULL REFERENCES schedules(id) ON DELETE CASCADE,
+    name TEXT,
+    first_name TEXT,
+    middle_name TEXT,
+    last_name TEXT,
+    sunet_id TEXT,
+    is_primary_instructor INTEGER
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS courses_course_id_year
+    ON courses (course_id, year);
+CREATE INDEX IF NOT EXISTS courses_subject_code_year
+    ON courses (subject, code, year);
+CREATE INDEX IF NOT EXISTS objectives_course ON objectives (course);
+CREATE INDEX IF NOT EXISTS tags_course ON tags (course);
+CREATE INDEX IF NOT EXISTS sections_course ON sections (course);
+CREATE INDEX IF NOT EXISTS sections_class_id ON sections (class_id);
+CREATE INDEX IF NOT EXISTS sections_term ON sections (term);
+CREATE INDEX IF NOT EXISTS attributes_course ON attributes (course);
+CREATE INDEX IF NOT EXISTS attributes_section ON attributes (section);
+CREATE INDEX IF NOT EXISTS schedules_section ON schedules (section);
+CREATE INDEX IF NOT EXISTS instructors_schedule ON instructors (schedule);
+CREATE INDEX IF NOT EXISTS instructors_sunet_id ON instructors (sunet_id);
+"""
+
+# The maximum number of parameters bound in a single IN (...) clause.
+_BATCH_SIZE = 500
+
+
+def _new(cls: type, **fields):
+    """
+    Creates an instance of a catalog class from its field values rather than
+    from an XML element.
+
+    Args:
+        cls (type): The class to instantiate.
+        **fields: The value of each of the instance's attributes.
+
+    Returns:
+        The new instance.
+
+    """
+
+    obj = cls.__new__(cls)
+    for name, value in fields.items():
+        # Bypasses the immutability of instructors, attributes and tags.
+        object.__setattr__(obj, name, value)
+
+    return obj
+
+
+def _flag(value: Optional[int]) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+class CatalogStore(object):
+    """
+    This class stores courses, with their sections, schedules and
+    instructors, in a normalized SQLite database so that catalog questions
+    can be answered from local disk without contacting Explore Courses.
+
+    Courses are identified by their course ID and academic year; saving a
+    course that is already stored replaces it.
+
+    Attributes:
+        path (str): The path of the database file.
+
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Constructs a new CatalogStore, creating its database if needed.
+
+        Args:
+            path (str): The path of the database file. Defaults to
+                ":memory:", an in-memory database.
+
+        """
+
+        self.path = path
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.executescript(_SCHEMA)
+
+
+    def save(self, courses: Iterable[Course]):
+        """
+        Stores courses and everything they contain in a single transaction,
+        replacing any stored copies of the same courses.
+
+        Args:
+            courses (Iterable[Course]): The courses to store.
+
+        """
+
+        # Later copies of a course replace earlier ones.
+        courses = list({(c.course_id, c.year): c for c in courses}.values())
+
+        # Row IDs are assigned here rather than by SQLite so that child rows
+        # can reference their parents while still being bulk inserted.
+        rows = {table: [] for table in ("courses", "objectives", "tags",
+                                        "sections", "attributes", "schedules",
+                                        "instructors")}
+
+        with self._lock, self._db:
+            ids = self._next_ids()
+
+            self._db.executemany(
+                "DELETE FROM courses WHERE course_id = ? AND year IS ?",
+                [(c.course_id, c.year) for c in courses]
+            )
+
+            for course in courses:
+                ids["courses"] += 1
+                course_row = ids["courses"]
+                rows["courses"].append((
+                    course_row, course.course_id, course.year, course.subject,
+                    course.code, course.title, course.description,
+                    ", ".join(course.gers), course.repeatable,
+                    course.grading_basis, course.units_min, course.units_max,
+                    course.final_exam, course.active, course.offer_num,
+                    course.academic_group, course.academic_org,
+                    course.academic_career, course.max_units_repeat,
+                    course.max_times_repeat
+                ))
+
+                rows["objectives"].extend((course_row, o.code, o.description)
+                                          for o in course.objectives)
+                rows["tags"].extend((course_row, t.organization, t.name)
+                                    for t in course.tags)
+                rows["attributes"].extend(
+                    (course_row, None) + self._attribute_row(a)
+                    for a in course.attributes
+                )
+
+                for section in course.sections:
+                    ids["sections"] += 1
+                    section_row = ids["sections"]
+                    rows["sections"].append((
+                        section_row, course_row, section.class_id,
+                        section.term, section.units, section.section_num,
+                        section.component, section.curr_class_size,
+                        section.max_class_size, section.curr_waitlist_size,
+                        section.max_waitlist_size, section.notes
+                    ))
+                    rows["attributes"].extend(
+                        (None, section_row) + self._attribute_row(a)
+                        for a in section.attributes
+                    )
+
+                    for schedule in section.schedules:
+                        ids["schedules"] += 1
+                        schedule_row = ids["schedules"]
+                        rows["schedules"].append((
+                            schedule_row, section_row, schedule.start_date,
+                            schedule.end_date, schedule.start_time,
+                            schedule.end_time, schedule.location,
+                            " ".join(schedule.days)
+                        ))
+                        rows["instructors"].extend(
+                            (schedule_row, i.name, i.first_name,
+                             i.middle_name, i.last_name, i.sunet_id,
+                             i.is_primary_instructor)
+                            for i in schedule.instructors
+                        )
+
+            for table, table_rows in rows.items():
+                if table_rows:
+                    marks = ", ".join("?" * len(table_rows[0]))
+                    self._db.executemany(
+                        f"INSERT INTO {table} VALUES ({marks})", table_rows
+                    )
+
+
+    def update(self, courses: Iterable[Course]):
+        """
+        Replaces the stored copies of courses with new ones. Equivalent to
+        `save`.
+
+        Args:
+            courses (Iterable[Course]): The new versions of the courses.
+
+        """
+
+        self.save(courses)
+
+
+    def remove(self, courses: Iterable[Course]):
+        """
+        Deletes courses and everything they contain in a single transaction.
+        Courses that are not stored are ignored.
+
+        Args:
+            courses (Iterable[Course]): The courses to delete.
+
+        """
+
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM courses WHERE course_id = ? AND year IS ?",
+                [(c.course_id, c.year) for c in courses]
+            )
+
+
+    def get_course(self, course_id: int, year=None) -> Optional[Course]:
+        """
+        Gets a stored course by ID.
+
+        Args:
+            course_id (int): The unique ID of the course.
+            year (Optional[str]): The academic year of the course (e.g.,
+                "2017-2018"). Defaults to None, which selects the most recent
+                stored year.
+
+        Returns:
+            Course: The course if it is stored, None otherwise.
+
+        """
+
+        query = "SELECT * FROM courses WHERE course_id = ?"
+        params = [course_id]
+        if year is not None:
+            query += " AND year = ?"
+            params.append(year)
+        query += " ORDER BY year DESC LIMIT 1"
+
+        courses = self._select_courses(query, params)
+
+        return courses[0] if courses else None
+
+
+    def get_courses(self, subject: str, code: str = None,
+                    year=None) -> List[Course]:
+
+        """
+        Gets the stored courses of a subject, optionally narrowed by code and
+        academic year.
+
+        Args:
+            subject (str): The academic subject (e.g., "MATH").
+            code (Optional[str]): The code listing (e.g., "51"). Defaults to
+                None.
+            year (Optional[str]): The academic year (e.g., "2017-2018").
+                Defaults to None.
+
+        Returns:
+            List[Course]: The matching courses, ordered by code and year.
+
+        """
+
+        query = "SELECT * FROM courses WHERE subject = ?"
+        params = [subject]
+        if code is not None:
+            query += " AND code = ?"
+            params.append(code)
+        if year is not None:
+            query += " AND year = ?"
+            params.append(year)
+        query += " ORDER BY code, year"
+
+        return self._select_courses(query, params)
+
+
+    def get_course_by_class_id(self, class_id: int) -> Optional[Course]:
+        """
+        Gets the stored course that a section belongs to.
+
+        Args:
+            class_id (int): The unique ID of the section.
+
+        Returns:
+            Course: The section's course if it is stored, None otherwise.
+
+        """
+
+        courses = self._select_courses(
+            "SELECT * FROM courses WHERE id IN "
+            "(SELECT course FROM sections WHERE class_id = ?) "
+            "ORDER BY year DESC LIMIT 1", [class_id]
+        )
+
+        return courses[0] if courses else None
+
+
+    def get_section(self, class_id: int) -> Optional[Section]:
+        """
+        Gets a stored section by ID.
+
+        Args:
+            class_id (int): The unique ID of the section.
+
+        Returns:
+            Section: The section if it is stored, None otherwise.
+
+        """
+
+        course = self.get_course_by_class_id(class_id)
+        if course is None:
+            return None
+
+        return next(s for s in course.sections if s.class_id == class_id)
+
+
+    def get_courses_by_instructor(self, sunet_id: str) -> List[Course]:
+        """
+        Gets the stored courses with a section taught by an instructor.
+
+        Args:
+            sunet_id (str): The instructor's SUNet ID.
+
+        Returns:
+            List[Course]: The instructor's courses, ordered by subject, code
+                and year.
+
+        """
+
+        return self._select_courses(
+            "SELECT * FROM courses WHERE id IN "
+            "(SELECT sections.course FROM instructors "
+            "JOIN schedules ON schedules.id = instructors.schedule "
+            "JOIN sections ON sections.id = schedules.section "
+            "WHERE instructors.sunet_id = ?) "
+            "ORDER BY subject, code, year", [sunet_id]
+        )
+
+
+    def get_courses_by_term(self, term: str) -> List[Course]:
+        """
+        Gets the stored courses with a section offered during a term.
+
+        Args:
+            term (str): The year and quarter (e.g., "2017-2018 Autumn").
+
+        Returns:
+            List[Course]: The term's courses, ordered by subject, code and
+                year.
+
+        """
+
+        return self._select_courses(
+            "SELECT * FROM courses WHERE id IN "
+            "(SELECT course FROM sections WHERE term = ?) "
+            "ORDER BY subject, code, year", [term]
+        )
+
+
+    def get_all_courses(self, year=None) -> List[Course]:
+        """
+        Gets every stored course, optionally within one academic year.
+
+        Args:
+            year (Optional[str]): The academic year (e.g., "2017-2018").
+                Defaults to None.
+
+        Returns:
+            List[Course]: The stored courses, ordered by subject, code and
+                year.
+
+        """
+
+        if year is None:
+            return self._select_courses(
+                "SELECT * FROM courses ORDER BY subject, code, year", []
+            )
+
+        return self._select_courses(
+            "SELECT * FROM courses WHERE year = ? ORDER BY subject, code",
+            [year]
+        )
+
+
+    def __len__(self):
+        """
+        Returns the number of stored courses.
+
+        """
+
+        with self._lock:
+            count = self._db.execute("SELECT COUNT(*) FROM courses")
+            return count.fetchone()[0]
+
+
+    def close(self):
+        """
+        Closes the database.
+
+        """
+
+        with self._lock:
+            self._db.close()
+
+
+    @staticmethod
+    def _attribute_row(attr: Attribute) -> tuple:
+        return (attr.name, attr.value, attr.description, attr.catalog_print,
+                attr.schedule_print)
+
+
+    def _next_ids(self) -> Dict[str, int]:
+        """
+        Gets the largest row ID in use by each table with generated IDs.
+
+        """
+
+        return {table: self._db.execute(
+                    f"SELECT COALESCE(MAX(id), 0) FROM {table}"
+                ).fetchone()[0]
+                for table in ("courses", "sections", "schedules")}
+
+
+    def _select_children(self, query: str, ids: List[int]) -> List[tuple]:
+        """
+        Runs a query selecting rows whose parent ID is in a list, binding the
+        IDs in batches.
+
+        Args:
+            query (str): The query, with "{}" in place of the ID list.
+            ids (List[int]): The parent IDs.
+
+        Returns:
+            List[tuple]: The selected rows.
+
+        """
+
+        rows = []
+        for i in range(0, len(ids), _BATCH_SIZE):
+            batch = ids[i:i + _BATCH_SIZE]
+            marks = ", ".join("?" * len(batch))
+            rows.extend(self._db.execute(query.format(marks), batch))
+
+        return rows
+
+
+    def _select_courses(self, query: str, params: list) -> List[Course]:
+        """
+        Runs a query selecting course rows and reconstructs those courses
+        along with everything they contain.
+
+        Args:
+            query (str): The query selecting whole rows of `courses`.
+            params (list): The query's parameters.
+
+        Returns:
+            List[Course]: The reconstructed courses, in query order.
+
+        """
+
+        with self._lock:
+            course_rows = self._db.execute(query, params).fetchall()
+            course_ids = [row[0] for row in course_rows]
+
+            objectives = self._select_children(
+                "SELECT course, code, description FROM objectives "
+                "WHERE course IN ({}) ORDER BY rowid", course_ids
+            )
+            tags = self._select_children(
+                "SELECT course, organization, name FROM tags "
+                "WHERE course IN ({}) ORDER BY rowid", course_ids
+            )
+            course_attrs = self._select_children(
+                "SELECT course, name, value, description, catalog_print, "
+                "schedule_print FROM attributes "
+                "WHERE course IN ({}) ORDER BY rowid", course_ids
+            )
+            section_rows = self._select_children(
+                "SELECT * FROM sections WHERE course IN ({}) ORDER BY id",
+                course_ids
+            )
+
+            section_ids = [row[0] for row in section_rows]
+            section_attrs = self._select_children(
+                "SELECT section, name, value, description, catalog_print, "
+                "schedule_print FROM attributes "
+                "WHERE section IN ({}) ORDER BY rowid", section_ids
+            )
+            schedule_rows = self._select_children(
+                "SELECT * FROM schedules WHERE section IN ({}) ORDER BY id",
+                section_ids
+            )
+
+            schedule_ids = [row[0] for row in schedule_rows]
+            instructor_rows = self._select_children(
+                "SELECT * FROM instructors WHERE schedule IN ({}) "
+                "ORDER BY rowid", schedule_ids
+            )
+
+        def group(rows, parent, build):
+            groups = {}
+            for row in rows:
+                groups.setdefault(row[parent], []).append(build(row))
+            return groups
+
+        # Equal instructors, attributes and tags share one object, as they
+        # do when parsed.
+        intern = Interner().intern
+
+        def attribute(r):
+            return intern(_new(
+                Attribute, name=r[1], value=r[2], description=r[3],
+                catalog_print=bool(r[4]), schedule_print=bool(r[5])
+            ))
+
+        instructors = group(instructor_rows, 0, lambda r: intern(_new(
+            Instructor, name=r[1], first_name=r[2], middle_name=r[3],
+            last_name=r[4], sunet_id=r[5],
+            is_primary_instructor=bool(r[6])
+        )))
+        def schedule(r):
+            obj = _new(
+                Schedule, start_date=r[2], end_date=r[3], start_time=r[4],
+                end_time=r[5], location=r[6], days=tuple(r[7].split()),
+                instructors=tuple(instructors.get(r[0], ()))
+            )
+            obj._parse_numbers()
+            return obj
+
+        schedules = group(schedule_rows, 1, schedule)
+        section_attrs = group(section_attrs, 0, attribute)
+        sections = group(section_rows, 1, lambda r: _new(
+            Section, class_id=r[2], term=r[3], units=r[4], section_num=r[5],
+            component=r[6], curr_class_size=r[7], max_class_size=r[8],
+            curr_waitlist_size=r[9], max_waitlist_size=r[10], notes=r[11],
+            schedules=tuple(schedules.get(r[0], ())),
+            attributes=tuple(section_attrs.get(r[0], ()))
+        ))
+        objectives = group(objectives, 0, lambda r: _new(
+            LearningObjective, code=r[1], description=r[2]
+        ))
+        tags = group(tags, 0, lambda r: intern(_new(
+            Tag, organization=r[1], name=r[2]
+        )))
+        course_attrs = group(course_attrs, 0, attribute)
+
+        return [_new(
+            Course, _elem=None, _interner=None, course_id=r[1], year=r[2],
+            subject=r[3], code=r[4], title=r[5], description=r[6],
+            gers=tuple(r[7].split(", ")), repeatable=bool(r[8]),
+            grading_basis=r[9], units_min=r[10], units_max=r[11],
+            final_exam=_flag(r[12]), active=_flag(r[13]),
+            offer_num=r[14], academic_group=r[15], academic_org=r[16],
+            academic_career=r[17], max_units_repeat=r[18],
+            max_times_repeat=r[19],
+            objectives=tuple(objectives.get(r[0], ())),
+            sections=tuple(sections.get(r[0], ())),
+            tags=tuple(tags.get(r[0], ())),
+            attributes=tuple(course_attrs.get(r[0], ()))
+        ) for r in course_rows]
@@ -0,0 +1,457 @@
+"""
+This module implements incremental catalog synchronization: comparing a
+fresh fetch of courses against a snapshot and describing the differences as
+change events, so that downstream indexes and stores only apply deltas.
+
+Includes:
+    - SectionChange
+    - CourseChange
+    - ChangeSet
+    - CatalogSync
+
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from explorecourses.classes import Course, Section
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+# The course fields compared when looking for modifications. Sections are
+# compared separately, one class ID at a time.
+_COURSE_FIELDS = tuple(name for name in Course.__slots__
+                       if not name.startswith("_")) + \
+                 ("objectives", "tags", "attributes")
+
+# The section fields compared when looking for modifications. Schedules are
+# compared separately from their instructors.
+_SECTION_FIELDS = tuple(name for name in Section.__slots__
+                        if name != "schedules")
+
+
+def _value(value):
+    """
+    Converts a field value into plain tuples so that copies of the same
+    catalog objects compare equal.
+
+    """
+
+    if isinstance(value, tuple):
+        return tuple(_value(item) for item in value)
+
+    slots = getattr(type(value), "__slots__", None)
+    if slots:
+        return tuple(_value(getattr(value, name)) for name in slots)
+
+    return value
+
+
+def _schedules(section: Section) -> tuple:
+    """
+    Gets a comparable value for a section's schedules, ignoring instructors.
+
+    """
+
+    return tuple(_value((s.start_date, s.end_date, s.start_time, s.end_time,
+                        s.location, s.days)) for s in section.schedules)
+
+
+def _instructors(section: Section) -> tuple:
+    """
+    Gets a comparable value for the instructors of a section's schedules.
+
+    """
+
+    return tuple(_value(s.instructors) for s in section.schedules)
+
+
+class SectionChange(object):
+    """
+    This class represents a change to one section of a course.
+
+    Attributes:
+        kind (str): ADDED, REMOVED, or MODIFIED.
+        class_id (int): The unique ID of the section.
+        old (Optional[Section]): The section before the change, or None if it
+            was added.
+        new (Optional[Section]): The section after the change, or None if it
+            was removed.
+        fields (Tuple[str]): The names of the fields that changed (e.g.,
+            "curr_class_size"), including "schedules" for changes to meeting
+            times or places and "instructors" for changes to instructors.
+            Empty unless the section was modified.
+
+    """
+
+    __slots__ = ("kind", "class_id", "old", "new", "fields")
+
+    def __init__(self, kind: str, class_id: int, old: Optional[Section],
+                 new: Optional[Section], fields: Tuple[str] = ()):
+        """
+        Constructs a new SectionChange.
+
+        Args:
+            kind (str): ADDED, REMOVED, or MODIFIED.
+            class_id (int): The unique ID of the section.
+            old (Optional[Section]): The section before the change.
+            new (Optional[Section]): The section after the change.
+            fields (Tuple[str]): The names of the fields that changed.
+                Defaults to none.
+
+        """
+
+        self.kind = kind
+        self.class_id = class_id
+        self.old = old
+        self.new = new
+        self.fields = fields
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the SectionChange that includes
+        its kind, the section's class ID, and any changed fields.
+
+        """
+
+        fields = f" ({', '.join(self.fields)})" if self.fields else ""
+        return f"section {self.class_id} {self.kind}{fields}"
+
+
+class CourseChange(object):
+    """
+    This class represents a change to one course.
+
+    Attributes:
+        kind (str): ADDED, REMOVED, or MODIFIED.
+        course_id (int): The unique ID of the course.
+        old (Optional[Course]): The course before the change, or None if it
+            was added.
+        new (Optional[Course]): The course after the change, or None if it
+            was removed.
+        fields (Tuple[str]): The names of the course's own fields that
+            changed (e.g., "title"). Empty unless the course was modified.
+        sections (Tuple[SectionChange]): The changes to the course's
+            sections. Empty unless the course was modified.
+
+    """
+
+    __slots__ = ("kind", "course_id", "old", "new", "fields", "sections")
+
+    def __init__(self, kind: str, course_id: int, old: Optional[Course],
+                 new: Optional[Course], fields: Tuple[str] = (),
+                 sections: Tuple[SectionChange] = ()):
+        """
+        Constructs a new CourseChange.
+
+        Args:
+            kind (str): ADDED, REMOVED, or MODIFIED.
+            course_id (int): The unique ID of the course.
+            old (Optional[Course]): The course before the change.
+            new (Optional[Course]): The course after the change.
+            fields (Tuple[str]): The names of the course's own fields that
+                changed. Defaults to none.
+            sections (Tuple[SectionChange]): The changes to the course's
+                sections. Defaults to none.
+
+        """
+
+        self.kind = kind
+        self.course_id = course_id
+        self.old = old
+        self.new = new
+        self.fields = fields
+        self.sections = sections
+
+
+    @property
+    def course(self) -> Course:
+        """
+        Course: The latest version of the course.
+
+        """
+
+        return self.old if self.new is None else self.new
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the CourseChange that includes
+        its kind, the course's listing, and any changed fields and sections.
+
+        """
+
+        course = self.course
+        lines = [f"{course.subject}{course.code} ({self.course_id}) "
+                 f"{self.kind}"]
+        if self.fields:
+            lines[0] += f" ({', '.join(self.fields)})"
+        lines.extend(f"  {section}" for section in self.sections)
+
+        return "\n".join(lines)
+
+
+def diff_course(old: Course, new: Course) -> Optional[CourseChange]:
+    """
+    Compares two versions of a course.
+
+    Args:
+        old (Course): The course before the change.
+        new (Course): The course after the change.
+
+    Returns:
+        Optional[CourseChange]: A MODIFIED change, or None if the versions
+            are identical.
+
+    """
+
+    fields = tuple(name for name in _COURSE_FIELDS
+                   if _value(getattr(old, name)) != _value(getattr(new, name)))
+
+    old_sections = {section.class_id: section for section in old.sections}
+    new_sections = {section.class_id: section for section in new.sections}
+    sections = []
+
+    for class_id, section in new_sections.items():
+        previous = old_sections.get(class_id)
+        if previous is None:
+            sections.append(SectionChange(ADDED, class_id, None, section))
+            continue
+
+        changed = [name for name in _SECTION_FIELDS
+                   if _value(getattr(previous, name))
+                   != _value(getattr(section, name))]
+        if _schedules(previous) != _schedules(section):
+            changed.append("schedules")
+        if _instructors(previous) != _instructors(section):
+            changed.append("instructors")
+
+        if changed:
+            sections.append(SectionChange(MODIFIED, class_id, previous,
+                                          section, tuple(changed)))
+
+    sections.extend(SectionChange(REMOVED, class_id, section, None)
+                    for class_id, section in old_sections.items()
+                    if class_id not in new_sections)
+
+    if not fields and not sections:
+        return None
+
+    return CourseChange(MODIFIED, new.course_id, old, new, fields,
+                        tuple(sections))
+
+
+class ChangeSet(object):
+    """
+    This class represents the changes between two versions of a catalog.
+
+    Attributes:
+        changes (Tuple[CourseChange]): The changes, one per changed course.
+
+    """
+
+    __slots__ = ("changes",)
+
+    def __init__(self, changes: Iterable[CourseChange] = ()):
+        """
+        Constructs a new ChangeSet.
+
+        Args:
+            changes (Iterable[CourseChange]): The changes. Defaults to none.
+
+        """
+
+        self.changes = tuple(changes)
+
+
+    @property
+    def added(self) -> List[Course]:
+        """
+        List[Course]: The courses that were added.
+
+        """
+
+        return [c.new for c in self.changes if c.kind == ADDED]
+
+
+    @property
+    def removed(self) -> List[Course]:
+        """
+        List[Course]: The courses that were removed, as they last were.
+
+        """
+
+        return [c.old for c in self.changes if c.kind == REMOVED]
+
+
+    @property
+    def modified(self) -> List[Course]:
+        """
+        List[Course]: The new versions of the courses that were modified.
+
+        """
+
+        return [c.new for c in self.changes if c.kind == MODIFIED]
+
+
+    def apply(self, target):
+        """
+        Applies the changes to an index or store of the old catalog, such as
+        a SearchIndex or CatalogStore, leaving it holding the new catalog.
+
+        Args:
+            target: An object with `remove(courses)` and `update(courses)`
+                methods.
+
+        """
+
+        removed = self.removed
+        if removed:
+            target.remove(removed)
+
+        updated = self.added + self.modified
+        if updated:
+            target.update(updated)
+
+
+    def __iter__(self):
+        return iter(self.changes)
+
+
+    def __len__(self):
+        return len(self.changes)
+
+
+    def __str__(self):
+        """
+        Returns a string representation of the ChangeSet that lists each
+        change.
+
+        """
+
+        return "\n".join(str(change) for change in self.changes)
+
+
+def diff(old: Iterable[Course], new: Iterable[Course]) -> ChangeSet:
+    """
+    Compares two versions of a catalog. Courses are matched by course ID and
+    academic year, and their sections by class ID.
+
+    Args:
+        old (Iterable[Course]): The courses before the change.
+        new (Iterable[Course]): The courses after the change.
+
+    Returns:
+        ChangeSet: The changes between the versions.
+
+    """
+
+    old = {(c.course_id, c.year): c for c in old}
+    new = {(c.course_id, c.year): c for c in new}
+
+    return ChangeSet(_changes(old, new, old.keys() - new.keys()))
+
+
+def _changes(old: Dict[tuple, Course], new: Dict[tuple, Course],
+             removed: Iterable[tuple]) -> List[CourseChange]:
+    """
+    Computes the changes from the courses in `old` to those in `new`, given
+    the keys of the courses that were removed.
+
+    """
+
+    changes = []
+
+    for key, course in new.items():
+        previous = old.get(key)
+        if previous is None:
+            changes.append(CourseChange(ADDED, course.course_id, None, course))
+        elif previous is not course:
+            change = diff_course(previous, course)
+            if change is not None:
+                changes.append(change)
+
+    changes.extend(CourseChange(REMOVED, old[key].course_id, old[key], None)
+                   for key in removed)
+
+    return changes
+
+
+class CatalogSync(object):
+    """
+    This class keeps a snapshot of the catalog, compares fresh fetches
+    against it, and forwards the resulting changes to indexes and stores so
+    that they are refreshed in proportion to what changed.
+
+    Attributes:
+        targets (List): The indexes and stores kept in sync, each with
+            `remove(courses)` and `update(courses)` methods.
+
+    """
+
+    def __init__(self, courses: Iterable[Course] = (), targets: Iterable = ()):
+        """
+        Constructs a new CatalogSync.
+
+        Args:
+            courses (Iterable[Course]): The initial snapshot, which targets
+                are assumed to already hold. Defaults to none.
+            targets (Iterable): The indexes and stores to keep in sync.
+                Defaults to none.
+
+        """
+
+        self.targets = list(targets)
+        self._snapshot = {(c.course_id, c.year): c for c in courses}
+
+
+    @property
+    def courses(self) -> List[Course]:
+        """
+        List[Course]: The courses in the snapshot.
+
+        """
+
+        return list(self._snapshot.values())
+
+
+    def sync(self, courses: Iterable[Course],
+             subjects: Iterable[str] = None) -> ChangeSet:
+        """
+        Compares a fresh fetch against the snapshot, applies the changes to
+        every target, and replaces the snapshot.
+
+        Args:
+            courses (Iterable[Course]): The freshly fetched courses.
+            subjects (Optional[Iterable[str]]): The subjects covered by the
+                fetch (e.g., ["CS"] after get_courses_by_department("CS")),
+                so that courses of other subjects are not considered
+                removed. Defaults to None, meaning the fetch covers the
+                whole catalog.
+
+        Returns:
+            ChangeSet: The changes since the previous sync.
+
+        """
+
+        new = {(c.course_id, c.year): c for c in courses}
+
+        if subjects is None:
+            removed = self._snapshot.keys() - new.keys()
+        else:
+            subjects = set(subjects)
+            removed = [key for key, course in self._snapshot.items()
+                       if course.subject in subjects and key not in new]
+
+        changes = ChangeSet(_changes(self._snapshot, new, removed))
+
+        for key in removed:
+            del self._snapshot[key]
+        self._snapshot.update(new)
+
+        for target in self.targets:
+            changes.apply(target)
+
+        return changes
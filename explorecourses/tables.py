@@ -0,0 +1,532 @@
+"""
+This module implements columnar views of courses and sections backed by NumPy
+arrays, for vectorized analytics over whole catalogs.
+
+Includes:
+    - StringColumn
+    - CourseTable
+    - SectionTable
+    - ScheduleTable
+
+NumPy is required (`pip install explorecourses[tables]`); pandas is only
+needed for `to_pandas` (`pip install explorecourses[pandas]`).
+
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from explorecourses.classes import Course, Schedule, date_to_ordinal, \
+                                   days_to_mask, time_to_minutes
+
+
+class StringColumn(object):
+    """
+    This class represents a dictionary-encoded column of strings.
+
+    Attributes:
+        codes (np.ndarray): The int32 index of each row's value in
+            `categories`, or -1 for a missing value.
+        categories (Tuple[str]): The distinct values, in order of first
+            appearance.
+
+    """
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        """
+        Constructs a new StringColumn by encoding a sequence of strings.
+
+        Args:
+            values (Iterable[Optional[str]]): The column's values, where None
+                marks a missing value.
+
+        """
+
+        index = {}
+        codes = [-1 if value is None else index.setdefault(value, len(index))
+                 for value in values]
+
+        self.codes = np.array(codes, dtype=np.int32)
+        self.categories = tuple(index)
+
+
+    def __len__(self):
+        return len(self.codes)
+
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code < 0 else self.categories[code]
+
+
+    def decode(self) -> List[Optional[str]]:
+        """
+        Decodes the column back into strings.
+
+        Returns:
+            List[Optional[str]]: The value of each row.
+
+        """
+
+        return [None if code < 0 else self.categories[code]
+                for code in self.codes.tolist()]
+
+
+    def isin(self, values: Iterable[str]) -> np.ndarray:
+        """
+        Tests which rows hold one of the given values, without decoding.
+
+        Args:
+            values (Iterable[str]): The values to test for.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows.
+
+        """
+
+        wanted = set(values)
+        matches = [i for i, value in enumerate(self.categories)
+                   if value in wanted]
+
+        return np.isin(self.codes, matches)
+
+
+    def to_pandas(self):
+        """
+        Converts the column into a pandas Categorical. pandas stores codes
+        in the smallest integer type that fits the categories, so they are
+        copied.
+
+        Returns:
+            pd.Categorical: The column as a categorical.
+
+        """
+
+        import pandas as pd
+
+        return pd.Categorical.from_codes(self.codes, categories=self.categories)
+
+
+class _Table(object):
+    """
+    This class is the base of the columnar tables. Each subclass declares its
+    columns in `_COLUMNS` as (name, dtype) pairs, where a dtype of None marks a
+    dictionary-encoded string column. Columns are available as attributes.
+
+    """
+
+    _COLUMNS = ()
+
+    def __init__(self, rows: Iterable[tuple]):
+        """
+        Constructs a new table from rows of values in `_COLUMNS` order.
+
+        Args:
+            rows (Iterable[tuple]): The table's rows.
+
+        """
+
+        rows = list(rows)
+        values = zip(*rows) if rows else [()] * len(self._COLUMNS)
+
+        self.columns = {}
+        for (name, dtype), column in zip(self._COLUMNS, values):
+            if dtype is None:
+                self.columns[name] = StringColumn(column)
+            else:
+                self.columns[name] = np.array(column, dtype=dtype)
+
+        self._len = len(rows)
+
+
+    def __getattr__(self, name: str):
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no "
+                                 f"attribute '{name}'") from None
+
+
+    def __len__(self):
+        return self._len
+
+
+    def to_pandas(self):
+        """
+        Converts the table into a pandas DataFrame. Numeric columns are
+        passed through without copying and string columns become
+        categoricals, whose codes are copied.
+
+        Returns:
+            pd.DataFrame: The table as a data frame.
+
+        """
+
+        import pandas as pd
+
+        data = {name: (column.to_pandas() if isinstance(column, StringColumn)
+                       else column)
+                for name, column in self.columns.items()}
+
+        return pd.DataFrame(data, copy=False)
+
+
+class CourseTable(_Table):
+    """
+    This class represents courses as columns, one row per course.
+
+    Attributes:
+        course_id (np.ndarray): The unique ID of each course (int64).
+        year (StringColumn): The academic year of each course.
+        subject (StringColumn): The academic subject of each course.
+        code (StringColumn): The code listing of each course.
+        title (StringColumn): The full title of each course.
+        units_min (np.ndarray): The minimum units of each course (int32).
+        units_max (np.ndarray): The maximum units of each course (int32).
+        academic_career (StringColumn): The academic career of each course.
+
+    """
+
+    _COLUMNS = (
+        ("course_id", np.int64),
+        ("year", None),
+        ("subject", None),
+        ("code", None),
+        ("title", None),
+        ("units_min", np.int32),
+        ("units_max", np.int32),
+        ("academic_career", None),
+    )
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[Course]) -> "CourseTable":
+        """
+        Constructs a new CourseTable from Course objects.
+
+        Args:
+            courses (Iterable[Course]): The courses.
+
+        Returns:
+            CourseTable: The courses as columns.
+
+        """
+
+        return cls((c.course_id, c.year, c.subject, c.code, c.title,
+                    c.units_min, c.units_max, c.academic_career)
+                   for c in courses)
+
+
+    @classmethod
+    def from_xml(cls, elem) -> "CourseTable":
+        """
+        Constructs a new CourseTable directly from a search response, without
+        constructing Course objects.
+
+        Args:
+            elem (Element): The response's root XML element.
+
+        Returns:
+            CourseTable: The response's courses as columns.
+
+        """
+
+        def row(course):
+            admin = course.find("administrativeInformation")
+            return (int(admin.findtext("courseId")), course.findtext("year"),
+                    course.findtext("subject"), course.findtext("code"),
+                    course.findtext("title"), int(course.findtext("unitsMin")),
+                    int(course.findtext("unitsMax")),
+                    admin.findtext("academicCareer"))
+
+        return cls(row(course) for course in elem.iter("course"))
+
+
+class SectionTable(_Table):
+    """
+    This class represents sections as columns, one row per section.
+
+    Attributes:
+        class_id (np.ndarray): The unique ID of each section (int64).
+        course_id (np.ndarray): The ID of each section's course (int64).
+        term (StringColumn): The term of each section.
+        component (StringColumn): The type of each section (e.g., LEC).
+        section_num (StringColumn): The number of each section.
+        units (StringColumn): The units each section is offered for.
+        curr_class_size (np.ndarray): The number of students enrolled (int32).
+        max_class_size (np.ndarray): The maximum number of students (int32).
+        curr_waitlist_size (np.ndarray): The number of students on the
+            waitlist (int32).
+        max_waitlist_size (np.ndarray): The maximum number of students on the
+            waitlist (int32).
+
+    """
+
+    _COLUMNS = (
+        ("class_id", np.int64),
+        ("course_id", np.int64),
+        ("term", None),
+        ("component", None),
+        ("section_num", None),
+        ("units", None),
+        ("curr_class_size", np.int32),
+        ("max_class_size", np.int32),
+        ("curr_waitlist_size", np.int32),
+        ("max_waitlist_size", np.int32),
+    )
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[Course]) -> "SectionTable":
+        """
+        Constructs a new SectionTable from the sections of Course objects.
+
+        Args:
+            courses (Iterable[Course]): The courses.
+
+        Returns:
+            SectionTable: The courses' sections as columns.
+
+        """
+
+        return cls((s.class_id, c.course_id, s.term, s.component,
+                    s.section_num, s.units, s.curr_class_size,
+                    s.max_class_size, s.curr_waitlist_size,
+                    s.max_waitlist_size)
+                   for c in courses for s in c.sections)
+
+
+    @classmethod
+    def from_xml(cls, elem) -> "SectionTable":
+        """
+        Constructs a new SectionTable directly from a search response, without
+        constructing Course or Section objects.
+
+        Args:
+            elem (Element): The response's root XML element.
+
+        Returns:
+            SectionTable: The sections of the response's courses as columns.
+
+        """
+
+        def rows():
+            for course in elem.iter("course"):
+                admin = course.find("administrativeInformation")
+                course_id = int(admin.findtext("courseId"))
+
+                for s in course.find("sections"):
+                    yield (int(s.findtext("classId")), course_id,
+                           s.findtext("term"), s.findtext("component"),
+                           s.findtext("sectionNumber"), s.findtext("units"),
+                           int(s.findtext("currentClassSize")),
+                           int(s.findtext("maxClassSize")),
+                           int(s.findtext("currentWaitlistSize")),
+                           int(s.findtext("maxWaitlistSize")))
+
+        return cls(rows())
+
+
+    def fill_rate(self) -> np.ndarray:
+        """
+        Computes the fraction of each section's capacity that is enrolled.
+
+        Returns:
+            np.ndarray: The fill rate of each section, or NaN for sections
+                without a capacity.
+
+        """
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = self.curr_class_size / self.max_class_size
+
+        return np.where(self.max_class_size > 0, rate, np.nan)
+
+
+def _number(value: Optional[int]) -> int:
+    """
+    Converts a missing numeric schedule field into -1.
+
+    """
+
+    return -1 if value is None else value
+
+
+class ScheduleTable(_Table):
+    """
+    This class represents schedules as columns, one row per schedule, with
+    times, days and dates in the numeric form of Schedule's numeric fields,
+    so that time-window and overlap queries over a whole catalog are a few
+    integer comparisons and bitwise ANDs.
+
+    Attributes:
+        class_id (np.ndarray): The ID of each schedule's section (int64).
+        course_id (np.ndarray): The ID of each schedule's course (int64).
+        start_minutes (np.ndarray): The start time in minutes after
+            midnight, or -1 if missing (int16).
+        end_minutes (np.ndarray): The end time in minutes after midnight, or
+            -1 if missing (int16).
+        day_mask (np.ndarray): The days of the week the schedule meets, with
+            bit i set for WEEKDAYS[i] (uint8).
+        start_ordinal (np.ndarray): The start date as a proleptic Gregorian
+            ordinal, or -1 if missing (int32).
+        end_ordinal (np.ndarray): The end date as a proleptic Gregorian
+            ordinal, or -1 if missing (int32).
+        location (StringColumn): The location of each schedule.
+
+    """
+
+    _COLUMNS = (
+        ("class_id", np.int64),
+        ("course_id", np.int64),
+        ("start_minutes", np.int16),
+        ("end_minutes", np.int16),
+        ("day_mask", np.uint8),
+        ("start_ordinal", np.int32),
+        ("end_ordinal", np.int32),
+        ("location", None),
+    )
+
+    @classmethod
+    def from_courses(cls, courses: Iterable[Course]) -> "ScheduleTable":
+        """
+        Constructs a new ScheduleTable from the schedules of Course objects.
+
+        Args:
+            courses (Iterable[Course]): The courses.
+
+        Returns:
+            ScheduleTable: The courses' schedules as columns.
+
+        """
+
+        return cls((s.class_id, c.course_id, _number(sched.start_minutes),
+                    _number(sched.end_minutes), sched.day_mask,
+                    _number(sched.start_ordinal), _number(sched.end_ordinal),
+                    sched.location)
+                   for c in courses for s in c.sections
+                   for sched in s.schedules)
+
+
+    @classmethod
+    def from_xml(cls, elem) -> "ScheduleTable":
+        """
+        Constructs a new ScheduleTable directly from a search response,
+        without constructing Course, Section or Schedule objects.
+
+        Args:
+            elem (Element): The response's root XML element.
+
+        Returns:
+            ScheduleTable: The schedules of the response's courses as
+                columns.
+
+        """
+
+        def rows():
+            for course in elem.iter("course"):
+                admin = course.find("administrativeInformation")
+                course_id = int(admin.findtext("courseId"))
+
+                for s in course.find("sections"):
+                    class_id = int(s.findtext("classId"))
+
+                    for sched in s.find("schedules"):
+                        yield (
+                            class_id, course_id,
+                            _number(time_to_minutes(
+                                sched.findtext("startTime"))),
+                            _number(time_to_minutes(
+                                sched.findtext("endTime"))),
+                            days_to_mask(sched.findtext("days").split()),
+                            _number(date_to_ordinal(
+                                sched.findtext("startDate"))),
+                            _number(date_to_ordinal(
+                                sched.findtext("endDate"))),
+                            sched.findtext("location"),
+                        )
+
+        return cls(rows())
+
+
+    def meets_on(self, *days: str) -> np.ndarray:
+        """
+        Finds the schedules that meet on any of the given days.
+
+        Args:
+            *days (str): The names of the days (e.g., "Monday").
+
+        Returns:
+            np.ndarray: A boolean mask over the rows.
+
+        """
+
+        return (self.day_mask & days_to_mask(days)) != 0
+
+
+    def within(self, start: int, end: int) -> np.ndarray:
+        """
+        Finds the schedules that start and end within a time window.
+
+        Args:
+            start (int): The start of the window, in minutes after midnight.
+            end (int): The end of the window, in minutes after midnight.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows. Schedules missing a
+                time are never within the window.
+
+        """
+
+        return ((self.start_minutes >= start) & (self.end_minutes >= 0) &
+                (self.end_minutes <= end))
+
+
+    def active_on(self, ordinal: int) -> np.ndarray:
+        """
+        Finds the schedules whose range of dates includes a date.
+
+        Args:
+            ordinal (int): The date, as returned by
+                datetime.date.toordinal.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows. Schedules missing a
+                date are assumed to span every date.
+
+        """
+
+        return (((self.start_ordinal < 0) | (self.start_ordinal <= ordinal)) &
+                ((self.end_ordinal < 0) | (self.end_ordinal >= ordinal)))
+
+
+    def overlaps(self, schedule: Schedule) -> np.ndarray:
+        """
+        Finds the schedules that overlap a schedule, as defined by
+        Schedule.overlaps.
+
+        Args:
+            schedule (Schedule): The schedule to compare against.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows.
+
+        """
+
+        if schedule.start_minutes is None or schedule.end_minutes is None:
+            return np.zeros(len(self), dtype=bool)
+
+        mask = ((self.day_mask & schedule.day_mask) != 0)
+        mask &= (self.start_minutes >= 0) & (self.end_minutes >= 0)
+        mask &= ((self.start_minutes < schedule.end_minutes) &
+                 (self.end_minutes > schedule.start_minutes))
+
+        if schedule.end_ordinal is not None:
+            mask &= ((self.start_ordinal < 0) |
+                     (self.start_ordinal <= schedule.end_ordinal))
+        if schedule.start_ordinal is not None:
+            mask &= ((self.end_ordinal < 0) |
+                     (self.end_ordinal >= schedule.start_ordinal))
+
+        return mask
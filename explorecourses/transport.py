@@ -0,0 +1,534 @@
+"""
+This module implements transports that CourseConnection can send its
+requests through in place of a requests session, for testing and
+benchmarking without the network.
+
+Includes:
+    - RecordingTransport, which saves the responses of a live session
+    - ReplayTransport, which serves saved responses from disk
+    - MemoryTransport, which serves responses held in memory
+    - StandInServer, a local HTTP server that serves saved responses with
+      configurable latency and injected errors
+
+Responses are saved gzip-compressed in a directory, keyed by request path and
+query string parameters, so recordings made against Explore Courses can be
+replayed against any base URL.
+
+"""
+
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from explorecourses.cache import request_key, write_atomic
+
+# The response headers that are saved and replayed.
+_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class RecordedResponse(object):
+    """
+    This class is a response served from a recording, supporting the parts
+    of the requests.Response interface that CourseConnection uses.
+
+    Attributes:
+        url (str): The requested URL.
+        status_code (int): The HTTP status.
+        headers (dict): The response headers.
+        content (bytes): The response body.
+
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict,
+                 content: bytes):
+        """
+        Constructs a new RecordedResponse.
+
+        Args:
+            url (str): The requested URL.
+            status_code (int): The HTTP status.
+            headers (dict): The response headers.
+            content (bytes): The response body.
+
+        """
+
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+
+    def iter_content(self, chunk_size: int = 1):
+        """
+        Yields the response body in chunks.
+
+        Args:
+            chunk_size (int): The size of each chunk. Defaults to 1.
+
+        Yields:
+            bytes: The next chunk of the body.
+
+        """
+
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+
+    def raise_for_status(self):
+        """
+        Raises an error if the response has an error status.
+
+        Raises:
+            requests.HTTPError: If the status is 400 or above.
+
+        """
+
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error for url: "
+                                     f"{self.url}", response=self)
+
+
+    def close(self):
+        pass
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _key(url: str, params: Optional[dict]) -> str:
+    """
+    Computes the key of a request's recording from its path and parameters.
+
+    """
+
+    return request_key(urlsplit(url).path or "/", dict(params or {}))
+
+
+def save(directory: str, url: str, params: Optional[dict], headers: dict,
+         content: bytes):
+    """
+    Saves a response to a recordings directory.
+
+    Args:
+        directory (str): The recordings directory.
+        url (str): The requested URL.
+        params (Optional[dict]): The query string parameters.
+        headers (dict): The response headers.
+        content (bytes): The response body.
+
+    """
+
+    path = os.path.join(directory, _key(url, params))
+    meta = {
+        "path": urlsplit(url).path,
+        "params": dict(params or {}),
+        "headers": {name: headers[name] for name in _HEADERS
+                    if headers.get(name) is not None},
+    }
+
+    write_atomic(path + ".xml.gz", gzip.compress(content))
+    write_atomic(path + ".json", json.dumps(meta).encode())
+
+
+def load(directory: str, url: str,
+         params: Optional[dict]) -> Optional[Tuple[dict, bytes]]:
+    """
+    Loads a response from a recordings directory.
+
+    Args:
+        directory (str): The recordings directory.
+        url (str): The requested URL.
+        params (Optional[dict]): The query string parameters.
+
+    Returns:
+        Optional[Tuple[dict, bytes]]: The response headers and body, or None
+            if the request was not recorded.
+
+    """
+
+    path = os.path.join(directory, _key(url, params))
+
+    try:
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        with gzip.open(path + ".xml.gz") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+
+    return meta["headers"], content
+
+
+def _not_modified(request_headers: Optional[dict], headers: dict) -> bool:
+    """
+    Tests whether a conditional request's validators match a recording.
+
+    """
+
+    request_headers = request_headers or {}
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+
+    return ((etag is not None
+             and request_headers.get("If-None-Match") == etag) or
+            (last_modified is not None
+             and request_headers.get("If-Modified-Since") == last_modified))
+
+
+class RecordingTransport(object):
+    """
+    This class sends requests through a live session and saves every
+    successful response.
+
+    Example:
+        connection = CourseConnection(
+            transport=RecordingTransport("recordings")
+        )
+        connection.get_all_courses(year="2017-2018")
+
+    Attributes:
+        directory (str): The recordings directory.
+
+    """
+
+    def __init__(self, directory: str, session: requests.Session = None):
+        """
+        Constructs a new RecordingTransport, creating its directory if
+        needed.
+
+        Args:
+            directory (str): The recordings directory.
+            session (Optional[requests.Session]): The session requests are
+                sent through. Defaults to a new session.
+
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self._session = session or requests.Session()
+
+
+    def get(self, url: str, params: dict = None, headers: dict = None,
+            **kwargs) -> RecordedResponse:
+        """
+        Sends a GET request, saving the response if it succeeds. The
+        response is read in full before it is returned.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[dict]): The query string parameters.
+            headers (Optional[dict]): Extra request headers.
+            **kwargs: Options passed on to the session (e.g., `timeout`).
+
+        Returns:
+            RecordedResponse: The response.
+
+        """
+
+        with self._session.get(url, params=params, headers=headers,
+                               **kwargs) as res:
+            content = res.content
+            if res.status_code == 200:
+                save(self.directory, url, params, res.headers, content)
+
+            return RecordedResponse(url, res.status_code, dict(res.headers),
+                                    content)
+
+
+    def mount(self, prefix: str, adapter):
+        self._session.mount(prefix, adapter)
+
+
+    def close(self):
+        self._session.close()
+
+
+class ReplayTransport(object):
+    """
+    This class serves saved responses without the network. Requests that
+    were not recorded receive a 404 response, and conditional requests
+    matching a recording's validators receive a 304 response.
+
+    Attributes:
+        directory (str): The recordings directory.
+
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructs a new ReplayTransport.
+
+        Args:
+            directory (str): The recordings directory.
+
+        """
+
+        self.directory = directory
+
+
+    def get(self, url: str, params: dict = None, headers: dict = None,
+            **kwargs) -> RecordedResponse:
+        """
+        Serves a GET request from the recordings.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[dict]): The query string parameters.
+            headers (Optional[dict]): Extra request headers.
+            **kwargs: Ignored session options.
+
+        Returns:
+            RecordedResponse: The recorded response.
+
+        """
+
+        recording = self._load(url, params)
+        if recording is None:
+            return RecordedResponse(url, 404, {}, b"")
+
+        response_headers, content = recording
+        if _not_modified(headers, response_headers):
+            return RecordedResponse(url, 304, response_headers, b"")
+
+        return RecordedResponse(url, 200, response_headers, content)
+
+
+    def _load(self, url: str,
+              params: Optional[dict]) -> Optional[Tuple[dict, bytes]]:
+        """
+        Loads the recording of a request, as `load` does.
+
+        """
+
+        return load(self.directory, url, params)
+
+
+    def mount(self, prefix: str, adapter):
+        pass
+
+
+    def close(self):
+        pass
+
+
+class MemoryTransport(ReplayTransport):
+    """
+    This class serves responses added to it from memory, without the
+    network or the disk, and otherwise behaves like ReplayTransport. It is
+    meant for benchmarks, where reading recordings would be measured along
+    with the connection.
+
+    Attributes:
+        directory (None): Always None, as responses are not saved.
+
+    """
+
+    def __init__(self):
+        """
+        Constructs a new, empty MemoryTransport.
+
+        """
+
+        super().__init__(None)
+        self._recordings = {}
+
+
+    def add(self, url: str, params: Optional[dict], content: bytes,
+            headers: dict = None):
+        """
+        Adds the response to serve for a request, replacing any previous
+        one.
+
+        Args:
+            url (str): The requested URL.
+            params (Optional[dict]): The query string parameters.
+            content (bytes): The response body.
+            headers (Optional[dict]): The response headers. Defaults to
+                none.
+
+        """
+
+        self._recordings[_key(url, params)] = (
+            {name: headers[name] for name in _HEADERS
+             if (headers or {}).get(name) is not None},
+            content,
+        )
+
+
+    def _load(self, url: str,
+              params: Optional[dict]) -> Optional[Tuple[dict, bytes]]:
+        return self._recordings.get(_key(url, params))
+
+
+class StandInServer(object):
+    """
+    This class runs a local HTTP server in a background thread that serves
+    saved responses like Explore Courses would, so that connections, crawls
+    and caches can be exercised end to end over real sockets.
+
+    Example:
+        with StandInServer("recordings", latency=0.05) as server:
+            connection = CourseConnection(base_url=server.url)
+            connection.get_all_courses(year="2017-2018")
+
+    Attributes:
+        directory (str): The recordings directory.
+        latency (float): The delay before each response, in seconds.
+        error_rate (float): The fraction of requests answered with
+            `error_status` instead of their recording.
+        error_status (int): The status of injected errors.
+        requests (int): The number of requests received.
+
+    """
+
+    def __init__(self, directory: str, latency: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503,
+                 seed: int = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Constructs a new StandInServer.
+
+        Args:
+            directory (str): The recordings directory.
+            latency (float): The delay before each response, in seconds.
+                Defaults to 0.
+            error_rate (float): The fraction of requests answered with
+                `error_status`. Defaults to 0.
+            error_status (int): The status of injected errors. Defaults to
+                503.
+            seed (Optional[int]): The seed deciding which requests fail, so
+                runs are reproducible. Defaults to None.
+            host (str): The address to listen on. Defaults to "127.0.0.1".
+            port (int): The port to listen on. Defaults to 0, which picks a
+                free port.
+
+        """
+
+        self.directory = directory
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+
+    @property
+    def url(self) -> str:
+        """
+        str: The base URL of the server, ending with a slash.
+
+        """
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+
+    def start(self):
+        """
+        Starts serving in a background thread.
+
+        """
+
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        """
+        Stops serving and closes the listening socket.
+
+        """
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+    def _fail(self) -> bool:
+        """
+        Decides whether to inject an error into the next response.
+
+        """
+
+        with self._lock:
+            self.requests += 1
+            return self._random.random() < self.error_rate
+
+
+    def _handler(self) -> type:
+        """
+        Creates the request handler class bound to this server.
+
+        """
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if server._fail():
+                    self._respond(server.error_status, {}, b"")
+                    return
+
+                parts = urlsplit(self.path)
+                params = dict(parse_qsl(parts.query, keep_blank_values=True))
+                recording = load(server.directory, parts.path, params)
+
+                if recording is None:
+                    self._respond(404, {}, b"")
+                    return
+
+                headers, content = recording
+                if _not_modified(self.headers, headers):
+                    self._respond(304, headers, b"")
+                else:
+                    self._respond(200, headers, content)
+
+
+            def _respond(self, status, headers, content):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
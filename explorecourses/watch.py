@@ -0,0 +1,317 @@
+"""
+This module implements EnrollmentWatcher, which polls Explore Courses for
+changes to the enrollment of a set of sections.
+"""
+
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+from explorecourses.classes import Course, Section
+from explorecourses.course_connection import CourseConnection
+from explorecourses.sync import MODIFIED, REMOVED, SectionChange
+
+# The section fields describing seat availability.
+_FIELDS = ("curr_class_size", "max_class_size", "curr_waitlist_size",
+           "max_waitlist_size")
+
+
+class _Watch(object):
+    """
+    This class holds the polling state of one watched section.
+
+    """
+
+    __slots__ = ("subject", "course", "section", "interval", "due")
+
+    def __init__(self, subject: str, due: float):
+        self.subject = subject
+        self.course = None
+        self.section = None
+        self.interval = None
+        self.due = due
+
+
+class EnrollmentWatcher(object):
+    """
+    This class watches the enrollment of sections and calls back when it
+    changes.
+
+    Sections are grouped by subject so that each poll fetches a whole
+    department in one request, however many of its sections are watched,
+    and a department is only fetched once one of its sections is due.
+    Nearly full sections, or sections with a waitlist, are polled every
+    `min_interval` seconds. Other sections start at `interval` seconds, and
+    every poll that finds no change doubles their interval up to
+    `max_interval`; any change resets it.
+
+    Attributes:
+        min_interval (float): The polling interval of nearly full sections,
+            in seconds.
+        interval (float): The initial polling interval of other sections, in
+            seconds.
+        max_interval (float): The longest polling interval, in seconds.
+        nearly_full (float): The fraction of capacity above which a section
+            is nearly full.
+
+    """
+
+    def __init__(self, connection: CourseConnection,
+                 callback: Callable[[Course, SectionChange], None],
+                 year=None, min_interval: float = 30, interval: float = 120,
+                 max_interval: float = 1800, nearly_full: float = 0.9,
+                 on_error: Callable[[str, Exception], None] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Constructs a new EnrollmentWatcher.
+
+        Args:
+            connection (CourseConnection): The connection used to poll.
+            callback (Callable[[Course, SectionChange], None]): Called with
+                a section's course and a MODIFIED change naming the fields
+                in `curr_class_size`, `max_class_size`, `curr_waitlist_size`
+                and `max_waitlist_size` that changed, or a REMOVED change if
+                the section is no longer listed, in which case it stops
+                being watched. Nothing is reported for the first poll of a
+                section.
+            year (Optional[str]): The academic year of the sections (e.g.,
+                "2017-2018"). Defaults to None.
+            min_interval (float): The polling interval of nearly full
+                sections, in seconds. Defaults to 30.
+            interval (float): The initial polling interval of other sections,
+                in seconds. Defaults to 120.
+            max_interval (float): The longest polling interval, in seconds.
+                Defaults to 1800.
+            nearly_full (float): The fraction of capacity above which a
+                section is nearly full. Defaults to 0.9.
+            on_error (Optional[Callable[[str, Exception], None]]): Called
+                with the subject and error when a department cannot be
+                fetched, after which it is retried with backoff. Defaults to
+                None, which raises the error from `poll` instead.
+            clock (Callable[[], float]): Returns the current time in seconds.
+                Defaults to time.monotonic.
+
+        """
+
+        self.min_interval = min_interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self.nearly_full = nearly_full
+
+        self._connection = connection
+        self._callback = callback
+        self._year = year
+        self._on_error = on_error
+        self._clock = clock
+
+        self._watches = {}
+        self._backoff = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+
+    def watch(self, subject: str, class_ids: Iterable[int]):
+        """
+        Starts watching sections. They are first polled by the next call to
+        `poll`.
+
+        Args:
+            subject (str): The subject the sections' course is listed under
+                (e.g., "CS").
+            class_ids (Iterable[int]): The class IDs of the sections.
+
+        """
+
+        now = self._clock()
+
+        with self._lock:
+            for class_id in class_ids:
+                if class_id not in self._watches:
+                    self._watches[class_id] = _Watch(subject, now)
+
+
+    def unwatch(self, class_ids: Iterable[int]):
+        """
+        Stops watching sections. Sections that are not watched are ignored.
+
+        Args:
+            class_ids (Iterable[int]): The class IDs of the sections.
+
+        """
+
+        with self._lock:
+            for class_id in class_ids:
+                self._watches.pop(class_id, None)
+
+
+    @property
+    def class_ids(self) -> List[int]:
+        """
+        List[int]: The class IDs of the watched sections.
+
+        """
+
+        with self._lock:
+            return list(self._watches)
+
+
+    def next_poll(self) -> Optional[float]:
+        """
+        Gets the time at which the next section is due to be polled.
+
+        Returns:
+            Optional[float]: The time, as returned by the clock, or None if
+                no sections are watched.
+
+        """
+
+        with self._lock:
+            return min((w.due for w in self._watches.values()), default=None)
+
+
+    def poll(self) -> List[str]:
+        """
+        Fetches every department with a section that is due, calling back
+        for any changes.
+
+        Returns:
+            List[str]: The subjects that were fetched.
+
+        Raises:
+            Exception: The error raised while fetching a department, if no
+                `on_error` callback was given.
+
+        """
+
+        now = self._clock()
+
+        with self._lock:
+            subjects = sorted({w.subject for w in self._watches.values()
+                               if w.due <= now})
+
+        for subject in subjects:
+            try:
+                courses = self._connection.get_courses_by_department(
+                    subject, year=self._year
+                )
+            except Exception as error:
+                self._defer(subject, now)
+                if self._on_error is None:
+                    raise
+                self._on_error(subject, error)
+            else:
+                self._update(subject, courses, now)
+
+        return subjects
+
+
+    def run(self):
+        """
+        Polls until `stop` is called, sleeping until the next section is
+        due in between.
+
+        """
+
+        self._stopped.clear()
+
+        while not self._stopped.is_set():
+            self.poll()
+
+            due = self.next_poll()
+            timeout = (self.max_interval if due is None
+                       else max(due - self._clock(), 0))
+            self._stopped.wait(timeout)
+
+
+    def stop(self):
+        """
+        Makes `run` return once its current poll finishes.
+
+        """
+
+        self._stopped.set()
+
+
+    def _update(self, subject: str, courses: List[Course], now: float):
+        """
+        Compares a department's sections against their last poll and
+        reschedules them.
+
+        """
+
+        found = {section.class_id: (course, section) for course in courses
+                 for section in course.sections}
+        changes = []
+
+        with self._lock:
+            self._backoff.pop(subject, None)
+
+            for class_id, watch in list(self._watches.items()):
+                if watch.subject != subject:
+                    continue
+
+                if class_id not in found:
+                    if watch.section is not None:
+                        changes.append((watch.course, SectionChange(
+                            REMOVED, class_id, watch.section, None
+                        )))
+                        del self._watches[class_id]
+                    else:
+                        watch.due = now + self.max_interval
+                    continue
+
+                course, section = found[class_id]
+                fields = () if watch.section is None else tuple(
+                    name for name in _FIELDS
+                    if getattr(watch.section, name) != getattr(section, name)
+                )
+
+                if fields:
+                    changes.append((course, SectionChange(
+                        MODIFIED, class_id, watch.section, section, fields
+                    )))
+
+                watch.interval = self._interval(section, watch.interval,
+                                                bool(fields))
+                watch.course = course
+                watch.section = section
+                watch.due = now + watch.interval
+
+        for course, change in changes:
+            self._callback(course, change)
+
+
+    def _interval(self, section: Section, previous: Optional[float],
+                  changed: bool) -> float:
+        """
+        Computes a section's next polling interval.
+
+        """
+
+        capacity = section.max_class_size
+        if (section.curr_waitlist_size > 0 or
+                capacity and section.curr_class_size >=
+                self.nearly_full * capacity):
+            return self.min_interval
+
+        if previous is None or changed:
+            return self.interval
+
+        return min(max(previous, self.interval) * 2, self.max_interval)
+
+
+    def _defer(self, subject: str, now: float):
+        """
+        Postpones the sections of a department that could not be fetched,
+        doubling the delay after each consecutive failure.
+
+        """
+
+        with self._lock:
+            delay = min(self._backoff.get(subject, self.min_interval / 2) * 2,
+                        self.max_interval)
+            self._backoff[subject] = delay
+
+            for watch in self._watches.values():
+                if watch.subject == subject:
+                    watch.due = now + delay
@@ -10,15 +10,21 @@ setuptools.setup(
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
     packages=setuptools.find_packages(),
+    python_requires='>=3.7',
     install_requires=[
         'requests>=2'
     ],
+    extras_require={
+        'lxml': ['lxml'],
+        'tables': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+    },
     setup_requires=["pytest-runner"],
     tests_require=["pytest"],
     classifiers=(
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ),
@@ -0,0 +1,174 @@
+"""
+Helpers for building Explore Courses XML responses and serving them without
+a network connection.
+"""
+
+
+def section_xml(class_id, term="2017-2018 Autumn", component="LEC",
+                curr_size=10, max_size=50, days="Monday Wednesday Friday",
+                start_time="11:30:00 AM", end_time="12:20:00 PM",
+                sunet="jchw", course_id=1):
+
+    return (
+        '<section>'
+        f'<classId>{class_id}</classId>'
+        f'<term>{term}</term>'
+        '<units>3</units>'
+        '<sectionNumber>01</sectionNumber>'
+        f'<component>{component}</component>'
+        f'<courseId>{course_id}</courseId>'
+        '<schedules>'
+        '<schedule>'
+        '<startDate>Sep 25, 2017</startDate>'
+        '<endDate>Dec 8, 2017</endDate>'
+        f'<startTime>{start_time}</startTime>'
+        f'<endTime>{end_time}</endTime>'
+        '<location>320-105</location>'
+        f'<days>{days}</days>'
+        '<instructors>'
+        '<instructor>'
+        '<name>Wilson, J.</name>'
+        '<firstName>Jenny</firstName>'
+        '<middleName/>'
+        '<lastName>Wilson</lastName>'
+        f'<sunet>{sunet}</sunet>'
+        '<role>PI</role>'
+        '</instructor>'
+        '</instructors>'
+        '</schedule>'
+        '</schedules>'
+        f'<currentClassSize>{curr_size}</currentClassSize>'
+        f'<maxClassSize>{max_size}</maxClassSize>'
+        '<currentWaitlistSize>0</currentWaitlistSize>'
+        '<maxWaitlistSize>0</maxWaitlistSize>'
+        '<notes/>'
+        '<attributes/>'
+        '</section>'
+    )
+
+
+def course_xml(course_id, subject="MATH", code="51", title="Calculus",
+               description="Linear algebra and calculus.",
+               gers="GER:DB-Math, WAY-FR", units_min=3, units_max=5,
+               career="UG", sections=None):
+
+    if sections is None:
+        sections = [section_xml(course_id * 10, course_id=course_id)]
+
+    return (
+        '<course>'
+        '<year>2017-2018</year>'
+        f'<subject>{subject}</subject>'
+        f'<code>{code}</code>'
+        f'<title>{title}</title>'
+        f'<description>{description}</description>'
+        f'<gers>{gers}</gers>'
+        '<repeatable>false</repeatable>'
+        '<grading>Letter or Credit/No Credit</grading>'
+        f'<unitsMin>{units_min}</unitsMin>'
+        f'<unitsMax>{units_max}</unitsMax>'
+        '<learningObjectives/>'
+        f'<sections>{"".join(sections)}</sections>'
+        '<administrativeInformation>'
+        f'<courseId>{course_id}</courseId>'
+        '<effectiveStatus>A</effectiveStatus>'
+        '<offerNumber>1</offerNumber>'
+        '<academicGroup>HS</academicGroup>'
+        f'<academicOrganization>{subject}</academicOrganization>'
+        f'<academicCareer>{career}</academicCareer>'
+        '<finalExamFlag>Y</finalExamFlag>'
+        '<maxUnitsRepeat>3</maxUnitsRepeat>'
+        '<maxTimesRepeat>1</maxTimesRepeat>'
+        '</administrativeInformation>'
+        '<attributes/>'
+        '<tags/>'
+        '</course>'
+    )
+
+
+def search_xml(courses):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xml>'
+        '<deptList/>'
+        f'<courses>{"".join(courses)}</courses>'
+        '</xml>'
+    ).encode()
+
+
+def schools_xml():
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<xml>'
+        '<academic_year>20172018</academic_year>'
+        '<schools>'
+        '<school name="School of Engineering">'
+        '<department longname="Computer Science" name="CS"/>'
+        '<department longname="Electrical Engineering" name="EE"/>'
+        '</school>'
+        '<school name="School of Humanities &amp; Sciences">'
+        '<department longname="Mathematics" name="MATH"/>'
+        '</school>'
+        '</schools>'
+        '</xml>'
+    ).encode()
+
+
+class FakeResponse(object):
+
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise IOError(f"HTTP {self.status_code}")
+
+
+    def close(self):
+        pass
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FakeSession(object):
+    """
+    Serves canned responses chosen by a function of the request URL and
+    parameters, recording every request made.
+
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        self.headers = []
+        self.timeouts = []
+
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        self.requests.append((url, dict(params or {})))
+        self.headers.append(headers)
+        self.timeouts.append(timeout)
+        res = self.respond(url, params or {})
+        return res if isinstance(res, FakeResponse) else FakeResponse(res)
+
+
+    def mount(self, prefix, adapter):
+        pass
+
+
+    def close(self):
+        pass
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from explorecourses import *
+from explorecourses import filters
+
+from tests.fixtures import FakeSession, course_xml, schools_xml, search_xml
+
+class TestAsyncCourseConnection(object):
+
+    @staticmethod
+    def respond(url, params):
+        if not url.endswith("search"):
+            return schools_xml()
+
+        code = params["q"]
+        return search_xml([course_xml(i, subject=code, code=str(i))
+                           for i in range(1, 4)])
+
+
+    def test_get_schools(self):
+        async def run():
+            async with AsyncCourseConnection() as connect:
+                connect._connection._session = FakeSession(self.respond)
+                return await connect.get_schools("2017-2018")
+
+        schools = asyncio.run(run())
+
+        assert [s.name for s in schools][0] == "School of Engineering"
+        assert all(isinstance(s, School) for s in schools)
+
+
+    def test_get_school(self):
+        async def run():
+            async with AsyncCourseConnection() as connect:
+                connect._connection._session = FakeSession(self.respond)
+                return (await connect.get_school("School of Engineering"),
+                        await connect.get_school("Nonexistent"))
+
+        school, missing = asyncio.run(run())
+
+        assert school.get_department("CS").name == "Computer Science"
+        assert missing is None
+
+
+    def test_get_courses_concurrently(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def respond(url, params):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return self.respond(url, params)
+
+        async def run():
+            async with AsyncCourseConnection(max_concurrency=3) as connect:
+                connect._connection._session = FakeSession(respond)
+                return await asyncio.gather(*(
+                    connect.get_courses_by_department(code, year="2017-2018")
+                    for code in ("CS", "EE", "MATH", "PHYSICS", "CHEM")
+                ))
+
+        results = asyncio.run(run())
+
+        assert [r[0].subject for r in results] == ["CS", "EE", "MATH", 
+                                                   "PHYSICS", "CHEM"]
+        assert all(len(r) == 3 for r in results)
+        assert in_flight[1] == 3
+
+
+    def test_single_flight(self):
+        session = FakeSession(self.respond)
+
+        async def run():
+            async with AsyncCourseConnection(single_flight=True) as connect:
+                connect._connection._session = session
+                return await asyncio.gather(*(
+                    connect.get_courses_by_department("CS", filters.AUTUMN)
+                    for _ in range(5)
+                ))
+
+        results = asyncio.run(run())
+
+        assert len(session.requests) == 1
+        assert all(r == results[0] and r is not results[0] 
+                   for r in results[1:])
+
+
+    def test_single_flight_timeout(self):
+        release = threading.Event()
+
+        def respond(url, params):
+            release.wait(5)
+            return self.respond(url, params)
+
+        session = FakeSession(respond)
+
+        async def run():
+            async with AsyncCourseConnection(single_flight=True) as connect:
+                connect._connection._session = session
+                leader = asyncio.ensure_future(
+                    connect.get_courses_by_department("CS")
+                )
+                await asyncio.sleep(0.01)
+
+                with pytest.raises(requests.Timeout):
+                    await connect.get_courses_by_department("CS", 
+                                                            timeout=0.05)
+                release.set()
+                return await leader
+
+        assert len(asyncio.run(run())) == 3
+        assert len(session.requests) == 1
+
+
+    def test_slot_timeout(self):
+        release = threading.Event()
+
+        def respond(url, params):
+            release.wait(5)
+            return self.respond(url, params)
+
+        async def run():
+            async with AsyncCourseConnection(max_concurrency=1) as connect:
+                connect._connection._session = FakeSession(respond)
+                busy = asyncio.ensure_future(
+                    connect.get_courses_by_department("CS")
+                )
+                await asyncio.sleep(0.01)
+
+                start = time.monotonic()
+                try:
+                    await connect.get_courses_by_department("EE",
+                                                            timeout=0.05)
+                except requests.Timeout:
+                    waited = time.monotonic() - start
+                release.set()
+                await busy
+                return waited
+
+        assert asyncio.run(run()) < 1
+
+
+    def test_get_directory_concurrently(self):
+        session = FakeSession(self.respond)
+
+        async def run():
+            async with AsyncCourseConnection() as connect:
+                connect._connection._session = session
+                return await asyncio.gather(*(
+                    connect.get_directory("2017-2018") for _ in range(4)
+                ))
+
+        directories = asyncio.run(run())
+
+        assert len(session.requests) == 1
+        assert all(d is directories[0] for d in directories)
+
+
+    def test_constructed_outside_loop(self):
+        connect = AsyncCourseConnection(max_concurrency=1)
+        connect._connection._session = FakeSession(self.respond)
+
+        async def run():
+            return await asyncio.gather(
+                connect.get_courses_by_department("CS"),
+                connect.get_courses_by_department("EE"),
+            )
+
+        # The connection can be used from more than one event loop.
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+
+        assert [len(r) for r in first] == [len(r) for r in second]
+        asyncio.run(connect.close())
+
+
+    def test_hooks(self):
+        calls = []
+
+        def hook(stats):
+            calls.append((stats, threading.current_thread()))
+
+        async def run():
+            async with AsyncCourseConnection() as connect:
+                connect._connection._session = FakeSession(self.respond)
+                connect.add_hook(hook)
+                return await connect.get_courses_by_department("CS")
+
+        courses = asyncio.run(run())
+
+        (stats, thread), = calls
+        assert stats.count == len(courses)
+        assert thread is not threading.main_thread()
@@ -0,0 +1,101 @@
+import pytest
+
+from explorecourses import *
+from explorecourses.cache import DiskCache, default_ttl, request_key, \
+                                write_atomic
+
+from tests.fixtures import FakeResponse, FakeSession, course_xml, search_xml
+
+class TestDiskCache(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml([course_xml(1), course_xml(2)])
+
+
+    def test_request_key(self):
+        a = {"q": "CS", "filter-term-Autumn": "on", "filter-ger-WAYFR": "on"}
+        b = {"filter-ger-WAYFR": "on", "q": "CS", "filter-term-Autumn": "on"}
+
+        assert request_key("url", a) == request_key("url", b)
+        assert request_key("url", a) != request_key("other", a)
+
+
+    def test_default_ttl(self):
+        assert default_ttl("2017-2018") is None
+        assert default_ttl("20172018") is None
+        assert default_ttl(None) > 0
+        assert default_ttl("3000-3001") > 0
+
+
+    def test_write_atomic(self, tmp_path):
+        path = tmp_path / "entry.xml"
+        write_atomic(str(path), b"first")
+        write_atomic(str(path), b"second")
+
+        assert path.read_bytes() == b"second"
+        assert [p.name for p in tmp_path.iterdir()] == ["entry.xml"]
+
+
+    def test_put_get(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+
+        assert cache.get("url", {"q": "CS"}) is None
+
+        cache.put("url", {"q": "CS"}, b"body", etag='"abc"')
+        entry = cache.get("url", {"q": "CS"})
+
+        assert entry.content == b"body"
+        assert entry.fresh == True
+        assert entry.validators == {"If-None-Match": '"abc"'}
+
+
+    @pytest.mark.parametrize("meta", ['{"etag": "\\"abc\\""}', '[]', 
+                                      '{"stored_at": null}', '{"stored'])
+    def test_malformed_metadata(self, tmp_path, meta):
+        cache = DiskCache(str(tmp_path))
+        cache.put("url", {"q": "CS"}, b"body")
+
+        path, = tmp_path.glob("*.json")
+        path.write_text(meta)
+
+        assert cache.get("url", {"q": "CS"}) is None
+
+
+    def test_connection_uses_cache(self, tmp_path):
+        connection = CourseConnection(cache=DiskCache(str(tmp_path)))
+        session = FakeSession(lambda url, params: self.content)
+        connection._session = session
+
+        first = connection.get_courses_by_department("MATH", year="2017-2018")
+        second = list(connection.iter_courses_by_department("MATH", 
+                                                            year="2017-2018"))
+
+        assert first == second
+        assert len(session.requests) == 1
+
+        # A new connection sharing the directory starts warm.
+        restarted = CourseConnection(cache=DiskCache(str(tmp_path)))
+        restarted._session = session
+        restarted.get_courses_by_department("MATH", year="2017-2018")
+
+        assert len(session.requests) == 1
+
+
+    def test_connection_revalidates(self, tmp_path):
+        connection = CourseConnection(cache=DiskCache(str(tmp_path), ttl=0))
+
+        def respond(url, params):
+            if session.headers[-1]:
+                assert session.headers[-1] == {"If-None-Match": '"v1"'}
+                return FakeResponse(b"", status_code=304)
+            return FakeResponse(self.content, headers={"ETag": '"v1"'})
+
+        session = FakeSession(respond)
+        connection._session = session
+
+        first = connection.get_courses_by_query("MATH")
+        second = connection.get_courses_by_query("MATH")
+
+        assert len(session.requests) == 2
+        assert first == second
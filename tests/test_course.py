@@ -1,4 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import pickle
+import sys
+import threading
 from xml.etree import ElementTree as ET
+import weakref
 
 import pytest
 
@@ -1250,3 +1256,118 @@ class TestCourse(object):
         with pytest.raises(TypeError):
             math20 >= 10
 
+
+
+    def test_course_pickle(self):
+        course = Course(self.xml_math20)
+        clone = pickle.loads(pickle.dumps(course))
+
+        assert clone == course
+        assert clone.title == course.title
+        assert clone.sections[0].class_id == course.sections[0].class_id
+        assert (str(clone.sections[0].schedules[0].instructors[0]) 
+                == str(course.sections[0].schedules[0].instructors[0]))
+
+
+    def test_course_slots(self):
+        course = Course(self.xml_math20)
+
+        assert not hasattr(course, "__dict__")
+        assert not hasattr(course.sections[0], "__dict__")
+        assert not hasattr(course.sections[0].schedules[0], "__dict__")
+        assert not hasattr(course.tags[0], "__dict__")
+
+
+    def test_lazy_course(self):
+        eager = Course(self.xml_math20)
+        lazy = Course(self.xml_math20, lazy=True)
+
+        assert lazy == eager
+        assert lazy.title == eager.title
+        assert lazy.units_max == eager.units_max
+        assert lazy.is_materialized == False
+
+        assert len(lazy.sections) == 8
+        assert lazy.sections is lazy.sections
+        assert lazy.is_materialized == False
+
+        assert len(lazy.objectives) == 1
+        assert len(lazy.tags) == 12
+        assert len(lazy.attributes) == 3
+        assert lazy.is_materialized == True
+
+
+    def test_lazy_course_pickle(self):
+        lazy = Course(self.xml_math20, lazy=True)
+        clone = pickle.loads(pickle.dumps(lazy))
+
+        assert clone.is_materialized == True
+        assert len(clone.sections) == 8
+
+
+    def test_course_missing_administrative_information(self):
+        elem = ET.fromstring(ET.tostring(self.xml_math20))
+        elem.remove(elem.find("administrativeInformation"))
+
+        with pytest.raises(ValueError, match="MATH 20"):
+            Course(elem)
+
+
+    def test_lazy_course_releases_response(self):
+        root = ET.fromstring(
+            "<xml><courses>" + ET.tostring(self.xml_math19).decode() 
+            + ET.tostring(self.xml_math20).decode() + "</courses></xml>"
+        )
+        elems = root.findall(".//course")
+        courses = [Course(elem, lazy=True) for elem in elems]
+        refs = [weakref.ref(root)] + [weakref.ref(elem) for elem in elems]
+
+        kept = courses[1]
+        del root, elems, courses
+        gc.collect()
+
+        # Only the retained course's own element survives.
+        assert [ref() is not None for ref in refs] == [False, False, True]
+        assert kept._elem is refs[2]()
+
+        assert len(kept.sections) == 8
+        kept._materialize()
+        gc.collect()
+
+        assert refs[2]() is None
+
+
+    def test_lazy_course_threads(self):
+        barrier = threading.Barrier(8)
+
+        def materialize(course):
+            barrier.wait()
+            return (course.objectives, course.sections, course.tags, 
+                    course.attributes)
+
+        # Switch threads as often as possible to interleave the builds.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                for _ in range(50):
+                    course = Course(self.xml_math20, lazy=True)
+                    results = list(executor.map(materialize, [course] * 8))
+
+                    assert course.is_materialized
+                    assert all([len(c) for c in r] == [1, 8, 12, 3] 
+                               for r in results)
+        finally:
+            sys.setswitchinterval(interval)
+
+
+    def test_lazy_course_build_after_release(self):
+        # A thread that checked a collection before another thread built the
+        # last one finds the element released, and gets the stored copy.
+        course = Course(self.xml_math20, lazy=True)
+        attributes = course.attributes
+        course._materialize()
+        assert course._elem is None
+
+        assert course._build("_attributes", "attributes", 
+                             Attribute) is attributes
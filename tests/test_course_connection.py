@@ -1,5 +1,17 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+import requests
+
 from explorecourses import *
 from explorecourses import filters
+from explorecourses.course_connection import _split_courses
+from explorecourses.rate_limit import RateLimiter
+
+from tests.fixtures import FakeResponse, FakeSession, course_xml, \
+                           schools_xml, search_xml, section_xml
 
 class TestCourseConnection(object):
 
@@ -42,3 +54,389 @@ class TestCourseConnection(object):
 
         assert len(courses) > 0
         assert ("WAY-FR" in courses[0].gers) == True
+
+
+class TestIterCourses(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml([course_xml(i, code=str(i)) 
+                                  for i in range(1, 51)])
+
+
+    def test_iter_courses_by_query(self):
+        connection = CourseConnection()
+        connection._session = FakeSession(lambda url, params: self.content)
+
+        courses = list(connection.iter_courses_by_query("MATH"))
+
+        assert [c.course_id for c in courses] == list(range(1, 51))
+        assert courses == connection.get_courses_by_query("MATH")
+
+
+    def test_iter_courses_by_department(self):
+        connection = CourseConnection()
+        session = FakeSession(lambda url, params: self.content)
+        connection._session = session
+
+        courses = connection.iter_courses_by_department("MATH", filters.AUTUMN,
+                                                        year="2017-2018")
+        first = next(courses)
+
+        assert first.course_id == 1
+        url, params = session.requests[0]
+        assert url.endswith("search")
+        assert params["filter-departmentcode-MATH"] == "on"
+        assert params[filters.AUTUMN] == "on"
+        assert params["academicYear"] == "20172018"
+
+
+    def test_iter_courses_releases_elements(self):
+        chunks = [self.content[i:i + 100] 
+                  for i in range(0, len(self.content), 100)]
+
+        courses = CourseConnection()._iter_courses(iter(chunks))
+        for course in courses:
+            frame = courses.gi_frame
+            assert len(frame.f_locals["stack"][-1]) <= 2
+
+
+class TestGetAllCourses(object):
+
+    @staticmethod
+    def respond(url, params):
+        if not url.endswith("search"):
+            return schools_xml()
+
+        code = params["q"]
+        if code == "EE":
+            return FakeResponse(b"<html>oops", status_code=500)
+
+        # Course 1 is cross-listed under every department.
+        ids = {"CS": [1, 2, 3], "MATH": [1, 4]}[code]
+        return search_xml([course_xml(i, subject=code, code=str(i)) 
+                           for i in ids])
+
+
+    def test_get_all_courses(self):
+        connection = CourseConnection(backoff=0)
+        connection._session = FakeSession(self.respond)
+        calls = []
+
+        result = connection.get_all_courses(
+            year="2017-2018", max_workers=2, 
+            progress=lambda done, total, dept: calls.append((done, total))
+        )
+
+        assert sorted(c.course_id for c in result.courses) == [1, 2, 3, 4]
+        assert list(result.failures) == ["EE"]
+        assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
+
+
+    def test_crawl(self):
+        connection = CourseConnection(backoff=0)
+        connection._session = FakeSession(self.respond)
+
+        crawl = connection.crawl(filters.AUTUMN, year="2017-2018")
+        results = {dept.code: (courses, error) 
+                   for dept, courses, error in crawl}
+
+        assert crawl.total == 3
+        assert isinstance(results["EE"][1], Exception)
+        ids = [c.course_id for courses, _ in results.values() 
+               for c in courses]
+        assert sorted(ids) == [1, 2, 3, 4]
+
+
+class TestRetries(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml([course_xml(1)])
+
+
+    def flaky(self, *failures):
+        failures = list(failures)
+
+        def respond(url, params):
+            if failures:
+                failure = failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                if isinstance(failure, FakeResponse):
+                    return failure
+                return FakeResponse(b"", status_code=failure)
+            return self.content
+
+        return respond
+
+
+    def test_pool_and_timeouts(self):
+        connection = CourseConnection(pool_maxsize=32, connect_timeout=2, 
+                                      read_timeout=7)
+        adapter = connection._session.get_adapter(CourseConnection._URL)
+        assert adapter._pool_maxsize == 32
+
+        session = FakeSession(lambda url, params: self.content)
+        connection._session = session
+        connection.get_courses_by_query("MATH")
+
+        assert session.timeouts == [(2, 7)]
+
+
+    def test_retries(self):
+        connection = CourseConnection(backoff=0)
+        session = FakeSession(self.flaky(
+            503, requests.ConnectionError("reset"), 429
+        ))
+        connection._session = session
+
+        courses = connection.get_courses_by_query("MATH")
+
+        assert [c.course_id for c in courses] == [1]
+        assert len(session.requests) == 4
+
+
+    def test_retries_exhausted(self):
+        connection = CourseConnection(retries=1, backoff=0)
+        session = FakeSession(self.flaky(500, 502, 503))
+        connection._session = session
+
+        with pytest.raises(IOError):
+            connection.get_courses_by_query("MATH")
+        assert len(session.requests) == 2
+
+        # Client errors are not retried.
+        session = FakeSession(self.flaky(404))
+        connection._session = session
+
+        with pytest.raises(IOError):
+            connection.get_courses_by_query("MATH")
+        assert len(session.requests) == 1
+
+
+    def test_deadline(self):
+        connection = CourseConnection(backoff=10, max_backoff=10, 
+                                      connect_timeout=5, read_timeout=30)
+        session = FakeSession(self.flaky(*[503] * 4))
+        connection._session = session
+
+        start = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            connection.get_courses_by_query("MATH", timeout=0.2)
+
+        assert time.monotonic() - start < 1
+        connect, read = session.timeouts[0]
+        assert connect <= 0.2 and read <= 0.2
+
+
+    def test_deadline_between_attempts(self):
+        connection = CourseConnection(backoff=0)
+
+        def respond(url, params):
+            time.sleep(0.1)
+            raise requests.ConnectionError("reset")
+
+        session = FakeSession(respond)
+        connection._session = session
+        calls = []
+        connection.add_hook(calls.append)
+
+        # The deadline passes during the first attempt, so it is not retried.
+        with pytest.raises(requests.Timeout, match="before the request"):
+            connection.get_courses_by_query("MATH", timeout=0.05)
+
+        stats, = calls
+        assert len(session.requests) == 1
+        assert stats.attempts == 1
+
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(100, burst=10)
+        connection = CourseConnection(backoff=0, rate_limiter=limiter)
+        connection._session = FakeSession(self.flaky(
+            FakeResponse(b"", status_code=429, headers={"Retry-After": "0.1"})
+        ))
+
+        start = time.monotonic()
+        connection.get_courses_by_query("MATH")
+
+        assert time.monotonic() - start >= 0.1
+        assert limiter.rate == 55
+
+
+class TestSingleFlight(object):
+
+    def test_single_flight(self):
+        content = search_xml([course_xml(1)])
+        release = threading.Event()
+
+        def respond(url, params):
+            release.wait()
+            return content
+
+        connection = CourseConnection(single_flight=True)
+        session = FakeSession(respond)
+        connection._session = session
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(connection.get_courses_by_department,
+                                       "MATH", filters.AUTUMN) 
+                       for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(session.requests) == 1
+        assert all(r == results[0] for r in results)
+        assert len({id(r) for r in results}) == 4
+
+
+    def test_get_directory(self):
+        release = threading.Event()
+
+        def respond(url, params):
+            if params.get("year") == "20162017":
+                release.wait(5)
+            return schools_xml()
+
+        connection = CourseConnection()
+        session = FakeSession(respond)
+        connection._session = session
+
+        with ThreadPoolExecutor(4) as executor:
+            slow = executor.submit(connection.get_directory, "2016-2017")
+            waiter = executor.submit(connection.get_directory, "2016-2017", 
+                                     timeout=0.1)
+            time.sleep(0.02)
+
+            # Other years are not held up by a download in progress.
+            start = time.monotonic()
+            other = connection.get_directory("2017-2018", timeout=0.5)
+            assert time.monotonic() - start < 0.5
+
+            # Waiting on the same year's download is bounded by the timeout.
+            with pytest.raises(requests.Timeout):
+                waiter.result(1)
+
+            release.set()
+            directory = slow.result()
+
+        assert connection.get_directory("2016-2017") is directory
+        assert connection.get_directory("2017-2018") is other
+        assert len(session.requests) == 2
+
+
+class TestHooks(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml([course_xml(i, code=str(i)) 
+                                  for i in range(1, 21)])
+
+
+    def test_hooks(self):
+        connection = CourseConnection(backoff=0)
+        responses = [FakeResponse(b"", status_code=503)]
+        connection._session = FakeSession(
+            lambda url, params: responses.pop() if responses else self.content
+        )
+        calls = []
+        connection.add_hook(calls.append)
+
+        courses = connection.get_courses_by_query("MATH")
+
+        stats, = calls
+        assert isinstance(stats, CallStats)
+        assert stats.url.endswith("search")
+        assert stats.payload["q"] == "MATH"
+        assert stats.attempts == 2
+        assert stats.status == 200
+        assert stats.bytes == len(self.content)
+        assert stats.count == len(courses) == 20
+        assert stats.error is None and not stats.cached
+        assert stats.parse > 0 and stats.build > 0
+        assert stats.total >= stats.ttfb + stats.download + stats.parse + \
+                               stats.build
+        assert "20 results" in str(stats)
+
+        connection.remove_hook(calls.append)
+        connection.get_courses_by_query("MATH")
+        assert len(calls) == 1
+
+
+    def test_streaming_and_errors(self):
+        connection = CourseConnection(retries=0)
+        connection._session = FakeSession(lambda url, params: self.content)
+        calls = []
+        connection.add_hook(calls.append)
+
+        assert len(list(connection.iter_courses_by_query("MATH"))) == 20
+        assert calls[0].count == 20
+        assert calls[0].bytes == len(self.content)
+
+        connection._session = FakeSession(
+            lambda url, params: FakeResponse(b"", status_code=404)
+        )
+        with pytest.raises(IOError):
+            connection.get_schools()
+        assert calls[1].status == 404
+        assert isinstance(calls[1].error, IOError)
+
+
+class TestParallelParse(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml([
+            course_xml(i, code=str(i), sections=[section_xml(10 * i + j) 
+                                                 for j in range(3)])
+            for i in range(1, 41)
+        ])
+        cls.executor = ProcessPoolExecutor(2)
+
+
+    @classmethod
+    def teardown_class(cls):
+        cls.executor.shutdown()
+
+
+    def test_split_courses(self):
+        content = (b'<?xml version="1.0"?><xml><courses>'
+                   b'<course><code>1</code><course><code>2</code></course>'
+                   b'</course><course/><course><code>3</code></course>'
+                   b'</courses></xml>')
+
+        chunks = _split_courses(content, 1)
+        assert chunks == [
+            b'<?xml version="1.0"?><courses><course><code>1</code><course>'
+            b'<code>2</code></course></course></courses>',
+            b'<?xml version="1.0"?><courses><course/></courses>',
+            b'<?xml version="1.0"?><courses><course><code>3</code></course>'
+            b'</courses>',
+        ]
+        assert len(_split_courses(content, len(content))) == 1
+        assert _split_courses(b"<xml><courses/></xml>", 1) == []
+
+
+    def test_parallel_parse(self):
+        connection = CourseConnection(parse_executor=self.executor)
+        connection._session = FakeSession(lambda url, params: self.content)
+        connection._PARSE_CHUNK_SIZE = 4096
+        calls = []
+        connection.add_hook(calls.append)
+
+        courses = connection.get_courses_by_query("MATH")
+
+        expected = CourseConnection()._parse_courses(self.content)
+        assert [c.course_id for c in courses] == list(range(1, 41))
+        assert ([[s.class_id for s in c.sections] for c in courses] 
+                == [[s.class_id for s in c.sections] for c in expected])
+        assert courses[5].sections[2].schedules[0].instructors[0].sunet_id \
+               == "jchw"
+        assert calls[0].count == 40 and calls[0].parse > 0
+
+        # Small responses and lazy connections are parsed in-process.
+        assert connection._parse_courses(search_xml([course_xml(1)]))
+        lazy = CourseConnection(lazy=True, parse_executor=self.executor)
+        assert lazy._parse_executor is None
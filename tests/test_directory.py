@@ -0,0 +1,53 @@
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+
+from tests.fixtures import FakeSession, schools_xml
+
+class TestDirectory(object):
+
+    @classmethod
+    def setup_class(cls):
+        root = ET.fromstring(schools_xml())
+        cls.schools = [School(elem) for elem in root.findall(".//school")]
+
+
+    def test_create_directory(self):
+        directory = Directory(self.schools, year="2017-2018")
+
+        assert directory.year == "2017-2018"
+        assert len(directory.schools) == 2
+        assert len(directory.departments) == 3
+
+
+    def test_directory_lookups(self):
+        directory = Directory(self.schools)
+        engineering = directory.get_school("School of Engineering")
+
+        assert engineering.name == "School of Engineering"
+        assert directory.get_school("School of Magic") is None
+        assert directory.get_department("cs").name == "Computer Science"
+        assert (directory.get_department("Mathematics") 
+                is directory.get_department("MATH"))
+        assert directory.get_department("PHYSICS") is None
+        assert directory.get_school_of("EE") is engineering
+        assert directory.get_school_of("PHYSICS") is None
+
+
+    def test_directory_string(self):
+        directory = Directory(self.schools, year="2017-2018")
+
+        assert str(directory) == "Directory (2017-2018: 2 schools, 3 departments)"
+
+
+    def test_connection_memoizes_directory(self):
+        connection = CourseConnection()
+        session = FakeSession(lambda url, params: schools_xml())
+        connection._session = session
+
+        school = connection.get_school("School of Engineering", 
+                                       year="2017-2018")
+        directory = connection.get_directory("2017-2018")
+
+        assert school is directory.get_school("School of Engineering")
+        assert len(session.requests) == 1
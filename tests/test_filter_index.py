@@ -0,0 +1,83 @@
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+from explorecourses import filters
+from explorecourses.filter_index import FilterIndex, course_filters
+
+from tests.fixtures import course_xml, search_xml, section_xml
+
+class TestFilterIndex(object):
+
+    @classmethod
+    def setup_class(cls):
+        root = ET.fromstring(search_xml([
+            course_xml(1, subject="CS", gers="WAY-FR, WAY-A-II", units_min=3, 
+                       units_max=5, sections=[
+                           section_xml(11, days="Tuesday Thursday", 
+                                       start_time="9:00:00 AM"),
+                       ]),
+            course_xml(2, subject="MATH", gers="WAY-FR", units_min=5, 
+                       units_max=5, career="GR", sections=[
+                           section_xml(21, term="2017-2018 Winter", 
+                                       days="Monday", 
+                                       start_time="6:00:00 PM"),
+                       ]),
+            course_xml(3, subject="CS", gers="", units_min=1, units_max=10, 
+                       sections=[
+                           section_xml(31, term="2017-2018 Spring", 
+                                       days="Friday", 
+                                       start_time="12:30:00 PM"),
+                       ]),
+        ]))
+        cls.courses = [Course(elem) for elem in root.iter("course")]
+        cls.index = FilterIndex(cls.courses)
+
+
+    def ids(self, *filters):
+        return [c.course_id for c in self.index.get_courses(*filters)]
+
+
+    def test_course_filters(self):
+        matched = course_filters(self.courses[0])
+
+        assert filters.AUTUMN in matched
+        assert filters.WAY_FR in matched
+        assert filters.WAY_AII in matched
+        assert filters.UNITS_4 in matched
+        assert filters.UNITS_GT5 not in matched
+        assert filters.DAY_TUESDAY in matched
+        assert filters.TIME_EARLY_MORNING in matched
+        assert filters.CAREER_UG in matched
+        assert "filter-departmentcode-CS" in matched
+
+
+    def test_single_filters(self):
+        assert self.ids() == [1, 2, 3]
+        assert self.ids(filters.AUTUMN) == [1]
+        assert self.ids(filters.WAY_FR) == [1, 2]
+        assert self.ids(filters.UNITS_5) == [1, 2, 3]
+        assert self.ids(filters.UNITS_GT5) == [3]
+        assert self.ids(filters.TIME_EVENING) == [2]
+        assert self.ids(filters.TIME_LUNCHTIME) == [3]
+        assert self.ids(filters.DAY_TUESDAY) == [1]
+        assert self.ids(filters.CAREER_GR) == [2]
+        assert self.ids(filters.SUMMER) == []
+
+
+    def test_combined_filters(self):
+        assert self.ids(filters.AUTUMN, filters.WINTER) == [1, 2]
+        assert self.ids(filters.WAY_FR, filters.CAREER_UG) == [1]
+        assert self.ids(filters.AUTUMN, filters.WINTER, filters.CAREER_GR) \
+            == [2]
+        assert self.ids("filter-departmentcode-CS", filters.UNITS_1) == [3]
+        assert self.index.count(filters.WAY_FR) == 2
+
+
+    def test_add(self):
+        index = FilterIndex()
+        index.add(self.courses[:1])
+        index.add(self.courses[1:])
+
+        assert len(index) == 3
+        assert ([c.course_id for c in index.get_courses(filters.WAY_FR)] 
+                == [1, 2])
@@ -1,5 +1,9 @@
+import copy
+import pickle
 from xml.etree import ElementTree as ET
 
+import pytest
+
 from explorecourses import *
 
 class TestInstructor(object):
@@ -41,3 +45,21 @@ class TestInstructor(object):
         instr = Instructor(self.xml_instr)
 
         assert str(instr) == "Jenny Wilson (jchw)"
+
+
+    def test_instr_value_object(self):
+        instr = Instructor(self.xml_instr)
+        other = Instructor(self.xml_instr)
+
+        assert instr == other and instr is not other
+        assert hash(instr) == hash(other)
+        assert len({instr, other}) == 1
+
+        with pytest.raises(AttributeError):
+            instr.sunet_id = "other"
+        with pytest.raises(AttributeError):
+            del instr.name
+
+        restored = pickle.loads(pickle.dumps(instr))
+        assert restored == instr
+        assert copy.copy(instr) == instr
@@ -0,0 +1,179 @@
+import pickle
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+
+from tests.fixtures import FakeSession, course_xml, search_xml, section_xml
+
+def courses_xml():
+    return search_xml([
+        course_xml(i, code=str(i), sections=[section_xml(10 * i + j) 
+                                             for j in range(2)])
+        for i in range(1, 4)
+    ])
+
+
+class TestInterner(object):
+
+    def test_canonical_values(self):
+        interner = Interner()
+        first = "".join(["2017-2018 ", "Autumn"])
+        second = "".join(["2017-2018 ", "Autumn"])
+        assert first is not second
+
+        assert interner(first) is first
+        assert interner(second) is first
+        assert interner(("Monday", "Friday")) == ("Monday", "Friday")
+        assert interner(None) is None
+        assert len(interner) == 3
+
+        interner.clear()
+        assert len(interner) == 0
+        assert interner(second) is second
+
+
+    def test_shared_values(self):
+        interner = Interner()
+        elems = ET.fromstring(courses_xml()).findall(".//course")
+        courses = [Course(elem, interner=interner) for elem in elems]
+
+        sections = [s for c in courses for s in c.sections]
+        schedules = [s for section in sections for s in section.schedules]
+
+        assert len(sections) == 6
+        assert all(s.term is sections[0].term for s in sections)
+        assert all(s.component is sections[0].component for s in sections)
+        assert all(s.location is schedules[0].location for s in schedules)
+        assert all(s.days is schedules[0].days for s in schedules)
+        assert all(c.gers is courses[0].gers for c in courses)
+        assert all(s.instructors[0].sunet_id 
+                   is schedules[0].instructors[0].sunet_id 
+                   for s in schedules)
+
+        # Without an interner, values are not shared.
+        plain = [Course(elem) for elem in elems]
+        assert plain[0].sections[0].term is not plain[1].sections[0].term
+        assert [str(c) for c in plain] == [str(c) for c in courses]
+
+
+    def test_free_text_not_retained(self):
+        def table_size(notes):
+            interner = Interner()
+            xml = search_xml([
+                course_xml(i, code=str(i), sections=[
+                    section_xml(10 * i).replace(
+                        "<notes/>", f"<notes>{notes} {i}</notes>" if notes 
+                        else "<notes/>"
+                    )
+                ])
+                for i in range(1, 4)
+            ])
+            for elem in ET.fromstring(xml).findall(".//course"):
+                Course(elem, interner=interner)
+            return len(interner)
+
+        # Distinct section notes do not grow the table.
+        assert table_size("Enrollment limited") == table_size(None)
+
+
+    def test_shared_instructor_roles(self):
+        content = search_xml([
+            course_xml(i, code=str(i), sections=[
+                section_xml(10 * i),
+                section_xml(10 * i + 1).replace("<role>PI</role>", 
+                                                "<role>TA</role>"),
+            ])
+            for i in range(1, 4)
+        ])
+
+        interner = Interner()
+        elems = ET.fromstring(content).findall(".//course")
+        courses = [Course(elem, interner=interner) for elem in elems]
+
+        instructors = [s.schedules[0].instructors[0] 
+                       for c in courses for s in c.sections]
+        primary, secondary = instructors[:2]
+
+        # One shared object per role, not per person.
+        assert len({id(i) for i in instructors}) == 2
+        assert primary.is_primary_instructor
+        assert not secondary.is_primary_instructor
+        assert primary != secondary
+        assert primary.sunet_id is secondary.sunet_id
+        assert all(i is (primary if i.is_primary_instructor else secondary) 
+                   for i in instructors)
+
+
+    def test_lazy_courses(self):
+        interner = Interner()
+        elems = ET.fromstring(courses_xml()).findall(".//course")
+        courses = [Course(elem, lazy=True, interner=interner) 
+                   for elem in elems]
+
+        assert courses[0].sections[0].term is courses[1].sections[0].term
+
+        # Materialized courses release the interner with their element.
+        restored = pickle.loads(pickle.dumps(courses[2]))
+        assert courses[2].is_materialized
+        assert courses[2]._interner is None
+        assert restored.sections[0].term == "2017-2018 Autumn"
+
+
+    def test_connection(self):
+        session = FakeSession(lambda url, params: courses_xml())
+        connection = CourseConnection(transport=session)
+
+        first = connection.get_courses_by_query("math")
+        second = connection.get_courses_by_query("math")
+        streamed = list(connection.iter_courses_by_query("math"))
+
+        term = first[0].sections[0].term
+        assert second[2].sections[1].term is term
+        assert streamed[1].sections[0].term is term
+
+        # Connections can share one table.
+        interner = Interner()
+        a = CourseConnection(transport=session, interner=interner)
+        b = CourseConnection(transport=session, interner=interner)
+        assert (a.get_courses_by_query("math")[0].subject 
+                is b.get_courses_by_query("math")[0].subject)
+
+
+    def test_shared_objects(self):
+        tags = ('<tags><tag><organization>EARTHSYS</organization>'
+                '<name>energy</name></tag></tags>')
+        attrs = ('<attributes><attribute><name>NQTR</name><value>SPR</value>'
+                 '<description>Spring</description>'
+                 '<catalogPrint>true</catalogPrint>'
+                 '<schedulePrint>false</schedulePrint>'
+                 '</attribute></attributes>')
+        content = search_xml([
+            course_xml(i, code=str(i), sections=[
+                section_xml(10 * i, sunet="jchw"),
+                section_xml(10 * i + 1, sunet="other"),
+            ]).replace("<attributes/><tags/>", attrs + tags)
+            for i in range(1, 4)
+        ])
+
+        interner = Interner()
+        elems = ET.fromstring(content).findall(".//course")
+        courses = [Course(elem, interner=interner) for elem in elems]
+
+        instructors = [s.schedules[0].instructors[0] 
+                       for c in courses for s in c.sections]
+        assert len({id(i) for i in instructors}) == 2
+        jchw = courses[0].sections[0].schedules[0].instructors[0]
+        taught = [c for c in courses 
+                  if any(jchw in sched.instructors 
+                         for s in c.sections for sched in s.schedules)]
+        assert taught == courses
+
+        assert all(c.tags[0] is courses[0].tags[0] for c in courses)
+        assert all(c.attributes[0] is courses[0].attributes[0] 
+                   for c in courses)
+        assert str(courses[2].attributes[0]) == "NQTR::SPR"
+
+        # Objects built without an interner are equal but not shared.
+        plain = Course(elems[0])
+        assert plain.tags[0] == courses[0].tags[0]
+        assert plain.tags[0] is not courses[0].tags[0]
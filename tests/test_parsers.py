@@ -0,0 +1,74 @@
+import pytest
+
+from explorecourses import *
+from explorecourses.parsers import available_parsers, get_parser
+
+from tests.fixtures import course_xml, search_xml
+
+class TestParsers(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.content = search_xml(
+            ['<!-- generated -->' + course_xml(i, code=str(i)) 
+             for i in range(1, 21)]
+        )
+
+
+    def test_get_parser(self):
+        assert get_parser("etree").name == "etree"
+        assert get_parser().name == available_parsers()[0]
+
+        with pytest.raises(ValueError):
+            get_parser("sax")
+
+
+    @pytest.mark.parametrize("name", available_parsers())
+    def test_parse_courses(self, name):
+        connection = CourseConnection(parser=name)
+
+        courses = connection._parse_courses(self.content)
+        streamed = list(connection._iter_courses(iter([self.content[:500], 
+                                                       self.content[500:]])))
+
+        assert [c.course_id for c in courses] == list(range(1, 21))
+        assert streamed == courses
+        assert courses[0].sections[0].schedules[0].instructors[0].sunet_id \
+            == "jchw"
+
+
+    def test_backends_agree(self):
+        if "lxml" not in available_parsers():
+            pytest.skip("lxml is not installed")
+
+        etree = CourseConnection(parser="etree")._parse_courses(self.content)
+        lxml = CourseConnection(parser="lxml")._parse_courses(self.content)
+
+        for a, b in zip(etree, lxml):
+            assert (a.course_id, a.title, a.gers, a.final_exam) \
+                == (b.course_id, b.title, b.gers, b.final_exam)
+            assert ([s.class_id for s in a.sections] 
+                    == [s.class_id for s in b.sections])
+
+
+    def test_lazy_default_parser(self):
+        assert CourseConnection(lazy=True)._parser.name == "etree"
+
+
+    @pytest.mark.parametrize("name", available_parsers())
+    def test_lazy_course_detached(self, name):
+        courses = CourseConnection(lazy=True, 
+                                   parser=name)._parse_courses(self.content)
+        course = courses[3]
+        elem = course._elem
+
+        # The retained element is a document of its own, so it keeps none of
+        # the other courses alive.
+        if name == "lxml":
+            assert elem.getparent() is None
+            assert elem.getroottree().getroot() is elem
+        assert len(list(elem.iter("course"))) == 1
+
+        assert course.course_id == 4
+        assert course.sections[0].schedules[0].instructors[0].sunet_id \
+            == "jchw"
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+
+from explorecourses.rate_limit import FileRateLimiter, RateLimiter, \
+                                      parse_retry_after
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+
+    def __call__(self):
+        return self.now
+
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(object):
+
+    def setup_method(self):
+        self.clock = FakeClock()
+
+
+    def make(self, cls=RateLimiter, *args, **kwargs):
+        return cls(*args, clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", 
+                                 now=lambda: 1445412470) == 10
+
+
+    def test_token_bucket(self):
+        limiter = self.make(RateLimiter, 2, burst=2)
+
+        for _ in range(4):
+            assert limiter.acquire()
+
+        # The burst is free, then requests are spaced at the rate.
+        assert self.clock.sleeps == [0.5, 0.5]
+        assert limiter.acquire(timeout=0.1) is False
+        assert limiter.acquire(timeout=0.5) is True
+
+
+    def test_throttle(self):
+        limiter = self.make(RateLimiter, 10, min_rate=2, increase=1)
+
+        limiter.throttle(retry_after=5)
+        assert limiter.rate == 5
+        assert limiter.acquire()
+        assert sum(self.clock.sleeps) == pytest.approx(5)
+
+        for _ in range(3):
+            limiter.throttle()
+        assert limiter.rate == 2
+
+        for _ in range(20):
+            limiter.success()
+        assert limiter.rate == 10
+
+
+    def test_threads(self):
+        limiter = RateLimiter(1, burst=1000)
+        acquired = []
+
+        def work():
+            for _ in range(200):
+                acquired.append(limiter.acquire(timeout=0))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The burst is shared, and refills too slowly to grant much more.
+        assert 1000 <= acquired.count(True) <= 1002
+
+
+    def test_file_rate_limiter(self, tmp_path):
+        path = str(tmp_path / "limit")
+        first = self.make(FileRateLimiter, path, 1, burst=2)
+        second = self.make(FileRateLimiter, path, 1, burst=2)
+
+        assert first.acquire(timeout=0)
+        assert second.acquire(timeout=0)
+        assert not first.acquire(timeout=0)
+
+        second.throttle(retry_after=10)
+        assert first.rate == 0.5
+        assert not first.acquire(timeout=5)
+        assert first.acquire(timeout=11)
@@ -1,6 +1,9 @@
+import datetime
 from xml.etree import ElementTree as ET
 
 from explorecourses import *
+from explorecourses.classes import date_to_ordinal, days_to_mask, \
+                                   time_to_minutes
 
 class TestSchedule(object):
 
@@ -63,3 +66,48 @@ class TestSchedule(object):
 
         assert str(sched) == ("Monday, Wednesday, Friday, 11:30:00 AM - "
                               "12:20:00 PM at 320-105")
+
+
+    def test_schedule_numbers(self):
+        sched = Schedule(self.xml_sched)
+
+        assert sched.start_minutes == 11 * 60 + 30
+        assert sched.end_minutes == 12 * 60 + 20
+        assert sched.day_mask == 0b10101
+        assert sched.start_ordinal == datetime.date(2017, 9, 25).toordinal()
+        assert sched.end_ordinal == datetime.date(2017, 12, 8).toordinal()
+
+        assert time_to_minutes("12:05:00 AM") == 5
+        assert time_to_minutes("") is None
+        assert days_to_mask(["Sunday", "Funday"]) == 1 << 6
+        assert date_to_ordinal("TBA") is None
+
+
+    def test_schedule_overlaps(self):
+        sched = Schedule(self.xml_sched)
+
+        def other(start, end, days, start_date="Sep 25, 2017"):
+            elem = ET.fromstring(
+                '<schedule>'
+                f'<startDate>{start_date}</startDate>'
+                '<endDate>Dec 8, 2017</endDate>'
+                f'<startTime>{start}</startTime>'
+                f'<endTime>{end}</endTime>'
+                '<location/>'
+                f'<days>{days}</days>'
+                '<instructors/>'
+                '</schedule>'
+            )
+            return Schedule(elem)
+
+        assert sched.overlaps(sched)
+        assert sched.overlaps(other("12:00:00 PM", "1:00:00 PM", "Friday"))
+        assert not sched.overlaps(other("12:20:00 PM", "1:00:00 PM", 
+                                        "Friday"))
+        assert not sched.overlaps(other("12:00:00 PM", "1:00:00 PM", 
+                                        "Tuesday Thursday"))
+        assert not sched.overlaps(other("12:00:00 PM", "1:00:00 PM", 
+                                        "Monday", "Jan 8, 2018"))
+        assert not sched.overlaps(other("", "", "Monday"))
+        assert sched.overlaps(other("12:00:00 PM", "1:00:00 PM", "Monday", 
+                                    ""))
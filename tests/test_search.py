@@ -0,0 +1,108 @@
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+from explorecourses import filters
+from explorecourses.search import SearchIndex, tokenize
+
+from tests.fixtures import course_xml, search_xml
+
+def make_course(course_id, active=True, **kwargs):
+    xml = course_xml(course_id, **kwargs)
+    if not active:
+        xml = xml.replace("<effectiveStatus>A</effectiveStatus>", 
+                          "<effectiveStatus>I</effectiveStatus>")
+    root = ET.fromstring(search_xml([xml]))
+    return Course(root.find(".//course"))
+
+
+class TestSearchIndex(object):
+
+    def setup_method(self):
+        self.courses = [
+            make_course(1, subject="CS", code="106A", 
+                        title="Programming Methodology",
+                        description="Introduction to programming in Python."),
+            make_course(2, subject="MATH", code="51", 
+                        title="Linear Algebra and Calculus",
+                        description="Vectors, matrices and derivatives."),
+            make_course(3, subject="CS", code="229", title="Machine Learning",
+                        description="Linear models, kernels and programming "
+                                    "assignments.", career="GR"),
+        ]
+        self.index = SearchIndex(self.courses)
+
+
+    def ids(self, query, *filters, **kwargs):
+        return [c.course_id for c in 
+                self.index.get_courses_by_query(query, *filters, **kwargs)]
+
+
+    def test_tokenize(self):
+        assert tokenize("CS 106A: Programming!") == ["cs", "106a", 
+                                                     "programming"]
+        assert tokenize(None) == []
+
+
+    def test_keywords(self):
+        assert self.ids("calculus") == [2]
+        assert self.ids("cs106a") == [1]
+        assert self.ids("CS 229") == [3]
+        assert self.ids("wilson machine") == [3]
+        assert self.ids("quantum") == []
+
+
+    def test_ranking(self):
+        # A title match outranks a description match.
+        assert self.ids("linear") == [2, 3]
+        assert self.ids("programming") == [1, 3]
+
+
+    def test_prefix(self):
+        assert self.ids("linear alg") == [2]
+        assert self.ids("prog") == [1, 3]
+        # Only the last token is matched as a prefix.
+        assert self.ids("prog methodology") == []
+
+
+    def test_filters_and_year(self):
+        assert self.ids("programming", filters.CAREER_GR) == [3]
+        assert self.ids("programming", year="2017-2018") == [1, 3]
+        assert self.ids("programming", year="2018-2019") == []
+        assert self.ids("", filters.CAREER_UG) == [1, 2]
+
+
+    def test_incremental_updates(self):
+        self.index.remove(self.courses[:1])
+        assert len(self.index) == 2
+        assert self.courses[0] not in self.index
+        assert self.ids("methodology") == []
+        assert "methodology" not in self.index._vocabulary
+
+        self.index.update([make_course(2, title="Real Analysis",
+                                       description="Proofs.")])
+        assert len(self.index) == 2
+        assert self.ids("calculus") == []
+        assert self.ids("analysis") == [2]
+
+        self.index.add(self.courses[:1])
+        assert self.ids("prog") == [1, 3]
+
+
+    def test_ties_in_insertion_order(self):
+        index = SearchIndex([make_course(i, title="Seminar") 
+                             for i in (5, 3, 9, 1)])
+
+        assert [c.course_id for c in index.get_courses_by_query("seminar")] \
+            == [5, 3, 9, 1]
+
+        index.update([make_course(3, title="Seminar")])
+        assert [c.course_id for c in index.get_courses_by_query("sem")] \
+            == [5, 9, 1, 3]
+
+
+    def test_inactive_courses(self):
+        self.index.add([make_course(4, active=False, title="Programming")])
+
+        assert self.ids("programming") == [1, 3]
+        assert sorted(c.course_id for c, _ 
+                      in self.index.search("programming")) == [1, 3, 4]
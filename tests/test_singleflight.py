@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytest
+
+from explorecourses.singleflight import AsyncSingleFlight, SingleFlight
+
+class TestSingleFlight(object):
+
+    def test_shares_calls(self):
+        flights = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fn():
+            calls.append(1)
+            release.wait()
+            return object()
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(flights.do, "key", fn) 
+                       for _ in range(4)]
+            while len(flights) == 0:
+                time.sleep(0.001)
+            time.sleep(0.02)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert len(flights) == 0
+
+        # Once finished, calls are made again.
+        flights.do("key", fn)
+        assert len(calls) == 2
+
+
+    def test_errors_and_timeouts(self):
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fail():
+            started.set()
+            release.wait()
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flights.do, "key", fail)
+            started.wait()
+
+            with pytest.raises(TimeoutError):
+                flights.do("key", fail, timeout=0.01)
+
+            release.set()
+            with pytest.raises(ValueError):
+                leader.result()
+
+
+    def test_async(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def run():
+            return await asyncio.gather(*(flights.do("key", fn) 
+                                          for _ in range(5)))
+
+        assert asyncio.run(run()) == [1] * 5
+        assert len(flights) == 0
+
+
+    def test_async_timeout(self):
+        flights = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return "done"
+
+        async def run():
+            leader = asyncio.ensure_future(flights.do("key", fn))
+            with pytest.raises(asyncio.TimeoutError):
+                await flights.do("key", fn, timeout=0.01)
+
+            # The call keeps running for the callers still waiting on it.
+            assert len(flights) == 1
+            release.set()
+            return await leader
+
+        assert asyncio.run(run()) == "done"
+        assert len(flights) == 0
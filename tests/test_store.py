@@ -0,0 +1,97 @@
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+from explorecourses.store import CatalogStore
+
+from tests.fixtures import course_xml, search_xml, section_xml
+
+class TestCatalogStore(object):
+
+    @classmethod
+    def setup_class(cls):
+        root = ET.fromstring(search_xml([
+            course_xml(1, subject="CS", code="106A", sections=[
+                section_xml(11, sunet="cgregg", course_id=1),
+                section_xml(12, term="2017-2018 Winter", sunet="mehran", 
+                            course_id=1),
+            ]),
+            course_xml(2, subject="MATH", code="51", sections=[
+                section_xml(21, sunet="mehran", course_id=2),
+            ]),
+            course_xml(3, subject="CS", code="107", sections=[]),
+        ]))
+        cls.courses = [Course(elem) for elem in root.iter("course")]
+
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "catalog.db")
+        store = CatalogStore(path)
+        store.save(self.courses)
+        store.close()
+
+        store = CatalogStore(path)
+        course = store.get_course(1)
+        original = self.courses[0]
+
+        assert len(store) == 3
+        assert course == original
+        for name in ("year", "subject", "code", "title", "description", 
+                     "gers", "repeatable", "grading_basis", "units_min", 
+                     "units_max", "final_exam", "active", "offer_num", 
+                     "academic_group", "academic_org", "academic_career", 
+                     "max_units_repeat", "max_times_repeat"):
+            assert getattr(course, name) == getattr(original, name)
+
+        section = course.sections[1]
+        assert section.class_id == 12
+        assert section.term == "2017-2018 Winter"
+        assert section.curr_class_size == original.sections[1].curr_class_size
+        assert section.schedules[0].days == ("Monday", "Wednesday", "Friday")
+        assert section.schedules[0].instructors[0].sunet_id == "mehran"
+        assert section.schedules[0].instructors[0].is_primary_instructor
+
+
+    def test_queries(self):
+        store = CatalogStore()
+        store.save(self.courses)
+
+        assert store.get_course(4) is None
+        assert [c.code for c in store.get_courses("CS")] == ["106A", "107"]
+        assert [c.code for c in store.get_courses("CS", "107", 
+                                                  "2017-2018")] == ["107"]
+        assert store.get_course_by_class_id(21).course_id == 2
+        assert store.get_section(12).term == "2017-2018 Winter"
+        assert store.get_section(99) is None
+        assert ([c.course_id for c in store.get_courses_by_instructor("mehran")]
+                == [1, 2])
+        assert ([c.course_id 
+                 for c in store.get_courses_by_term("2017-2018 Winter")] 
+                == [1])
+        assert len(store.get_all_courses("2017-2018")) == 3
+
+        # Instructors loaded together are shared between sections.
+        courses = store.get_all_courses("2017-2018")
+        instructors = [sched.instructors[0] for c in courses 
+                       for s in c.sections for sched in s.schedules]
+        assert instructors[1] is instructors[2]
+
+
+    def test_save_replaces(self):
+        store = CatalogStore()
+        store.save(self.courses)
+        store.save(self.courses[:1])
+
+        assert len(store) == 3
+        assert len(store.get_course(1).sections) == 2
+        assert store.get_course_by_class_id(11).course_id == 1
+
+
+    def test_remove(self):
+        store = CatalogStore()
+        store.save(self.courses)
+        store.remove(self.courses[:1])
+
+        assert len(store) == 2
+        assert store.get_course(1) is None
+        assert store.get_section(11) is None
+        assert store.get_courses_by_instructor("cgregg") == []
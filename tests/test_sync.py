@@ -0,0 +1,105 @@
+from xml.etree import ElementTree as ET
+
+from explorecourses import *
+from explorecourses.search import SearchIndex
+from explorecourses.store import CatalogStore
+from explorecourses.sync import ADDED, MODIFIED, REMOVED, CatalogSync, diff
+
+from tests.fixtures import course_xml, search_xml, section_xml
+
+def make_courses(*courses):
+    root = ET.fromstring(search_xml(list(courses)))
+    return [Course(elem) for elem in root.iter("course")]
+
+
+class TestSync(object):
+
+    def setup_method(self):
+        self.old = make_courses(
+            course_xml(1, subject="CS", code="106A", sections=[
+                section_xml(11, curr_size=10, course_id=1),
+                section_xml(12, course_id=1),
+            ]),
+            course_xml(2, title="Calculus"),
+            course_xml(3, title="Topology"),
+        )
+
+
+    def test_unchanged(self):
+        copy = make_courses(
+            course_xml(1, subject="CS", code="106A", sections=[
+                section_xml(11, curr_size=10, course_id=1),
+                section_xml(12, course_id=1),
+            ]),
+            course_xml(2, title="Calculus"),
+            course_xml(3, title="Topology"),
+        )
+
+        assert len(diff(self.old, copy)) == 0
+
+
+    def test_diff(self):
+        new = make_courses(
+            course_xml(1, subject="CS", code="106A", sections=[
+                section_xml(11, curr_size=11, start_time="1:30:00 PM", 
+                            course_id=1),
+                section_xml(13, course_id=1),
+            ]),
+            course_xml(2, title="Linear Algebra"),
+            course_xml(4),
+        )
+
+        changes = diff(self.old, new)
+        kinds = {c.course_id: c.kind for c in changes}
+
+        assert kinds == {1: MODIFIED, 2: MODIFIED, 3: REMOVED, 4: ADDED}
+        assert [c.course_id for c in changes.added] == [4]
+        assert [c.course_id for c in changes.removed] == [3]
+
+        cs106a = next(c for c in changes if c.course_id == 1)
+        assert cs106a.fields == ()
+        sections = {s.class_id: s for s in cs106a.sections}
+        assert sections[11].kind == MODIFIED
+        assert sections[11].fields == ("curr_class_size", "schedules")
+        assert sections[12].kind == REMOVED
+        assert sections[13].kind == ADDED
+
+        math51 = next(c for c in changes if c.course_id == 2)
+        assert math51.fields == ("title",)
+        assert "title" in str(changes)
+
+
+    def test_instructor_change(self):
+        new = make_courses(
+            course_xml(1, subject="CS", code="106A", sections=[
+                section_xml(11, curr_size=10, sunet="cgregg", course_id=1),
+                section_xml(12, course_id=1),
+            ]),
+            course_xml(2, title="Calculus"),
+            course_xml(3, title="Topology"),
+        )
+
+        change, = diff(self.old, new)
+        section, = change.sections
+        assert section.class_id == 11
+        assert section.fields == ("instructors",)
+
+
+    def test_catalog_sync(self):
+        index = SearchIndex(self.old)
+        store = CatalogStore()
+        store.save(self.old)
+        sync = CatalogSync(self.old, targets=[index, store])
+
+        new = make_courses(course_xml(2, title="Linear Algebra"))
+        changes = sync.sync(new, subjects=["MATH"])
+
+        # Course 1 is in CS, which was not fetched.
+        assert {c.course_id: c.kind for c in changes} == {2: MODIFIED, 
+                                                          3: REMOVED}
+        assert sorted(c.course_id for c in sync.courses) == [1, 2]
+        assert len(index) == len(store) == 2
+        assert index.get_courses_by_query("topology") == []
+        assert store.get_course(2).title == "Linear Algebra"
+
+        assert len(sync.sync(sync.courses)) == 0
@@ -0,0 +1,127 @@
+from xml.etree import ElementTree as ET
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from explorecourses import *
+from explorecourses.tables import CourseTable, ScheduleTable, \
+                                  SectionTable, StringColumn
+
+from tests.fixtures import course_xml, search_xml, section_xml
+
+class TestTables(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.root = ET.fromstring(search_xml([
+            course_xml(1, subject="CS", code="106A", units_min=3, 
+                       units_max=5, sections=[
+                           section_xml(11, curr_size=45, max_size=50),
+                           section_xml(12, term="2017-2018 Winter", 
+                                       component="DIS", curr_size=0, 
+                                       max_size=0, days="Tuesday Thursday", 
+                                       start_time="1:30:00 PM", 
+                                       end_time="2:50:00 PM"),
+                       ]),
+            course_xml(2, subject="MATH", code="51", career="GR", sections=[
+                section_xml(21, curr_size=10, max_size=40),
+            ]),
+            course_xml(3, subject="CS", code="107"),
+        ]))
+        cls.courses = [Course(elem) for elem in cls.root.iter("course")]
+
+
+    def test_string_column(self):
+        column = StringColumn(["LEC", "DIS", "LEC", None])
+
+        assert column.codes.tolist() == [0, 1, 0, -1]
+        assert column.categories == ("LEC", "DIS")
+        assert column[1] == "DIS"
+        assert column[3] is None
+        assert column.decode() == ["LEC", "DIS", "LEC", None]
+        assert column.isin(["LEC"]).tolist() == [True, False, True, False]
+
+
+    def test_course_table(self):
+        table = CourseTable.from_courses(self.courses)
+
+        assert len(table) == 3
+        assert table.course_id.tolist() == [1, 2, 3]
+        assert table.units_max.dtype == np.int32
+        assert table.subject.decode() == ["CS", "MATH", "CS"]
+        assert table.academic_career.categories == ("UG", "GR")
+
+        with pytest.raises(AttributeError):
+            table.nonexistent
+
+
+    def test_section_table(self):
+        table = SectionTable.from_courses(self.courses)
+
+        assert table.class_id.tolist() == [11, 12, 21, 30]
+        assert table.course_id.tolist() == [1, 1, 2, 3]
+        assert table.component.decode() == ["LEC", "DIS", "LEC", "LEC"]
+
+        rate = table.fill_rate()
+        assert rate[0] == pytest.approx(0.9)
+        assert np.isnan(rate[1])
+
+
+    def test_from_xml_matches_from_courses(self):
+        for cls in (CourseTable, SectionTable, ScheduleTable):
+            a = cls.from_courses(self.courses)
+            b = cls.from_xml(self.root)
+
+            for name, column in a.columns.items():
+                other = b.columns[name]
+                if isinstance(column, StringColumn):
+                    assert column.decode() == other.decode()
+                else:
+                    assert column.tolist() == other.tolist()
+
+
+    def test_schedule_table(self):
+        table = ScheduleTable.from_courses(self.courses)
+
+        assert table.class_id.tolist() == [11, 12, 21, 30]
+        assert table.start_minutes.tolist() == [690, 810, 690, 690]
+        assert table.day_mask.dtype == np.uint8
+        assert table.day_mask.tolist() == [0b10101, 0b1010, 0b10101, 0b10101]
+        assert table.location.categories == ("320-105",)
+
+        assert table.meets_on("Tuesday").tolist() == [False, True, False, 
+                                                      False]
+        assert table.within(12 * 60, 15 * 60).tolist() == [False, True, 
+                                                           False, False]
+
+        start = self.courses[0].sections[0].schedules[0].start_ordinal
+        assert table.active_on(start).all()
+        assert not table.active_on(start - 1).any()
+
+        lecture = self.courses[0].sections[0].schedules[0]
+        assert table.overlaps(lecture).tolist() == [True, False, True, True]
+        assert (table.overlaps(lecture).tolist() == 
+                [lecture.overlaps(s) for c in self.courses 
+                 for section in c.sections for s in section.schedules])
+
+
+    def test_empty_table(self):
+        table = SectionTable.from_courses([])
+
+        assert len(table) == 0
+        assert len(table.fill_rate()) == 0
+
+
+    def test_to_pandas(self):
+        pytest.importorskip("pandas")
+
+        table = SectionTable.from_courses(self.courses)
+        frame = table.to_pandas()
+
+        assert list(frame.columns) == [name for name, _ in table._COLUMNS]
+        for name, dtype in table._COLUMNS:
+            if dtype is not None:
+                assert np.shares_memory(frame[name].to_numpy(), 
+                                        table.columns[name])
+        assert list(frame["term"]) == table.term.decode()
@@ -0,0 +1,111 @@
+import os
+import time
+
+import pytest
+import requests
+
+from explorecourses import *
+from explorecourses.cache import DiskCache
+from explorecourses.transport import MemoryTransport, RecordingTransport, \
+                                     ReplayTransport, StandInServer
+
+from tests.fixtures import FakeResponse, FakeSession, course_xml, \
+                           schools_xml, search_xml
+
+def respond(url, params):
+    if not url.endswith("search"):
+        return FakeResponse(schools_xml(), headers={"ETag": '"schools"'})
+
+    code = params["q"]
+    # Course IDs must differ between departments, as crawls deduplicate them.
+    base = 10 * ["CS", "EE", "MATH"].index(code)
+    content = search_xml([course_xml(base + i, subject=code, code=str(i))
+                          for i in range(1, 4)])
+    return FakeResponse(content,
+                        headers={"ETag": f'"{code}"'})
+
+
+class TestTransport(object):
+
+    def record(self, directory):
+        transport = RecordingTransport(str(directory), 
+                                       session=FakeSession(respond))
+        connection = CourseConnection(transport=transport)
+
+        return connection.get_all_courses(year="2017-2018")
+
+
+    def test_record_and_replay(self, tmp_path):
+        recorded = self.record(tmp_path)
+
+        # One schools listing and three departments, each body and metadata.
+        assert len(os.listdir(tmp_path)) == 8
+        assert all(name.endswith((".xml.gz", ".json")) 
+                   for name in os.listdir(tmp_path))
+
+        connection = CourseConnection(transport=ReplayTransport(str(tmp_path)))
+        replayed = connection.get_all_courses(year="2017-2018")
+
+        assert (sorted(str(c) for c in replayed.courses) 
+                == sorted(str(c) for c in recorded.courses))
+        assert len(replayed.courses) == 9
+        assert not replayed.failures
+
+        with pytest.raises(requests.HTTPError):
+            connection.get_courses_by_department("PHYSICS", year="2017-2018")
+
+
+    def test_memory_transport(self):
+        transport = MemoryTransport()
+        transport.add(CourseConnection._URL, 
+                      CourseConnection._school_payload("2017-2018"), 
+                      schools_xml(), {"ETag": '"v1"', "Server": "test"})
+        connection = CourseConnection(transport=transport)
+
+        schools = connection.get_schools("2017-2018")
+        assert len(schools) == 2
+
+        res = transport.get(CourseConnection._URL, 
+                            CourseConnection._school_payload("2017-2018"), 
+                            headers={"If-None-Match": '"v1"'})
+        assert res.status_code == 304
+        assert dict(res.headers) == {"ETag": '"v1"'}
+
+        with pytest.raises(requests.HTTPError):
+            connection.get_schools("2018-2019")
+
+
+    def test_stand_in_server(self, tmp_path):
+        self.record(tmp_path)
+
+        with StandInServer(str(tmp_path), latency=0.05) as server:
+            connection = CourseConnection(base_url=server.url, 
+                                          cache=DiskCache(str(tmp_path / "c"), 
+                                                          ttl=lambda y: 0))
+
+            start = time.monotonic()
+            courses = connection.get_courses_by_department("CS", 
+                                                           year="2017-2018")
+            assert time.monotonic() - start >= 0.05
+            assert [c.subject for c in courses] == ["CS"] * 3
+
+            # The stale cache entry is revalidated and not modified.
+            again = connection.get_courses_by_department("CS", 
+                                                         year="2017-2018")
+            assert len(again) == 3
+            assert server.requests == 2
+
+
+    def test_error_injection(self, tmp_path):
+        self.record(tmp_path)
+
+        with StandInServer(str(tmp_path), error_rate=1.0) as server:
+            connection = CourseConnection(base_url=server.url, retries=2, 
+                                          backoff=0)
+
+            with pytest.raises(requests.HTTPError):
+                connection.get_schools("2017-2018")
+            assert server.requests == 3
+
+            server.error_rate = 0
+            assert len(connection.get_schools("2017-2018")) == 2
@@ -0,0 +1,117 @@
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from explorecourses import *
+from explorecourses.sync import MODIFIED, REMOVED
+from explorecourses.watch import EnrollmentWatcher
+
+from tests.fixtures import course_xml, search_xml, section_xml
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.sizes = {}
+        self.requests = []
+        self.error = None
+
+
+    def get_courses_by_department(self, code, *filters, year=None):
+        self.requests.append(code)
+        if self.error is not None:
+            raise self.error
+
+        sections = [section_xml(class_id, curr_size=size, max_size=50)
+                    for class_id, size in sorted(self.sizes.items())]
+        root = ET.fromstring(search_xml([course_xml(1, subject=code, 
+                                                    sections=sections)]))
+        return [Course(elem) for elem in root.iter("course")]
+
+
+class TestEnrollmentWatcher(object):
+
+    def setup_method(self):
+        self.now = 0.0
+        self.connection = FakeConnection()
+        self.connection.sizes = {11: 10, 12: 48}
+        self.changes = []
+        self.watcher = EnrollmentWatcher(
+            self.connection, 
+            lambda course, change: self.changes.append(change),
+            min_interval=30, interval=120, max_interval=1000, 
+            clock=lambda: self.now
+        )
+
+
+    def test_coalesces_requests(self):
+        self.watcher.watch("CS", [11, 12])
+        self.watcher.watch("MATH", [13])
+
+        assert self.watcher.poll() == ["CS", "MATH"]
+        assert self.connection.requests == ["CS", "MATH"]
+        # The first poll only records a baseline.
+        assert self.changes == []
+        assert sorted(self.watcher.class_ids) == [11, 12, 13]
+
+
+    def test_adaptive_intervals(self):
+        self.watcher.watch("CS", [11, 12])
+        self.watcher.poll()
+
+        # Section 12 is nearly full, so it is due first.
+        assert self.watcher.next_poll() == 30
+
+        self.now = 30
+        self.watcher.poll()
+        assert self.changes == []
+        assert self.watcher.next_poll() == 60
+
+        # Section 11 was refreshed by the same request, and backs off while 
+        # nothing changes.
+        self.watcher.unwatch([12])
+        assert self.watcher.next_poll() == 270
+        self.now = 270
+        self.watcher.poll()
+        assert self.watcher.next_poll() == 750
+        self.now = 750
+        self.watcher.poll()
+        assert self.watcher.next_poll() == 1710
+        self.now = 1710
+        self.watcher.poll()
+        assert self.watcher.next_poll() == 2710
+
+
+    def test_callbacks(self):
+        self.watcher.watch("CS", [11, 12])
+        self.watcher.poll()
+
+        self.connection.sizes = {11: 11}
+        self.now = 120
+        self.watcher.poll()
+
+        kinds = {change.class_id: change for change in self.changes}
+        assert kinds[11].kind == MODIFIED
+        assert kinds[11].fields == ("curr_class_size",)
+        assert kinds[11].old.curr_class_size == 10
+        assert kinds[11].new.curr_class_size == 11
+        assert kinds[12].kind == REMOVED
+        assert self.watcher.class_ids == [11]
+
+        # A change resets the backoff.
+        assert self.watcher.next_poll() == 240
+
+
+    def test_errors(self):
+        self.watcher.watch("CS", [11])
+        self.connection.error = ValueError("unavailable")
+
+        with pytest.raises(ValueError):
+            self.watcher.poll()
+        assert self.watcher.next_poll() == 30
+
+        errors = []
+        self.watcher._on_error = lambda subject, error: errors.append(subject)
+        self.now = 30
+        self.watcher.poll()
+        assert errors == ["CS"]
+        assert self.watcher.next_poll() == 90